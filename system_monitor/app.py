@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import sys
+import time
 
 try:
     import psutil
@@ -12,7 +13,7 @@ except ImportError:
     print("psutil is required. Install with: pip install psutil")
     raise
 
-from PySide6.QtCore import QTimer, QElapsedTimer
+from PySide6.QtCore import QTimer, QEvent
 from PySide6.QtGui import QKeySequence, QAction
 from PySide6.QtWidgets import QApplication, QMainWindow, QTabWidget, QTreeWidgetItem
 
@@ -21,9 +22,11 @@ from system_monitor.utils import apply_dark_theme
 from system_monitor.core.metrics_updater import MetricsUpdater
 from system_monitor.core.process_manager import ProcessManager
 from system_monitor.core.info_manager import InfoManager
+from system_monitor.core.gpu_sampler import GpuSampler
+from system_monitor.core.sensor_collector import SensorCollector
 from system_monitor.ui import (
     ToolbarBuilder, DashboardBuilder, ChartFactory,
-    CPUTabBuilder, BasicTabsBuilder, GPUTabBuilder, ProcessTabBuilder, EventHandlers
+    CPUTabBuilder, BasicTabsBuilder, GPUTabBuilder, ProcessTabBuilder, EventHandlers, TabIndex
 )
 
 
@@ -35,13 +38,17 @@ class SystemMonitor(QMainWindow):
         self.unit_combo_disk = None
         self.unit_combo_net = None
         self.interval_ms = interval_ms
-        self.gpu_provider = GPUProvider()
+        # GPU detection (NVML load, device enumeration) runs off the UI thread;
+        # the GPU tab is filled in by _check_gpu_ready() once it finishes
+        self.gpu_provider = GPUProvider(defer=True)
+        self.gpu_provider.detect_async()
         self._paused = False
         self.setWindowTitle(f"System Monitor ({self.interval_ms} ms)")
         self.resize(1200, 800)
         
         self._setup_ui()
         self._init_metrics_state()
+        self._setup_gpu_sampler()
         self._setup_timer()
         self._setup_shortcuts()
     
@@ -56,25 +63,34 @@ class SystemMonitor(QMainWindow):
         self.chart_mem = ChartFactory.create_memory_chart()
         self.chart_net = ChartFactory.create_network_chart()
         self.chart_disk = ChartFactory.create_disk_chart()
-        gpu_names = self.gpu_provider.gpu_names()
+        # Only build the GPU chart once detection has finished; until then
+        # _check_gpu_ready() swaps the placeholder in
+        gpu_names = self.gpu_provider.gpu_names() if self.gpu_provider.ready.is_set() else ()
         self.chart_gpu = ChartFactory.create_gpu_chart(gpu_names)
         
-        # Create tabs
+        # Create tabs (insertion order must match TabIndex)
         self.dashboard = DashboardBuilder.build_dashboard(self)
-        self.tabs.addTab(self.dashboard, "Dashboard")
-        self.tabs.addTab(CPUTabBuilder.build_cpu_tab(self), "CPU")
-        self.tabs.addTab(BasicTabsBuilder.build_memory_tab(self), "Memory")
-        self.tabs.addTab(BasicTabsBuilder.build_network_tab(self), "Network")
-        self.tabs.addTab(BasicTabsBuilder.build_disk_tab(self), "Disk")
+        self.tabs.insertTab(TabIndex.DASHBOARD, self.dashboard, "Dashboard")
+        self.tabs.insertTab(TabIndex.CPU, CPUTabBuilder.build_cpu_tab(self), "CPU")
+        self.tabs.insertTab(TabIndex.MEMORY, BasicTabsBuilder.build_memory_tab(self), "Memory")
+        self.tabs.insertTab(TabIndex.NETWORK, BasicTabsBuilder.build_network_tab(self), "Network")
+        self.tabs.insertTab(TabIndex.DISK, BasicTabsBuilder.build_disk_tab(self), "Disk")
         
-        gpu_tab = GPUTabBuilder.build_gpu_tab(self, gpu_names) if self.chart_gpu else GPUTabBuilder._build_no_gpu_tab()
+        if self.chart_gpu:
+            gpu_tab = GPUTabBuilder.build_gpu_tab(self, gpu_names)
+        elif self.gpu_provider.ready.is_set():
+            gpu_tab = GPUTabBuilder._build_no_gpu_tab()
+        else:
+            gpu_tab = GPUTabBuilder._build_no_gpu_tab("Detecting GPUs…")
         if not self.chart_gpu:
             GPUTabBuilder.setup_no_gpu_fallback(self)
-        self.tabs.addTab(gpu_tab, "GPU")
-        self.tabs.addTab(ProcessTabBuilder.build_process_tab(self), "Processes")
-        self.tabs.addTab(ProcessTabBuilder.build_info_tab(self), "System Info")
+        self.tabs.insertTab(TabIndex.GPU, gpu_tab, "GPU")
+        self.tabs.insertTab(TabIndex.PROCESSES, ProcessTabBuilder.build_process_tab(self), "Processes")
+        self.tabs.insertTab(TabIndex.INFO, ProcessTabBuilder.build_info_tab(self), "System Info")
         
-        self.refresh_info()
+        self.tabs.currentChanged.connect(lambda i: EventHandlers.on_tab_changed(self, i))
+        
+        # System info is built when its tab is first shown (on_tab_changed)
         self._wire_unit_selectors()
     
     def _wire_unit_selectors(self) -> None:
@@ -87,22 +103,63 @@ class SystemMonitor(QMainWindow):
     
     def _init_metrics_state(self) -> None:
         """Initialize metric collection state."""
-        self._last_net = psutil.net_io_counters()
-        self._last_disk = psutil.disk_io_counters()
-        self._elapsed = QElapsedTimer()
-        self._elapsed.start()
-        psutil.cpu_percent(interval=None)
+        self._last_net = psutil.net_io_counters(nowrap=False)
+        self._last_disk = psutil.disk_io_counters(nowrap=False)
+        # Tick timestamps in ns: QElapsedTimer.restart() only resolves whole
+        # milliseconds, a 10% error in dt (and in every rate) at 10 ms ticks
+        self._t_prev_ns = time.monotonic_ns()
+        # Prime the per-core counter MetricsUpdater derives CPU usage from
+        psutil.cpu_percent(interval=None, percpu=True)
         self._net_dyn_up = 1.0
         self._net_dyn_down = 1.0
         self._disk_dyn_read = 1.0
         self._disk_dyn_write = 1.0
-        self._gpu_refresh_accum = 0.0
+        # Start due so the first tick queues a clock-speed read
+        self._freq_accum_ms = MetricsUpdater.FREQ_REFRESH_MS
+        self.sensor_collector = SensorCollector()
+        self._gpu_snapshot = None
+        self._gpu_tip = None
+    
+    def _setup_gpu_sampler(self) -> None:
+        """Start background GPU polling at the GPU refresh interval."""
+        self.gpu_sampler = GpuSampler(self.gpu_provider, self.spin_gpu_refresh.value() / 1000.0)
+        self.spin_gpu_refresh.valueChanged.connect(lambda v: EventHandlers.on_gpu_refresh_changed(self, v))
+        self._gpu_pending = True
+        self._check_gpu_ready()
+    
+    def _check_gpu_ready(self) -> None:
+        """Finish GPU setup once background detection is done (polled by on_timer)."""
+        if not self.gpu_provider.ready.is_set():
+            return
+        self._gpu_pending = False
+        if self.chart_gpu is None:
+            # Replace the placeholder page (a no-op swap when no GPU was found)
+            GPUTabBuilder.rebuild_gpu_tab(self)
+            if self.gpu_provider.gpu_names():
+                # The GPU section changed: rebuild now if shown, else on next view
+                self._info_dirty = True
+                if self.tabs.currentIndex() == TabIndex.INFO:
+                    self.refresh_info()
+        DashboardBuilder.update_gpu_card(self)
+        if self.gpu_provider.gpu_names():
+            self.gpu_sampler.start()
     
     def _setup_timer(self) -> None:
-        """Setup main update timer and keyboard shortcuts."""
+        """Setup main metrics timer and the slower process table timer."""
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.on_timer)
         self.timer.start(self.interval_ms)
+        
+        self.proc_timer = QTimer(self)
+        self.proc_timer.timeout.connect(self.on_proc_timer)
+        self.proc_timer.start(self.spin_proc_refresh.value())
+        self.spin_proc_refresh.valueChanged.connect(lambda v: EventHandlers.on_proc_refresh_changed(self, v))
+        
+        # Filter edits refresh the process tree once typing pauses, not per keystroke
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(150)
+        self._search_debounce.timeout.connect(self.on_proc_timer)
     
     def _setup_shortcuts(self) -> None:
         """Setup keyboard shortcuts."""
@@ -129,16 +186,49 @@ class SystemMonitor(QMainWindow):
     
     def on_timer(self) -> None:
         """Main timer callback."""
-        if self._paused:
-            self._elapsed.restart()
+        # Nothing on screen to update while paused, minimized or hidden; move
+        # the reference forward so the next tick doesn't see one huge dt
+        now_ns = time.monotonic_ns()
+        if self._paused or self.isMinimized() or not self.isVisible():
+            self._t_prev_ns = now_ns
             return
-        dt_ms = max(1, self._elapsed.restart())
-        dt = dt_ms / 1000.0
+        if self._gpu_pending:
+            self._check_gpu_ready()
+        dt = max(now_ns - self._t_prev_ns, 1_000_000) * 1e-9  # at least 1 ms
+        self._t_prev_ns = now_ns
         MetricsUpdater.update_all_metrics(self, dt)
     
+    def changeEvent(self, event) -> None:
+        """Stop the update timer while minimized so there are no idle wakeups."""
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.timer.stop()
+                self.proc_timer.stop()
+                # Resumed by the first _update_gpu after restore
+                self.gpu_sampler.set_fields(0)
+            elif not self.timer.isActive():
+                self._t_prev_ns = time.monotonic_ns()
+                self.timer.start(self.interval_ms)
+                self.proc_timer.start(self.spin_proc_refresh.value())
+        super().changeEvent(event)
+    
+    def on_proc_timer(self) -> None:
+        """Process table timer callback."""
+        if self._paused or self.isMinimized() or not self.isVisible():
+            return
+        # Only the Processes tab and the CPU tab's summary line show the scan
+        if self.tabs.currentIndex() not in (TabIndex.CPU, TabIndex.PROCESSES):
+            # CPU baselines go stale while hidden; re-prime on the way back
+            self._procs_primed = False
+            return
+        self.refresh_processes()
+    
     def closeEvent(self, event) -> None:
         """Handle application close event - cleanup background threads."""
         ProcessManager.shutdown_collector()
+        self.gpu_sampler.shutdown()
+        self.sensor_collector.shutdown()
+        self.gpu_provider.shutdown()
         super().closeEvent(event)
 
 
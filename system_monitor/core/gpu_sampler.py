@@ -0,0 +1,80 @@
+"""Background GPU sampler publishing cached snapshots."""
+
+#      Copyright (c) 2025 predator. All rights reserved.
+
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+from system_monitor.providers.gpu_provider import GpuSnapshot, F_ALL
+
+
+class GpuSampler:
+    """Polls the GPU provider on a worker thread at the GPU refresh interval.
+
+    NVML calls and nvidia-smi invocations can block for several milliseconds,
+    so they never run on the Qt thread. The UI timer reads the most recent
+    snapshot with latest(), which only swaps a reference under a lock.
+    """
+
+    def __init__(self, gpu_provider, interval_s: float = 0.1) -> None:
+        """Initialize GPU sampler.
+
+        Args:
+            gpu_provider: GPUProvider to query
+            interval_s: Seconds between samples
+        """
+        self._provider = gpu_provider
+        self._interval = max(0.01, float(interval_s))
+        self._fields = F_ALL
+        self._lock = threading.Lock()
+        self._snapshot: Optional[GpuSnapshot] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the polling thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="GpuSampler", daemon=True)
+        self._thread.start()
+
+    def set_interval(self, interval_s: float) -> None:
+        """Change the polling interval; takes effect after the current wait."""
+        self._interval = max(0.01, float(interval_s))
+
+    def set_fields(self, fields: int) -> None:
+        """Select which GPU fields (F_* bitmask) the next samples query (0 pauses)."""
+        self._fields = fields
+
+    def sample(self) -> GpuSnapshot:
+        """Query the selected GPU fields once (runs on the worker thread)."""
+        return self._provider.sample_all(self._fields)
+
+    def latest(self) -> Optional[GpuSnapshot]:
+        """Most recent snapshot, or None before the first sample (thread-safe)."""
+        with self._lock:
+            return self._snapshot
+
+    def shutdown(self) -> None:
+        """Stop the polling thread and wait briefly for it to exit."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            # No fields selected means nothing on screen shows GPU data; idle
+            if self._fields:
+                try:
+                    snap = self.sample()
+                except Exception:
+                    # swallow exceptions; next iteration will retry
+                    snap = GpuSnapshot()
+                with self._lock:
+                    self._snapshot = snap
+            self._stop.wait(self._interval)
@@ -4,14 +4,14 @@
 
 import sys
 import platform
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Tuple
 
 try:
     import psutil
 except ImportError:
     psutil = None
 
-from system_monitor.utils import get_cpu_model_name
+from system_monitor.utils import get_cpu_model_name, cached_static_property
 
 if TYPE_CHECKING:
     from system_monitor.app import SystemMonitor
@@ -21,20 +21,39 @@ class InfoManager:
     """Handles system information gathering and display."""
 
     @staticmethod
-    def refresh_info(monitor: 'SystemMonitor') -> None:
-        """Gather and display comprehensive system information."""
-        lines = []
-        
-        # CPU Information
-        lines.append("=== CPU Information ===")
-        lines.append(f"Processor: {get_cpu_model_name()}")
-        lines.append(f"Machine: {platform.machine()}")
+    @cached_static_property('static_system_info')
+    def _static_info() -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """CPU and OS lines that cannot change while the app runs.
+
+        platform.architecture() shells out to ``file`` on Linux, so these are
+        computed once instead of on every refresh_info().
+        """
+        cpu = [
+            "=== CPU Information ===",
+            f"Processor: {get_cpu_model_name()}",
+            f"Machine: {platform.machine()}",
+        ]
         try:
-            lines.append(f"Architecture: {platform.architecture()}")
+            cpu.append(f"Architecture: {platform.architecture()}")
         except Exception:
             pass
-        lines.append(f"CPU Count (logical): {psutil.cpu_count(logical=True)}")
-        lines.append(f"CPU Count (physical): {psutil.cpu_count(logical=False)}")
+        cpu.append(f"CPU Count (logical): {psutil.cpu_count(logical=True)}")
+        cpu.append(f"CPU Count (physical): {psutil.cpu_count(logical=False)}")
+        system = (
+            "\n=== System Information ===",
+            f"System: {platform.system()}",
+            f"Node Name: {platform.node()}",
+            f"Release: {platform.release()}",
+            f"Version: {platform.version()}",
+            f"Platform: {platform.platform()}",
+        )
+        return tuple(cpu), system
+
+    @staticmethod
+    def refresh_info(monitor: 'SystemMonitor') -> None:
+        """Gather and display comprehensive system information."""
+        cpu_lines, system_lines = InfoManager._static_info()
+        lines = list(cpu_lines)
         try:
             freq = psutil.cpu_freq()
             if freq:
@@ -45,13 +64,7 @@ class InfoManager:
         except Exception:
             pass
 
-        # System Information
-        lines.append("\n=== System Information ===")
-        lines.append(f"System: {platform.system()}")
-        lines.append(f"Node Name: {platform.node()}")
-        lines.append(f"Release: {platform.release()}")
-        lines.append(f"Version: {platform.version()}")
-        lines.append(f"Platform: {platform.platform()}")
+        lines.extend(system_lines)
 
         # Memory Information
         lines.append("\n=== Memory Information ===")
@@ -90,3 +103,4 @@ class InfoManager:
         lines.append(f"Python Executable: {sys.executable}")
 
         monitor.info_edit.setPlainText("\n".join(lines))
+        monitor._info_dirty = False
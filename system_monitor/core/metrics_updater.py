@@ -2,23 +2,48 @@
 
 #      Copyright (c) 2025 predator. All rights reserved.
 
+import logging
 import math
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, Optional, Set, Tuple
 
 try:
     import psutil
 except ImportError:
     psutil = None
 
-from system_monitor.utils import get_per_core_frequencies, get_gpu_temperatures
+from system_monitor.ui.tab_index import TabIndex
+from system_monitor.providers.gpu_provider import F_UTIL, F_FREQ, F_VRAM, F_TEMP, F_ALL
 
 if TYPE_CHECKING:
     from system_monitor.app import SystemMonitor
 
+_log = logging.getLogger(__name__)
+
+# "2400 MHz"-style label texts by whole MHz. Clocks step through a few
+# dozen P-state values, so this stays small and formatting happens once each
+_MHZ_TEXT: Dict[int, str] = {}
+
+
+def _fmt_mhz(freq: float) -> str:
+    """Format a clock speed in MHz using the string cache."""
+    key = round(freq)
+    text = _MHZ_TEXT.get(key)
+    if text is None:
+        text = _MHZ_TEXT[key] = f"{key} MHz"
+    return text
+
 
 class MetricsUpdater:
     """Handles periodic updates of system metrics."""
 
+    # Time constant (seconds) for the decaying network/disk reference maxes
+    DYN_MAX_TAU_S = 10.0
+    # Clock speeds change slowly; re-read them at most this often (ms)
+    FREQ_REFRESH_MS = 1000.0
+    # Metric streams whose failure has been logged; later failures of the
+    # same stream stay quiet so a persistent error does not flood the log
+    _failed_streams: Set[str] = set()
+
     @staticmethod
     def update_all_metrics(monitor: 'SystemMonitor', dt: float) -> None:
         """
@@ -28,205 +53,296 @@ class MetricsUpdater:
             monitor: SystemMonitor instance with UI components
             dt: Time delta in seconds since last update
         """
-        MetricsUpdater._update_cpu(monitor, dt)
-        MetricsUpdater._update_memory(monitor)
-        MetricsUpdater._update_network(monitor, dt)
-        MetricsUpdater._update_disk(monitor, dt)
-        MetricsUpdater._update_gpu(monitor, dt)
-        MetricsUpdater._update_processes(monitor, dt)
+        # Read the visible tab once; only widgets on that tab get repainted
+        tab = monitor.tabs.currentIndex()
+        # One decay factor per tick, shared by the network and disk maxes
+        alpha = math.exp(-dt / MetricsUpdater.DYN_MAX_TAU_S)
+        # Likewise one bytes -> display-units/s factor for both byte streams
+        scale = MetricsUpdater._rate_scale(dt, monitor._bytes_per_unit)
+        for name, update, args in (
+            ("cpu", MetricsUpdater._update_cpu, (monitor, dt, tab)),
+            ("memory", MetricsUpdater._update_memory, (monitor, tab)),
+            ("network", MetricsUpdater._update_network, (monitor, dt, tab, alpha, scale)),
+            ("disk", MetricsUpdater._update_disk, (monitor, dt, tab, alpha, scale)),
+            ("gpu", MetricsUpdater._update_gpu, (monitor, dt, tab)),
+        ):
+            try:
+                update(*args)
+            except Exception:
+                # Each metric stream is independent; one failing source must
+                # not freeze the others (it is retried on the next tick)
+                if name not in MetricsUpdater._failed_streams:
+                    MetricsUpdater._failed_streams.add(name)
+                    _log.exception("Updating %s metrics failed; retrying on later ticks", name)
 
     @staticmethod
-    def _update_cpu(monitor: 'SystemMonitor', dt: float) -> None:
+    def _update_cpu(monitor: 'SystemMonitor', dt: float, tab: Optional[int] = None) -> None:
         """Update CPU metrics."""
-        cpu = float(psutil.cpu_percent(interval=None))
-        monitor.card_cpu.update_percent(cpu)
+        if tab is None:
+            tab = monitor.tabs.currentIndex()
+        if tab not in (TabIndex.DASHBOARD, TabIndex.CPU):
+            return
+        
+        # Clock speeds are read off the UI thread by the sensor collector:
+        # pick up a finished reading, and re-queue one every FREQ_REFRESH_MS
+        readings = monitor.sensor_collector.get_result()
+        monitor._freq_accum_ms += dt * 1000.0
+        if monitor._freq_accum_ms >= MetricsUpdater.FREQ_REFRESH_MS:
+            monitor._freq_accum_ms = 0.0
+            monitor.sensor_collector.collect_async(per_core=tab == TabIndex.CPU)
         
-        # Update CPU frequency
+        # One per-core /proc/stat read serves both views; the total is its
+        # mean, so the dashboard and CPU tab share a single psutil baseline
         try:
-            cpu_freq = psutil.cpu_freq()
-            if cpu_freq and cpu_freq.current:
-                monitor.card_cpu.set_frequency(cpu_freq.current)
+            cores = psutil.cpu_percent(interval=None, percpu=True)
         except Exception:
-            pass
+            cores = None
+        if isinstance(cores, list) and cores:
+            cpu = sum(cores) / len(cores)
+        else:
+            cores = None
+            cpu = float(psutil.cpu_percent(interval=None))
+        
+        # Dashboard card (and its sparkline) only when visible
+        if tab == TabIndex.DASHBOARD:
+            monitor.card_cpu.update_percent(cpu)
+            
+            # Update CPU frequency
+            if readings is not None and readings.cpu_freq:
+                monitor.card_cpu.set_frequency(readings.cpu_freq)
         
         # Update chart if on CPU tab
-        if monitor.tabs.currentIndex() == 1:
+        else:
             monitor.chart_cpu.append([cpu])
             
             # Per-core CPU update
-            try:
-                cores = psutil.cpu_percent(interval=None, percpu=True)
-                if isinstance(cores, list) and cores and hasattr(monitor, "core_charts"):
-                    for i, val in enumerate(cores[: len(monitor.core_charts)]):
-                        monitor.core_charts[i].append([float(val)])
-            except Exception:
-                pass
+            if cores is not None and hasattr(monitor, "core_charts"):
+                # zip stops at the shorter list; append() converts to float
+                for chart, val in zip(monitor.core_charts, cores):
+                    chart.append([val])
             
             # Update per-core frequency labels
-            if hasattr(monitor, "core_freq_labels") and monitor.core_freq_labels:
-                try:
-                    core_freqs = get_per_core_frequencies()
-                    if core_freqs:
-                        for i, freq in enumerate(core_freqs[: len(monitor.core_freq_labels)]):
-                            monitor.core_freq_labels[i].setText(f"{freq:.0f} MHz")
-                except Exception:
-                    pass
+            if readings is not None and readings.core_freqs and hasattr(monitor, "core_freq_labels"):
+                for label, freq in zip(monitor.core_freq_labels, readings.core_freqs):
+                    label.setText(_fmt_mhz(freq))
 
     @staticmethod
-    def _update_memory(monitor: 'SystemMonitor') -> None:
+    def _update_memory(monitor: 'SystemMonitor', tab: Optional[int] = None) -> None:
         """Update memory metrics."""
+        if tab is None:
+            tab = monitor.tabs.currentIndex()
+        if tab not in (TabIndex.DASHBOARD, TabIndex.MEMORY):
+            # Neither the card nor the chart is on screen; skip the read
+            return
         mem = psutil.virtual_memory()
         mem_pct = float(mem.percent)
-        monitor.card_mem.update_percent(mem_pct)
         
-        if monitor.tabs.currentIndex() == 2:
+        if tab == TabIndex.DASHBOARD:
+            monitor.card_mem.update_percent(mem_pct)
+        elif tab == TabIndex.MEMORY:
             monitor.chart_mem.append([mem_pct])
 
     @staticmethod
-    def _update_network(monitor: 'SystemMonitor', dt: float) -> None:
+    def _rate_scale(dt: float, bytes_per_unit: float) -> float:
+        """Factor turning a byte delta over dt seconds into display units/s."""
+        return 1.0 / (dt * bytes_per_unit)
+
+    @staticmethod
+    def _byte_rates(cur_a: int, prev_a: int, cur_b: int, prev_b: int,
+                    scale: float) -> Tuple[float, float]:
+        """Convert two byte-counter pairs into per-second rates in display units.
+        
+        Deltas stay exact ints and are clamped at zero in integer space
+        (counters can reset when an interface or disk goes away); the only
+        float step is the final multiply by the per-tick ``scale`` from
+        _rate_scale(), which update_all_metrics computes once for both
+        network and disk.
+        """
+        # Inline compares: builtin max() costs a generic call per use
+        d_a = cur_a - prev_a
+        d_b = cur_b - prev_b
+        return (d_a if d_a > 0 else 0) * scale, (d_b if d_b > 0 else 0) * scale
+
+    @staticmethod
+    def _update_network(monitor: 'SystemMonitor', dt: float, tab: Optional[int] = None,
+                        alpha: Optional[float] = None, scale: Optional[float] = None) -> None:
         """Update network metrics."""
-        net = psutil.net_io_counters()
-        up_mbs = max(0.0, (net.bytes_sent - monitor._last_net.bytes_sent) / dt) / monitor._bytes_per_unit
-        down_mbs = max(0.0, (net.bytes_recv - monitor._last_net.bytes_recv) / dt) / monitor._bytes_per_unit
+        if tab is None:
+            tab = monitor.tabs.currentIndex()
+        if tab not in (TabIndex.DASHBOARD, TabIndex.NETWORK):
+            # Nothing shows network rates; drop the baseline so the next
+            # visible tick re-primes instead of averaging over the gap
+            monitor._last_net = None
+            return
+        # nowrap=False skips psutil's wrap-tracking cache; _byte_rates already
+        # clamps the negative delta a counter wrap/reset would produce
+        net = psutil.net_io_counters(nowrap=False)
+        last = monitor._last_net
         monitor._last_net = net
+        if last is None:
+            return
+        if scale is None:
+            scale = MetricsUpdater._rate_scale(dt, monitor._bytes_per_unit)
+        up_mbs, down_mbs = MetricsUpdater._byte_rates(
+            net.bytes_sent, last.bytes_sent, net.bytes_recv, last.bytes_recv, scale
+        )
         
         # Update dynamic reference maxes using time-constant decay
-        tau = 10.0
-        alpha = math.exp(-dt / tau)
-        monitor._net_dyn_up = max(up_mbs, monitor._net_dyn_up * alpha)
-        monitor._net_dyn_down = max(down_mbs, monitor._net_dyn_down * alpha)
+        if alpha is None:
+            alpha = math.exp(-dt / MetricsUpdater.DYN_MAX_TAU_S)
+        decayed = monitor._net_dyn_up * alpha
+        monitor._net_dyn_up = up_mbs if up_mbs > decayed else decayed
+        decayed = monitor._net_dyn_down * alpha
+        monitor._net_dyn_down = down_mbs if down_mbs > decayed else decayed
         
-        monitor.card_net_up.update_value(up_mbs, ref_max=monitor._net_dyn_up)
-        monitor.card_net_down.update_value(down_mbs, ref_max=monitor._net_dyn_down)
-        
-        if monitor.tabs.currentIndex() == 3:
+        if tab == TabIndex.DASHBOARD:
+            monitor.card_net_up.update_value(up_mbs, ref_max=monitor._net_dyn_up)
+            monitor.card_net_down.update_value(down_mbs, ref_max=monitor._net_dyn_down)
+        elif tab == TabIndex.NETWORK:
             monitor.chart_net.append([up_mbs, down_mbs])
 
     @staticmethod
-    def _update_disk(monitor: 'SystemMonitor', dt: float) -> None:
+    def _update_disk(monitor: 'SystemMonitor', dt: float, tab: Optional[int] = None,
+                       alpha: Optional[float] = None, scale: Optional[float] = None) -> None:
         """Update disk I/O metrics."""
+        if tab is None:
+            tab = monitor.tabs.currentIndex()
+        if tab not in (TabIndex.DASHBOARD, TabIndex.DISK):
+            # Skip the block-device scan; re-prime when a disk view is shown
+            monitor._last_disk = None
+            return
         try:
-            dio = psutil.disk_io_counters()
+            dio = psutil.disk_io_counters(nowrap=False)
         except Exception:
             dio = None
         
-        if dio and getattr(monitor, "_last_disk", None):
-            read_mbs = max(0.0, (dio.read_bytes - monitor._last_disk.read_bytes) / dt) / monitor._bytes_per_unit
-            write_mbs = max(0.0, (dio.write_bytes - monitor._last_disk.write_bytes) / dt) / monitor._bytes_per_unit
+        last = getattr(monitor, "_last_disk", None)
+        if dio and last is None:
+            monitor._last_disk = dio
+            return
+        if dio and last:
+            if scale is None:
+                scale = MetricsUpdater._rate_scale(dt, monitor._bytes_per_unit)
+            read_mbs, write_mbs = MetricsUpdater._byte_rates(
+                dio.read_bytes, last.read_bytes, dio.write_bytes, last.write_bytes, scale
+            )
         else:
             read_mbs = 0.0
             write_mbs = 0.0
         monitor._last_disk = dio
         
         # Update dynamic reference maxes
-        tau = 10.0
-        alpha = math.exp(-dt / tau)
-        monitor._disk_dyn_read = max(read_mbs, monitor._disk_dyn_read * alpha)
-        monitor._disk_dyn_write = max(write_mbs, monitor._disk_dyn_write * alpha)
-        
-        monitor.card_disk_read.update_value(read_mbs, ref_max=monitor._disk_dyn_read)
-        monitor.card_disk_write.update_value(write_mbs, ref_max=monitor._disk_dyn_write)
+        if alpha is None:
+            alpha = math.exp(-dt / MetricsUpdater.DYN_MAX_TAU_S)
+        decayed = monitor._disk_dyn_read * alpha
+        monitor._disk_dyn_read = read_mbs if read_mbs > decayed else decayed
+        decayed = monitor._disk_dyn_write * alpha
+        monitor._disk_dyn_write = write_mbs if write_mbs > decayed else decayed
         
-        if monitor.tabs.currentIndex() == 4:
+        if tab == TabIndex.DASHBOARD:
+            monitor.card_disk_read.update_value(read_mbs, ref_max=monitor._disk_dyn_read)
+            monitor.card_disk_write.update_value(write_mbs, ref_max=monitor._disk_dyn_write)
+        elif tab == TabIndex.DISK:
             monitor.chart_disk.append([read_mbs, write_mbs])
 
     @staticmethod
-    def _update_gpu(monitor: 'SystemMonitor', dt: float) -> None:
-        """Update GPU metrics with configurable refresh rate."""
-        try:
-            monitor._gpu_refresh_accum += dt
-        except Exception:
-            monitor._gpu_refresh_accum = 0.0
+    def _update_gpu(monitor: 'SystemMonitor', dt: float, tab: Optional[int] = None) -> None:
+        """Update GPU widgets from the sampler's latest snapshot.
         
-        gpu_refresh_interval = monitor.spin_gpu_refresh.value() / 1000.0
-        if monitor._gpu_refresh_accum >= gpu_refresh_interval:
-            monitor._gpu_refresh_accum = 0.0
-            
-            utils = monitor.gpu_provider.gpu_utils()
-            if utils:
+        Sampling runs on the GpuSampler thread at the GPU refresh interval;
+        widgets are only touched when a new snapshot has been published.
+        """
+        if tab is None:
+            tab = monitor.tabs.currentIndex()
+        
+        # Only query what the visible tab shows; other tabs pause the sampler
+        if tab == TabIndex.GPU:
+            monitor.gpu_sampler.set_fields(F_ALL)
+        elif tab == TabIndex.DASHBOARD:
+            monitor.gpu_sampler.set_fields(F_UTIL | F_FREQ)
+        else:
+            monitor.gpu_sampler.set_fields(0)
+            return
+        
+        snap = monitor.gpu_sampler.latest()
+        if snap is None or snap is monitor._gpu_snapshot:
+            return
+        monitor._gpu_snapshot = snap
+        
+        utils = snap.utils
+        if utils:
+            freqs = snap.freqs
+            if tab == TabIndex.DASHBOARD:
                 avg = sum(utils) / len(utils)
                 monitor.card_gpu.update_percent(avg)
                 
                 # Update GPU frequency
-                freqs = monitor.gpu_provider.gpu_frequencies()
                 if freqs and freqs[0] > 0:
                     monitor.card_gpu.set_frequency(freqs[0])
+            
+            vram_info = snap.vram
+            
+            # Update GPU charts if on GPU tab
+            if monitor.chart_gpu is not None and tab == TabIndex.GPU:
+                monitor.chart_gpu.append(utils)
                 
-                # Get VRAM info
-                vram_info = monitor.gpu_provider.gpu_vram_info()
-                
-                # Update GPU charts if on GPU tab
-                if monitor.chart_gpu is not None and monitor.tabs.currentIndex() == 5:
-                    monitor.chart_gpu.append(utils)
-                    
-                    # Update VRAM chart
-                    if hasattr(monitor, "chart_gpu_vram") and monitor.chart_gpu_vram is not None:
-                        vram_values = [used_mb for used_mb, _ in vram_info] if vram_info else []
-                        if vram_values:
-                            monitor.chart_gpu_vram.append(vram_values)
-                    
-                    # Update temperature chart
-                    if hasattr(monitor, "chart_gpu_temp") and monitor.chart_gpu_temp is not None:
-                        try:
-                            gpu_temps = get_gpu_temperatures(monitor.gpu_provider)
-                            if gpu_temps and any(t > 0 for t in gpu_temps):
-                                monitor.chart_gpu_temp.append(gpu_temps)
-                        except Exception:
-                            pass
+                # Update VRAM chart
+                if (snap.fields & F_VRAM and hasattr(monitor, "chart_gpu_vram")
+                        and monitor.chart_gpu_vram is not None):
+                    vram_values = [used_mb for used_mb, _ in vram_info] if vram_info else []
+                    if vram_values:
+                        monitor.chart_gpu_vram.append(vram_values)
                 
-                # Update tooltips with per-GPU details
-                MetricsUpdater._update_gpu_tooltips(monitor, utils, vram_info, freqs)
-            else:
-                monitor.card_gpu.set_unavailable("N/A")
-                if monitor.lbl_gpu_info is not None:
-                    monitor.lbl_gpu_info.setText("No GPU data available")
+                # Update temperature chart
+                if (snap.fields & F_TEMP and hasattr(monitor, "chart_gpu_temp")
+                        and monitor.chart_gpu_temp is not None):
+                    gpu_temps = snap.temps
+                    if gpu_temps and any(t > 0 for t in gpu_temps):
+                        monitor.chart_gpu_temp.append(gpu_temps)
+            
+            # Update tooltips with per-GPU details
+            MetricsUpdater._update_gpu_tooltips(monitor, utils, vram_info, freqs, snap.temps)
+        else:
+            monitor.card_gpu.set_unavailable("N/A")
+            monitor._gpu_tip = None
+            if monitor.lbl_gpu_info is not None:
+                monitor.lbl_gpu_info.setText("No GPU data available")
 
     @staticmethod
-    def _update_gpu_tooltips(monitor: 'SystemMonitor', utils, vram_info, freqs) -> None:
+    def _update_gpu_tooltips(monitor: 'SystemMonitor', utils, vram_info, freqs, gpu_temps) -> None:
         """Update GPU tooltips with detailed information."""
         names = monitor.gpu_provider.gpu_names()
         tip_parts = []
         info_parts = []
-        gpu_temps = get_gpu_temperatures(monitor.gpu_provider)
         
         for i, u in enumerate(utils):
             name = names[i] if i < len(names) else f"GPU {i}"
-            detail = f"{name}: {u:.0f}%"
-            info_detail = f"GPU {i} ({name}): Utilization {u:.0f}%"
-            
-            # Add VRAM info
+            vram = ""
             if i < len(vram_info):
                 used_mb, total_mb = vram_info[i]
                 if total_mb > 0:
-                    detail += f" | VRAM: {used_mb:.0f}/{total_mb:.0f} MB ({used_mb/total_mb*100:.1f}%)"
-                    info_detail += f", VRAM: {used_mb:.0f}/{total_mb:.0f} MB ({used_mb/total_mb*100:.1f}%)"
-            
-            # Add frequency
-            if i < len(freqs) and freqs[i] > 0:
-                detail += f" | {freqs[i]:.0f} MHz"
-                info_detail += f", Clock: {freqs[i]:.0f} MHz"
-            
-            # Add temperature
-            if i < len(gpu_temps) and gpu_temps[i] > 0:
-                detail += f" | {gpu_temps[i]:.0f}°C"
-                info_detail += f", Temp: {gpu_temps[i]:.0f}°C"
+                    vram = f"{used_mb:.0f}/{total_mb:.0f} MB ({used_mb / total_mb * 100:.1f}%)"
+            freq = freqs[i] if i < len(freqs) else 0.0
+            temp = gpu_temps[i] if i < len(gpu_temps) else 0.0
             
-            tip_parts.append(detail)
-            info_parts.append(info_detail)
+            tip_parts.append(
+                f"{name}: {u:.0f}%"
+                + (f" | VRAM: {vram}" if vram else "")
+                + (f" | {freq:.0f} MHz" if freq > 0 else "")
+                + (f" | {temp:.0f}°C" if temp > 0 else "")
+            )
+            info_parts.append(
+                f"GPU {i} ({name}): Utilization {u:.0f}%"
+                + (f", VRAM: {vram}" if vram else "")
+                + (f", Clock: {freq:.0f} MHz" if freq > 0 else "")
+                + (f", Temp: {temp:.0f}°C" if temp > 0 else "")
+            )
         
-        monitor.card_gpu.set_tooltip("\n".join(tip_parts))
+        # Tooltip/label changes trigger Qt relayout; skip when nothing changed
+        tip = "\n".join(tip_parts)
+        if tip == getattr(monitor, "_gpu_tip", None):
+            return
+        monitor._gpu_tip = tip
+        monitor.card_gpu.set_tooltip(tip)
         if monitor.lbl_gpu_info is not None:
             monitor.lbl_gpu_info.setText("\n".join(info_parts))
-
-    @staticmethod
-    def _update_processes(monitor: 'SystemMonitor', dt: float) -> None:
-        """Update process table with configurable refresh rate."""
-        try:
-            monitor._proc_refresh_accum += dt
-        except Exception:
-            monitor._proc_refresh_accum = 0.0
-        
-        proc_refresh_interval = monitor.spin_proc_refresh.value() / 1000.0
-        if monitor._proc_refresh_accum >= proc_refresh_interval:
-            monitor._proc_refresh_accum = 0.0
-            monitor.refresh_processes()
@@ -4,22 +4,118 @@
 
 from __future__ import annotations
 
+import os
+import re
+import sys
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, Future
-from queue import Queue
-from typing import Dict, List, Tuple, Optional, Any
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 try:
     import psutil
 except ImportError:
     psutil = None
 
+# Fields fetched per process by process_iter(). as_dict() reads them all under
+# one oneshot(), so cpu_percent and cpu_num share a single /proc/<pid>/stat
+# read; one shared tuple instead of a list literal per collection. The name is
+# not re-read every scan (see ProcessCollector._names).
+# cpu_num only exists on Linux/FreeBSD/SunOS.
+_PROC_ATTRS = ('pid', 'memory_percent', 'num_threads', 'cpu_percent') + (
+    ('cpu_num',) if psutil is not None and hasattr(psutil.Process, 'cpu_num') else ()
+)
+# as_dict() always has every requested key (None where access was denied), so
+# the common fields come out in one C call; cpu_num may be absent
+_INFO_FIELDS = itemgetter('pid', 'num_threads', 'memory_percent', 'cpu_percent')
+
+# Linux fast path: one read of /proc/<pid>/stat per process instead of
+# psutil's Process machinery (several /proc files and Python objects per PID)
+try:
+    _CLK_TCK = os.sysconf("SC_CLK_TCK")
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    _CLK_TCK = 0
+    _PAGE_SIZE = 0
+_USE_PROC_STAT = sys.platform.startswith("linux") and _CLK_TCK > 0 and os.path.isdir("/proc")
+
+
+# The kernel truncates comm to this many characters (TASK_COMM_LEN - 1)
+_COMM_LEN = 15
+
+
+def _parse_proc_stat(data: bytes) -> Tuple[str, int, int, int, int, int]:
+    """Parse a /proc/<pid>/stat line.
+    
+    Returns:
+        (comm, utime + stime ticks, num_threads, rss pages, last CPU, start time)
+    """
+    # comm (field 2) is parenthesised and may itself contain spaces or ')'
+    lpar = data.index(b"(")
+    rpar = data.rindex(b")")
+    comm = data[lpar + 1:rpar].decode("utf-8", "replace")
+    # rest[0] is field 3 (state), so field n is rest[n - 3]
+    rest = data[rpar + 2:].split()
+    ticks = int(rest[11]) + int(rest[12])  # utime (14) + stime (15)
+    # num_threads (20), rss (24), processor (39), starttime (22)
+    return comm, ticks, int(rest[17]), int(rest[21]), int(rest[36]), int(rest[19])
+
+
+def _full_name(pid: str, comm: str) -> str:
+    """Recover a process name the kernel truncated in comm from its cmdline.
+    
+    Same rule as psutil: use the basename of argv[0] when it extends comm.
+    """
+    if len(comm) < _COMM_LEN:
+        return comm
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            argv0 = f.read().split(b"\0", 1)[0]
+    except OSError:
+        return comm
+    name = os.path.basename(argv0).decode("utf-8", "replace")
+    return name if name.startswith(comm) else comm
+
+
+# A filter containing any of these is treated as a regular expression; "."
+# is left out so dotted names such as "python3.11" stay plain substrings
+_REGEX_CHARS = frozenset("*+?[](){}|^$\\")
+
+
+def _name_matcher(proc_filter: str) -> Callable[[str], Any]:
+    """Build the test for lowercased names once per collection.
+    
+    A filter with regex metacharacters is compiled as typed (case matters
+    for escapes such as \\D) with re.IGNORECASE and searched; anything else,
+    or a pattern that does not compile (e.g. "c++"), is a case-insensitive
+    substring.
+    """
+    if not _REGEX_CHARS.isdisjoint(proc_filter):
+        try:
+            return re.compile(proc_filter, re.IGNORECASE).search
+        except re.error:
+            pass
+    needle = proc_filter.lower()
+    return lambda name: needle in name
+
+
+def _empty_result(n_cores: int) -> Dict[str, Any]:
+    """Collection result with no processes (error or cancelled scan)."""
+    return {
+        'core_processes': [[] for _ in range(n_cores)],
+        'all_cores_processes': [],
+        'total_threads': 0,
+        'proc_count': 0,
+    }
+
 
 class ProcessCollector:
     """Collects process data in background thread to avoid blocking UI.
     
-    Uses ThreadPoolExecutor for background collection and Queue for thread-safe
-    communication with the main Qt thread. Implements producer-consumer pattern.
+    Uses ThreadPoolExecutor for background collection and hands the latest
+    result to the main Qt thread through a lock-guarded slot. Implements
+    producer-consumer pattern.
     """
     
     def __init__(self, max_workers: int = 1) -> None:
@@ -29,20 +125,73 @@ class ProcessCollector:
             max_workers: Number of worker threads (default 1 is sufficient)
         """
         self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ProcessCollector")
-        self._result_queue: Queue = Queue(maxsize=1)  # Only keep latest result
+        # Only the latest result is kept; a newer one replaces it unread
+        self._latest_result: Optional[Dict[str, Any]] = None
+        self._result_lock = threading.Lock()
         self._collecting = False
+        # collect_async() calls dropped because the current scan was still running
+        self._coalesced = 0
         self._lock = threading.Lock()
         self._shutdown = False
+        # /proc fast path: CPU ticks per PID and the time of the previous scan
+        self._prev_ticks: Dict[int, int] = {}
+        self._prev_scan_ns: Optional[int] = None
+        # pid -> (start time, name, lowercased name for the filter); names
+        # never change during a process's lifetime, and the start time tells a
+        # reused PID apart
+        self._names: Dict[int, Tuple[Any, str, str]] = {}
+    
+    def prime(self) -> bool:
+        """Establish per-process CPU baselines so the first result has real values.
+        
+        Runs on the worker thread like a collection but publishes nothing, so
+        the UI never stalls on the first pass. With the /proc reader this is
+        a scan that only records CPU ticks (discarding any old baseline); the
+        psutil path calls cpu_percent() once on each Process process_iter()
+        will hand back on the next scan.
+        
+        Returns:
+            True if the priming scan was submitted, False if a scan was
+            already running (or the collector is shut down)
+        """
+        with self._lock:
+            if self._collecting or self._shutdown:
+                return False
+            self._collecting = True
+            # Old baselines would average CPU over the whole gap since the
+            # last scan; the next scan only records fresh ones
+            self._prev_scan_ns = None
+        self.get_result()  # drop a result from before the gap
+        
+        future: Future = self._executor.submit(self._prime_baselines)
+        future.add_done_callback(self._on_collection_complete)
+        return True
+    
+    def _prime_baselines(self) -> None:
+        """Record CPU baselines for every process (worker thread)."""
+        if _USE_PROC_STAT:
+            self._collect_proc_stat(0, "")
+            return
+        for p in psutil.process_iter():
+            if self._shutdown:
+                break
+            try:
+                p.cpu_percent(None)
+            except Exception:
+                pass
     
     def collect_async(self, n_cores: int, proc_filter: str = "") -> None:
         """Start asynchronous process collection.
         
         Args:
-            n_cores: Number of CPU cores for affinity grouping
+            n_cores: Number of CPU cores for per-core grouping
             proc_filter: Optional filter string for process names/PIDs
         """
         with self._lock:
-            if self._collecting or self._shutdown:
+            if self._shutdown:
+                return
+            if self._collecting:
+                self._coalesced += 1
                 return
             self._collecting = True
         
@@ -50,7 +199,7 @@ class ProcessCollector:
         future: Future = self._executor.submit(self._collect_processes, n_cores, proc_filter)
         future.add_done_callback(self._on_collection_complete)
     
-    def _collect_processes(self, n_cores: int, proc_filter: str) -> Dict[str, Any]:
+    def _collect_processes(self, n_cores: int, proc_filter: str) -> Optional[Dict[str, Any]]:
         """Collect process data in background thread (worker thread).
         
         Args:
@@ -58,50 +207,70 @@ class ProcessCollector:
             proc_filter: Filter string for process names/PIDs
             
         Returns:
-            Dictionary with collected process data
+            Dictionary with collected process data (None for a priming scan)
         """
         try:
-            core_processes: Dict[int, List] = {i: [] for i in range(n_cores)}
+            if _USE_PROC_STAT:
+                return self._collect_proc_stat(n_cores, proc_filter)
+            
+            core_processes: List[List] = [[] for _ in range(n_cores)]  # indexed by core id
             all_cores_processes: List = []
             total_threads = 0
             proc_count = 0
             
+            names = self._names
+            names_now: Dict[int, Tuple[Any, str, str]] = {}
+            # Only an all-digit filter can match a PID
+            match_pid = proc_filter.isdigit()
+            match_name = _name_matcher(proc_filter)
+            
             # Iterate all processes (expensive operation done in background)
-            for p in psutil.process_iter(['pid', 'name', 'memory_percent', 'num_threads']):
+            for p in psutil.process_iter(_PROC_ATTRS):
                 if self._shutdown:
                     break
                 
                 proc_count += 1
+                info = p.info
+                pid, threads, mem, cpu = _INFO_FIELDS(info)
+                # psutil already returns int/float; only None needs replacing
+                threads = threads or 0
+                total_threads += threads
+                # create_time() is cached on the Process object process_iter() reuses
                 try:
-                    cpu = float(p.cpu_percent(None))
+                    started = p.create_time()
                 except Exception:
-                    cpu = 0.0
-                
-                mem = float(p.info.get('memory_percent') or 0.0)
-                threads = int(p.info.get('num_threads') or 0)
-                total_threads += threads
-                pid = p.info.get('pid')
-                name = p.info.get('name') or ""
+                    started = None
+                cached = names.get(pid)
+                if cached is None or cached[0] != started:
+                    try:
+                        name = p.name() or ""
+                    except Exception:
+                        name = ""
+                    cached = (started, name, name.lower())
+                names_now[pid] = cached
+                name = cached[1]
                 
                 # Apply search filter
                 if proc_filter:
-                    if proc_filter not in name.lower() and proc_filter not in str(pid):
+                    if not match_name(cached[2]) and not (match_pid and proc_filter in str(pid)):
                         continue
                 
-                # Get CPU affinity (expensive operation)
-                try:
-                    affinity = p.cpu_affinity()
-                    if affinity and len(affinity) < n_cores:
-                        # Process pinned to specific cores
-                        for core_id in affinity:
-                            if core_id < n_cores:
-                                core_processes[core_id].append((cpu, pid, name, mem, threads, p))
-                    else:
-                        # Process can run on all cores
-                        all_cores_processes.append((cpu, pid, name, mem, threads, p))
-                except Exception:
-                    all_cores_processes.append((cpu, pid, name, mem, threads, p))
+                mem = mem or 0.0
+                cpu = cpu or 0.0
+                # Group by the core the process last ran on (None if unavailable)
+                core_id = info.get('cpu_num')
+                if core_id is None:
+                    core_id = -1
+                
+                if 0 <= core_id < n_cores:
+                    core_processes[core_id].append((cpu, pid, name, mem, threads))
+                else:
+                    all_cores_processes.append((cpu, pid, name, mem, threads))
             
+            if self._shutdown:
+                return _empty_result(n_cores)  # cut short: keep the old cache
+            # Drop PIDs that have exited
+            self._names = names_now
             return {
                 'core_processes': core_processes,
                 'all_cores_processes': all_cores_processes,
@@ -110,13 +279,88 @@ class ProcessCollector:
             }
         except Exception as e:
             # Return empty result on error
-            return {
-                'core_processes': {i: [] for i in range(n_cores)},
-                'all_cores_processes': [],
-                'total_threads': 0,
-                'proc_count': 0,
-                'error': str(e),
-            }
+            result = _empty_result(n_cores)
+            result['error'] = str(e)
+            return result
+    
+    def _collect_proc_stat(self, n_cores: int, proc_filter: str) -> Optional[Dict[str, Any]]:
+        """Collect process data by reading /proc/<pid>/stat directly (Linux).
+        
+        CPU % is the change in utime+stime ticks since the previous scan over
+        the elapsed time (100% = one core, like psutil's cpu_percent()). The
+        name is the kernel comm, completed from cmdline when truncated the
+        first time a process is seen.
+        
+        Returns:
+            Same dictionary as _collect_processes, or None for the first scan,
+            which only records CPU baselines
+        """
+        core_processes: List[List] = [[] for _ in range(n_cores)]  # indexed by core id
+        all_cores_processes: List = []
+        total_threads = 0
+        proc_count = 0
+        
+        now_ns = time.monotonic_ns()
+        prev_ticks = self._prev_ticks
+        prev_ns = self._prev_scan_ns
+        cpu_scale = 0.0
+        if prev_ns is not None and now_ns > prev_ns:
+            cpu_scale = 100.0 / (_CLK_TCK * (now_ns - prev_ns) * 1e-9)
+        mem_scale = 100.0 * _PAGE_SIZE / psutil.virtual_memory().total
+        ticks_now: Dict[int, int] = {}
+        names = self._names
+        names_now: Dict[int, Tuple[Any, str, str]] = {}
+        match_name = _name_matcher(proc_filter)
+        
+        for entry in os.listdir("/proc"):
+            if self._shutdown:
+                break
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat", "rb") as f:
+                    comm, ticks, threads, rss, core_id, started = _parse_proc_stat(f.read())
+            except (OSError, ValueError, IndexError):
+                continue  # exited between listdir and open, or unreadable
+            
+            pid = int(entry)
+            ticks_now[pid] = ticks
+            cached = names.get(pid)
+            if cached is None or cached[0] != started:
+                name = _full_name(entry, comm)
+                cached = (started, name, name.lower())
+            names_now[pid] = cached
+            name = cached[1]
+            proc_count += 1
+            total_threads += threads
+            
+            if proc_filter:
+                if not match_name(cached[2]) and proc_filter not in entry:
+                    continue
+            
+            last = prev_ticks.get(pid)
+            # New PID (or a reused one whose counter went backwards): no rate yet
+            cpu = (ticks - last) * cpu_scale if last is not None and ticks >= last else 0.0
+            row = (cpu, pid, name, rss * mem_scale, threads)
+            if 0 <= core_id < n_cores:
+                core_processes[core_id].append(row)
+            else:
+                all_cores_processes.append(row)
+        
+        if self._shutdown:
+            # A partial scan would drop baselines and names of unread PIDs
+            return _empty_result(n_cores)
+        self._prev_ticks = ticks_now
+        self._prev_scan_ns = now_ns
+        self._names = names_now
+        if prev_ns is None:
+            return None
+        return {
+            'core_processes': core_processes,
+            'all_cores_processes': all_cores_processes,
+            'total_threads': total_threads,
+            'proc_count': proc_count,
+        }
     
     def _on_collection_complete(self, future: Future) -> None:
         """Callback when collection completes (runs in worker thread).
@@ -126,19 +370,14 @@ class ProcessCollector:
         """
         with self._lock:
             self._collecting = False
+            self._coalesced = 0
         
         try:
             result = future.result()
-            # Put result in queue (non-blocking, drop old if full)
-            if not self._result_queue.full():
-                self._result_queue.put(result)
-            else:
-                # Drop old result and put new one
-                try:
-                    self._result_queue.get_nowait()
-                except Exception:
-                    pass
-                self._result_queue.put(result)
+            if result is None:
+                return  # priming scan
+            with self._result_lock:
+                self._latest_result = result
         except Exception:
             pass
     
@@ -148,15 +387,28 @@ class ProcessCollector:
         Returns:
             Process data dictionary or None if no result available
         """
-        try:
-            return self._result_queue.get_nowait()
-        except Exception:
-            return None
+        with self._result_lock:
+            result, self._latest_result = self._latest_result, None
+        return result
     
     def is_collecting(self) -> bool:
-        """Check if collection is in progress (thread-safe)."""
-        with self._lock:
-            return self._collecting
+        """Check if collection is in progress (lock-free)."""
+        # _collecting is only ever replaced by a single attribute store, so a
+        # plain read is atomic; the lock only guards check-and-set in
+        # collect_async() and prime()
+        return self._collecting
+    
+    def queue_depth(self) -> int:
+        """Number of collect_async() calls coalesced into the running scan.
+        
+        Requests are never queued behind a running scan, so this counts the
+        ones that were dropped instead; it resets when the scan finishes.
+        """
+        return self._coalesced
+    
+    def is_healthy(self) -> bool:
+        """True unless scans are taking longer than two refresh requests."""
+        return self.queue_depth() < 2
     
     def shutdown(self) -> None:
         """Shutdown collector and wait for pending tasks (thread-safe)."""
@@ -3,7 +3,10 @@
 #      Copyright (c) 2025 predator. All rights reserved.
 
 import asyncio
-from typing import TYPE_CHECKING, Optional
+import heapq
+import time
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 try:
     import psutil
@@ -16,6 +19,21 @@ from .process_collector import ProcessCollector
 if TYPE_CHECKING:
     from system_monitor.app import SystemMonitor
 
+# Preformatted "0.0" .. "1000.0" strings for CPU%/Mem% cells
+_TENTHS_CACHE = [f"{i / 10:.1f}" for i in range(10001)]
+
+
+def _fmt_tenths(value: float) -> str:
+    """Format a non-negative percentage to one decimal using the string cache."""
+    i = int(value * 10 + 0.5)
+    if 0 <= i <= 10000:
+        return _TENTHS_CACHE[i]
+    return f"{value:.1f}"
+
+
+# Sort key for collector rows (cpu, pid, name, mem, threads)
+_CPU_KEY = itemgetter(0)
+
 
 class ProcessManager:
     """Handles process tree building and management.
@@ -24,6 +42,17 @@ class ProcessManager:
     """
     
     _collector: Optional[ProcessCollector] = None
+    # Logical CPU count, read once; it cannot change while the app runs
+    _n_cores: Optional[int] = None
+    # Detached tree rows reused across refreshes instead of being freed by
+    # clear() and reallocated. Bounded by the largest tree ever displayed.
+    _core_item_pool: List[QTreeWidgetItem] = []
+    _proc_item_pool: List[QTreeWidgetItem] = []
+    # pid -> (monotonic time, thread ids) from the last expand. A process row
+    # that moves to another core is rebuilt without its thread rows; re-expanding
+    # it within THREAD_CACHE_TTL reuses the list instead of calling threads()
+    THREAD_CACHE_TTL = 2.0
+    _thread_cache: Dict[int, Tuple[float, List[int]]] = {}
     
     @classmethod
     def initialize_collector(cls) -> None:
@@ -50,12 +79,23 @@ class ProcessManager:
         
         try:
             pid = int(pid_text)
-            proc = psutil.Process(pid)
-            thread_ids = proc.threads()
-            for thread_info in thread_ids[:10]:
+            now = time.monotonic()
+            cache = ProcessManager._thread_cache
+            cached = cache.get(pid)
+            if cached is not None and now - cached[0] < ProcessManager.THREAD_CACHE_TTL:
+                thread_ids = cached[1]
+            else:
+                thread_ids = [t.id for t in psutil.Process(pid).threads()[:10]]
+                # Drop expired entries so the cache stays as small as the
+                # number of rows expanded within the TTL
+                for stale in [k for k, (t, _) in cache.items()
+                              if now - t >= ProcessManager.THREAD_CACHE_TTL]:
+                    del cache[stale]
+                cache[pid] = (now, thread_ids)
+            for tid in thread_ids:
                 thread_item = QTreeWidgetItem(item)
-                thread_item.setText(0, f"Thread {thread_info.id}")
-                thread_item.setText(1, str(thread_info.id))
+                thread_item.setText(0, f"Thread {tid}")
+                thread_item.setText(1, str(tid))
         except Exception:
             pass
 
@@ -67,20 +107,18 @@ class ProcessManager:
         results from queue to update UI without blocking.
         """
         try:
-            # First pass: prime per-process CPU percentages (still synchronous, but fast)
-            if not getattr(monitor, "_procs_primed", False):
-                for p in psutil.process_iter():
-                    try:
-                        p.cpu_percent(None)
-                    except Exception:
-                        pass
-                monitor._procs_primed = True
-                return
-            
             # Initialize collector if needed
             if ProcessManager._collector is None:
                 ProcessManager.initialize_collector()
             
+            # First pass: prime per-process CPU percentages
+            if not getattr(monitor, "_procs_primed", False):
+                # A scan still running (e.g. from before a tab switch) makes
+                # prime() a no-op; try again on the next tick
+                if ProcessManager._collector.prime():
+                    monitor._procs_primed = True
+                return
+            
             # Check if we have a result ready from previous collection
             result = ProcessManager._collector.get_result()
             if result is not None:
@@ -89,8 +127,9 @@ class ProcessManager:
             
             # Start new async collection if not already collecting
             if not ProcessManager._collector.is_collecting():
-                n_cores = psutil.cpu_count(logical=True) or 1
-                ProcessManager._collector.collect_async(n_cores, monitor._proc_filter)
+                if ProcessManager._n_cores is None:
+                    ProcessManager._n_cores = psutil.cpu_count(logical=True) or 1
+                ProcessManager._collector.collect_async(ProcessManager._n_cores, monitor._proc_filter)
             
         except Exception:
             pass
@@ -104,28 +143,23 @@ class ProcessManager:
             result: Dictionary with process data from collector
         """
         try:
-            core_processes = result.get('core_processes', {})
+            core_processes = result.get('core_processes', [])
             proc_count = result.get('proc_count', 0)
             total_threads = result.get('total_threads', 0)
             
             n_cores = len(core_processes)
             
-            # Save current expansion state before clearing
-            expanded_cores, expanded_processes = ProcessManager._save_expansion_state(monitor, n_cores)
-            
-            # Clear tree and rebuild
-            monitor.proc_tree.clear()
-            
-            # Track if this is the first time building the tree
-            first_build = not hasattr(monitor, "_proc_tree_built")
-            if first_build:
-                monitor._proc_tree_built = True
-            
-            # Build process tree
-            ProcessManager._build_process_tree(
-                monitor, n_cores, core_processes, first_build, 
-                expanded_cores, expanded_processes
-            )
+            # Apply the new rows as a diff against the current tree; repaint once.
+            # Signals are blocked too: restoring expansion of re-inserted rows
+            # must not re-enter on_proc_item_expanded
+            tree = monitor.proc_tree
+            tree.setUpdatesEnabled(False)
+            was_blocked = tree.blockSignals(True)
+            try:
+                ProcessManager._sync_process_tree(monitor, n_cores, core_processes)
+            finally:
+                tree.blockSignals(was_blocked)
+                tree.setUpdatesEnabled(True)
             
             # Update summary labels
             ProcessManager._update_summary_labels(monitor, proc_count, total_threads)
@@ -134,88 +168,118 @@ class ProcessManager:
             pass
 
     @staticmethod
-    def _save_expansion_state(monitor: 'SystemMonitor', n_cores: int) -> tuple:
-        """Save the current expansion state of the process tree."""
-        expanded_cores = set()
-        expanded_processes = {}
-        
-        for i in range(monitor.proc_tree.topLevelItemCount()):
-            core_item = monitor.proc_tree.topLevelItem(i)
-            if core_item and core_item.isExpanded():
-                try:
-                    core_text = core_item.text(0)
-                    core_id = int(core_text.split()[-1])
-                    expanded_cores.add(core_id)
-                    
-                    # Track expanded processes under this core
-                    expanded_pids = set()
-                    for j in range(core_item.childCount()):
-                        proc_item = core_item.child(j)
-                        if proc_item and proc_item.isExpanded():
-                            pid_text = proc_item.text(1)
-                            if pid_text.isdigit():
-                                expanded_pids.add(int(pid_text))
-                    if expanded_pids:
-                        expanded_processes[core_id] = expanded_pids
-                except Exception:
-                    pass
-        
-        return expanded_cores, expanded_processes
+    def _take_item(pool: List[QTreeWidgetItem], parent: QTreeWidgetItem) -> QTreeWidgetItem:
+        """Attach a pooled item to parent, allocating a new one if the pool is empty."""
+        if pool:
+            item = pool.pop()
+            parent.addChild(item)
+            return item
+        return QTreeWidgetItem(parent)
+
+    @staticmethod
+    def _release_item(item: QTreeWidgetItem) -> None:
+        """Return a detached process row to the pool."""
+        if item.childCount():
+            # Thread rows are cheap and reloaded on demand; let them go
+            item.takeChildren()
+        ProcessManager._proc_item_pool.append(item)
 
     @staticmethod
-    def _build_process_tree(monitor: 'SystemMonitor', n_cores: int, core_processes: dict,
-                           first_build: bool, expanded_cores: set, expanded_processes: dict) -> None:
-        """Build the process tree with core nodes."""
+    def _sync_process_tree(monitor: 'SystemMonitor', n_cores: int, core_processes: List[List]) -> None:
+        """Bring the core/process tree in line with a new collection result.
+        
+        Core rows persist across refreshes, so their expansion state needs no
+        bookkeeping. Under each core, rows are matched to processes by PID:
+        when the order is unchanged only the changed cells are rewritten;
+        otherwise the rows are reordered, reusing the row (and expansion and
+        loaded thread rows) of every PID still present. Rows for vanished PIDs
+        go back to the pool.
+        """
+        root = monitor.proc_tree.invisibleRootItem()
+        core_pool = ProcessManager._core_item_pool
+        
+        # Core rows: only change when the core count does (i.e. the first build)
+        while root.childCount() > n_cores:
+            core_item = root.takeChild(root.childCount() - 1)
+            for proc_item in core_item.takeChildren():
+                ProcessManager._release_item(proc_item)
+            core_pool.append(core_item)
+        while root.childCount() < n_cores:
+            core_id = root.childCount()
+            core_item = ProcessManager._take_item(core_pool, root)
+            core_item.setText(0, f"CPU Core {core_id}")
+            core_item.setExpanded(True)
+        
         for core_id in range(n_cores):
             core_procs = core_processes[core_id]
-            core_procs.sort(key=lambda x: x[0], reverse=True)
+            core_item = root.child(core_id)
+            if not core_procs:
+                if core_item.childCount():
+                    for proc_item in core_item.takeChildren():
+                        ProcessManager._release_item(proc_item)
+                core_item.setText(2, _fmt_tenths(0.0))
+                continue
+            # Only the top 10 are shown: partial selection instead of a full sort
+            top = heapq.nlargest(10, core_procs, key=_CPU_KEY)
             
-            # Create core node
-            core_item = QTreeWidgetItem(monitor.proc_tree)
-            core_item.setText(0, f"CPU Core {core_id}")
-            core_item.setText(2, f"{sum(x[0] for x in core_procs[:10]):.1f}")
+            core_item.setText(2, _fmt_tenths(sum(x[0] for x in top)))
             
-            # Expand based on state
-            should_expand = first_build or (core_id in expanded_cores)
-            core_item.setExpanded(should_expand)
+            n_old = core_item.childCount()
+            old_items = [core_item.child(j) for j in range(n_old)]
+            old_pids = [item.text(1) for item in old_items]
+            new_pids = ["%d" % x[1] for x in top]
             
-            # Add top processes to this core
-            for cpu, pid, name, mem, thr, proc_obj in core_procs[:10]:
-                proc_item = QTreeWidgetItem(core_item)
-                proc_item.setText(0, name)
-                proc_item.setText(1, str(pid))
-                proc_item.setText(2, f"{cpu:.1f}")
-                proc_item.setText(3, f"{mem:.1f}")
-                proc_item.setText(4, str(thr))
-                proc_item.setText(5, str(core_id))
-                
-                # Restore process expansion state
-                if core_id in expanded_processes and pid in expanded_processes[core_id]:
-                    proc_item.setExpanded(True)
-                    if thr > 1:
-                        try:
-                            thread_ids = proc_obj.threads()
-                            for thread_info in thread_ids[:10]:
-                                thread_item = QTreeWidgetItem(proc_item)
-                                thread_item.setText(0, f"Thread {thread_info.id}")
-                                thread_item.setText(1, str(thread_info.id))
-                        except Exception:
-                            pass
-                else:
-                    # Lazy load threads
-                    if thr > 1:
-                        proc_item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+            if old_pids == new_pids:
+                # Same processes in the same order: update cells in place
+                rows = old_items
+                expanded = ()
+            else:
+                by_pid = dict(zip(old_pids, old_items))
+                expanded = {pid for pid, item in by_pid.items() if item.isExpanded()}
+                core_item.takeChildren()
+                rows = []
+                for pid_text in new_pids:
+                    item = by_pid.pop(pid_text, None)
+                    if item is None:
+                        pool = ProcessManager._proc_item_pool
+                        item = pool.pop() if pool else QTreeWidgetItem()
+                        item.setText(1, pid_text)
+                    rows.append(item)
+                for item in by_pid.values():
+                    ProcessManager._release_item(item)
+                core_item.addChildren(rows)
+            
+            core_id_text = "%d" % core_id
+            for item, (cpu, pid, name, mem, thr) in zip(rows, top):
+                item.setText(0, name)
+                item.setText(2, _fmt_tenths(cpu))
+                item.setText(3, _fmt_tenths(mem))
+                item.setText(4, "%d" % thr)
+                item.setText(5, core_id_text)
+                if item.text(1) in expanded:
+                    # Re-inserted rows lose their view expansion; restore it
+                    item.setExpanded(True)
+                if item.childCount() == 0:
+                    # Threads load lazily on expand (see on_proc_item_expanded)
+                    item.setChildIndicatorPolicy(
+                        QTreeWidgetItem.ShowIndicator if thr > 1
+                        else QTreeWidgetItem.DontShowIndicatorWhenChildless
+                    )
 
     @staticmethod
     def _update_summary_labels(monitor: 'SystemMonitor', proc_count: int, total_threads: int) -> None:
         """Update process and thread summary labels."""
         monitor.lbl_proc_summary.setText(f"Processes: {proc_count:,}   Threads: {total_threads:,}")
         
-        # asyncio coroutines count
+        # asyncio coroutines count. The Qt main thread normally has no running
+        # loop, so use the non-raising probe and skip all_tasks() in that case
         coro_count = 0
-        try:
-            loop = asyncio.get_running_loop()
-            coro_count = len(asyncio.all_tasks(loop))
-        except Exception:
-            coro_count = 0
-        monitor.lbl_asyncio.setText(f"Python coroutines (asyncio tasks): {coro_count}")
+        loop = asyncio._get_running_loop()
+        if loop is not None:
+            try:
+                coro_count = len(asyncio.all_tasks(loop))
+            except Exception:
+                coro_count = 0
+        if coro_count != getattr(monitor, "_coro_count", None):
+            monitor._coro_count = coro_count
+            monitor.lbl_asyncio.setText(f"Python coroutines (asyncio tasks): {coro_count}")
@@ -0,0 +1,106 @@
+"""Background CPU clock reader using ThreadPoolExecutor."""
+
+#      Copyright (c) 2025 predator. All rights reserved.
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from system_monitor.utils import get_per_core_frequencies
+
+
+@dataclass
+class SensorReadings:
+    """One CPU clock reading; zero / empty where a value was not read."""
+
+    cpu_freq: float = 0.0  # MHz
+    core_freqs: List[float] = field(default_factory=list)  # MHz per core
+
+
+class SensorCollector:
+    """Reads CPU clock sensors in a background thread.
+
+    /proc/cpuinfo and the cpufreq sysfs files can take milliseconds to read on
+    many-core machines, so the UI thread only enqueues a read with
+    collect_async() and picks up the finished result on a later tick with
+    get_result(). Mirrors ProcessCollector's executor + latest-result hand-off.
+    """
+
+    def __init__(self) -> None:
+        """Initialize sensor collector with a single worker thread."""
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SensorCollector")
+        self._latest_result: Optional[SensorReadings] = None  # Only keep latest result
+        self._result_lock = threading.Lock()
+        self._collecting = False
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def collect_async(self, per_core: bool = False) -> None:
+        """Start an asynchronous read unless one is already in flight.
+
+        Args:
+            per_core: Also read per-core frequencies (CPU tab)
+        """
+        with self._lock:
+            if self._collecting or self._shutdown:
+                return
+            self._collecting = True
+
+        future: Future = self._executor.submit(self._collect, per_core)
+        future.add_done_callback(self._on_collection_complete)
+
+    @staticmethod
+    def _collect(per_core: bool) -> SensorReadings:
+        """Read CPU clocks (worker thread)."""
+        readings = SensorReadings()
+        try:
+            freq = psutil.cpu_freq()
+            if freq and freq.current:
+                readings.cpu_freq = float(freq.current)
+        except Exception:
+            pass
+        if per_core:
+            readings.core_freqs = get_per_core_frequencies()
+        return readings
+
+    def _on_collection_complete(self, future: Future) -> None:
+        """Publish a finished read, replacing any result not yet consumed."""
+        with self._lock:
+            self._collecting = False
+
+        try:
+            result = future.result()
+            with self._result_lock:
+                self._latest_result = result
+        except Exception:
+            pass
+
+    def get_result(self) -> Optional[SensorReadings]:
+        """Get a new reading if one has completed (non-blocking, thread-safe).
+
+        Returns:
+            Readings not returned before, or None
+        """
+        with self._result_lock:
+            result, self._latest_result = self._latest_result, None
+        return result
+
+    def is_collecting(self) -> bool:
+        """Check if a read is in progress (lock-free)."""
+        # Written by single attribute stores; reading it needs no lock
+        return self._collecting
+
+    def shutdown(self) -> None:
+        """Shutdown collector and wait for a pending read (thread-safe)."""
+        with self._lock:
+            self._shutdown = True
+
+        self._executor.shutdown(wait=True)
@@ -2,6 +2,6 @@
 
 #      Copyright (c) 2025 predator. All rights reserved.
 
-from .gpu_provider import GPUProvider
+from .gpu_provider import GPUProvider, GpuSnapshot, F_UTIL, F_FREQ, F_VRAM, F_TEMP, F_ALL
 
-__all__ = ["GPUProvider"]
+__all__ = ["GPUProvider", "GpuSnapshot", "F_UTIL", "F_FREQ", "F_VRAM", "F_TEMP", "F_ALL"]
@@ -4,11 +4,109 @@
 
 from __future__ import annotations
 
+import ctypes
 import shutil
 import subprocess
 import threading
 import time
-from typing import List, Tuple
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from system_monitor.utils import get_gpu_temperatures
+
+# Field bits for GPUProvider.sample_all()
+F_UTIL = 1
+F_FREQ = 2
+F_VRAM = 4
+F_TEMP = 8
+F_ALL = F_UTIL | F_FREQ | F_VRAM | F_TEMP
+
+
+@dataclass(frozen=True)
+class GpuSnapshot:
+    """One GPU sample: per-GPU utilization, clock, VRAM and temperature.
+
+    Fields whose bit is not set in ``fields`` were not queried and hold zeros.
+    """
+
+    fields: int = F_ALL
+    utils: List[float] = field(default_factory=list)
+    freqs: List[float] = field(default_factory=list)
+    vram: List[Tuple[float, float]] = field(default_factory=list)  # (used_mb, total_mb)
+    temps: List[float] = field(default_factory=list)
+
+
+class _NvmlUtilization(ctypes.Structure):
+    _fields_ = [("gpu", ctypes.c_uint), ("memory", ctypes.c_uint)]
+
+
+class _NvmlMemory(ctypes.Structure):
+    _fields_ = [("total", ctypes.c_ulonglong), ("free", ctypes.c_ulonglong), ("used", ctypes.c_ulonglong)]
+
+
+class _NvmlDirect:
+    """Calls libnvidia-ml through pynvml's cached ctypes function pointers.
+
+    The pynvml wrappers take a lock to look up the function pointer, allocate
+    a result struct and raise on errors for every query; on multi-GPU hosts
+    that overhead dominates a sample. Here the pointers and output structs are
+    resolved once and each query is a single ctypes call.
+
+    The output structs are shared and unlocked: GPUTabBuilder.build_gpu_tab
+    takes its first sample on the GUI thread, which is safe only because
+    gpu_sampler.start() is called after it; from then on only the GpuSampler
+    thread calls in.
+    """
+
+    def __init__(self, nvml) -> None:
+        # Private API: _nvmlGetFunctionPointer (and its ctypes._CFuncPtr
+        # results) checked against nvidia-ml-py 11.495 - 12.570 and the pynvml
+        # 11.x releases that bundle it. Anything else raises here and the
+        # provider keeps using the public wrappers.
+        get = nvml._nvmlGetFunctionPointer
+        self._util_fn = get("nvmlDeviceGetUtilizationRates")
+        self._clock_fn = get("nvmlDeviceGetClockInfo")
+        self._mem_fn = get("nvmlDeviceGetMemoryInfo")
+        self._temp_fn = get("nvmlDeviceGetTemperature")
+        for fn in (self._util_fn, self._clock_fn, self._mem_fn, self._temp_fn):
+            if not isinstance(fn, ctypes._CFuncPtr):
+                raise TypeError("not a ctypes function pointer")
+        self._clock_graphics = nvml.NVML_CLOCK_GRAPHICS
+        self._temp_gpu = nvml.NVML_TEMPERATURE_GPU
+        self._util = _NvmlUtilization()
+        self._mem = _NvmlMemory()
+        self._val = ctypes.c_uint()
+
+    def sample_all(self, handles, supported: List[int], fields: int) -> GpuSnapshot:
+        """Same contract as the NVML branch of GPUProvider.sample_all()."""
+        n = len(handles)
+        utils = [0.0] * n
+        freqs = [0.0] * n
+        vram = [(0.0, 0.0)] * n
+        temps = [0.0] * n
+        util, mem, val = self._util, self._mem, self._val
+        util_ref, mem_ref, val_ref = ctypes.byref(util), ctypes.byref(mem), ctypes.byref(val)
+        for i, h in enumerate(handles):
+            want = fields & supported[i] if i < len(supported) else fields
+            # A non-zero return is an NVML error: leave the device's remaining
+            # fields at zero, as the wrapper path does on an exception
+            if want & F_UTIL:
+                if self._util_fn(h, util_ref):
+                    continue
+                utils[i] = float(util.gpu)
+            if want & F_FREQ:
+                if self._clock_fn(h, self._clock_graphics, val_ref):
+                    continue
+                freqs[i] = float(val.value)
+            if want & F_VRAM:
+                if self._mem_fn(h, mem_ref):
+                    continue
+                vram[i] = (mem.used / (1024 * 1024), mem.total / (1024 * 1024))
+            if want & F_TEMP:
+                if self._temp_fn(h, self._temp_gpu, val_ref):
+                    continue
+                temps[i] = float(val.value)
+        return GpuSnapshot(fields=fields, utils=utils, freqs=freqs, vram=vram, temps=temps)
 
 
 class GPUProvider:
@@ -16,53 +114,119 @@ class GPUProvider:
     Tries nvidia-ml-py first; falls back to calling nvidia-smi if available.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, defer: bool = False) -> None:
+        """Initialize GPU provider.
+
+        Args:
+            defer: Skip GPU detection here; call detect() or detect_async()
+                later (loading libnvidia-ml and enumerating devices can take
+                hundreds of milliseconds)
+        """
         self.method: str = "none"
-        self._gpu_names: List[str] = []
+        self._gpu_names: Tuple[str, ...] = ()  # set once by detection; returned as-is
         self._nvml = None
         self._nvml_handles = []
-        self._last_smi_time: float = 0.0
+        self._nvml_fields: List[int] = []  # F_* bits each NVML device supports
+        self._nvml_direct: Optional[_NvmlDirect] = None  # ctypes fast path for sample_all
         self._last_smi_utils: List[float] = []
         self._last_smi_vram: List[Tuple[float, float]] = []  # (used_mb, total_mb) per GPU
         self._last_smi_freq: List[float] = []  # current freq in MHz per GPU
+        self._last_smi_temp: List[float] = []  # temperature in Celsius per GPU
         self._smi_min_interval = 1.0  # seconds; avoid hammering nvidia-smi; polled in background thread
+        self._smi_stop = False
+        self._smi_proc = None  # long-running nvidia-smi in loop mode, when streaming
+        self.ready = threading.Event()  # set once detection has finished
 
+        if not defer:
+            self.detect()
+
+    def detect_async(self) -> None:
+        """Run detect() on a daemon thread; ``ready`` is set when it finishes."""
+        threading.Thread(target=self.detect, name="GpuDetect", daemon=True).start()
+
+    def detect(self) -> None:
+        """Probe NVML, then nvidia-smi, and publish GPU names and method."""
+        try:
+            self._detect()
+        finally:
+            self.ready.set()
+
+    def _detect(self) -> None:
         # Try NVML (pynvml)
         try:
             import pynvml as nvml  # type: ignore
             nvml.nvmlInit()
             count = nvml.nvmlDeviceGetCount()
-            self._nvml = nvml
+            handles = []
+            names: List[str] = []
             for i in range(count):
                 h = nvml.nvmlDeviceGetHandleByIndex(i)
-                self._nvml_handles.append(h)
+                handles.append(h)
                 name = nvml.nvmlDeviceGetName(h)
                 if isinstance(name, bytes):
                     name = name.decode("utf-8", errors="ignore")
-                self._gpu_names.append(str(name))
-            if self._gpu_names:
+                names.append(str(name))
+            supported = [self._nvml_supported_fields(nvml, h) for h in handles]
+            try:
+                self._nvml_direct = _NvmlDirect(nvml)
+            except Exception:
+                # Older/unusual pynvml builds: keep using the Python wrappers
+                self._nvml_direct = None
+            # Publish handles, then method, then names: a reader that sees
+            # names (the UI) must never find method still "none"
+            self._nvml = nvml
+            self._nvml_fields = supported
+            self._nvml_handles = handles
+            if names:
                 self.method = "nvml"
+            self._gpu_names = tuple(names)
         except Exception:
             self._nvml = None
             self._nvml_handles = []
+            self._nvml_fields = []
+            self._nvml_direct = None
 
         # Fallback to nvidia-smi
-        if self.method == "none" and shutil.which("nvidia-smi"):
+        if self.method == "none" and not self._smi_stop and shutil.which("nvidia-smi"):
             try:
                 names = self._query_nvidia_smi_names()
                 if names:
-                    self._gpu_names = names
                     self._last_smi_utils = [0.0 for _ in names]
                     self._last_smi_vram = [(0.0, 0.0) for _ in names]
                     self._last_smi_freq = [0.0 for _ in names]
+                    self._last_smi_temp = [0.0 for _ in names]
                     self.method = "nvidia-smi"
-                    # Start background polling thread to avoid UI blocking
-                    self._smi_stop = False
-                    self._smi_thread = threading.Thread(target=self._smi_poll_loop, daemon=True)
+                    self._gpu_names = tuple(names)
+                    # Start background reader thread to avoid UI blocking
+                    self._smi_thread = threading.Thread(target=self._smi_stream_loop, daemon=True)
                     self._smi_thread.start()
             except Exception:
                 pass
 
+    @staticmethod
+    def _nvml_supported_fields(nvml, handle) -> int:
+        """Probe a device once and drop fields NVML reports as NOT_SUPPORTED.
+
+        Some devices (MIG instances, many laptop GPUs) do not support every
+        query; skipping those keeps a failing call from zeroing the device's
+        other fields on every sample.
+        """
+        not_supported = getattr(nvml, "NVML_ERROR_NOT_SUPPORTED", 3)
+        probes = (
+            (F_UTIL, lambda: nvml.nvmlDeviceGetUtilizationRates(handle)),
+            (F_FREQ, lambda: nvml.nvmlDeviceGetClockInfo(handle, nvml.NVML_CLOCK_GRAPHICS)),
+            (F_VRAM, lambda: nvml.nvmlDeviceGetMemoryInfo(handle)),
+            (F_TEMP, lambda: nvml.nvmlDeviceGetTemperature(handle, nvml.NVML_TEMPERATURE_GPU)),
+        )
+        fields = F_ALL
+        for bit, query in probes:
+            try:
+                query()
+            except Exception as e:
+                if getattr(e, "value", None) == not_supported:
+                    fields &= ~bit
+        return fields
+
     def _query_nvidia_smi_names(self) -> List[str]:
         cmd = [
             "nvidia-smi",
@@ -73,58 +237,45 @@ class GPUProvider:
         names = [line.strip() for line in out.stdout.strip().splitlines() if line.strip()]
         return names
 
-    def _query_nvidia_smi_utils(self) -> List[float]:
-        cmd = [
-            "nvidia-smi",
-            "--query-gpu=utilization.gpu",
-            "--format=csv,noheader,nounits",
-        ]
-        out = subprocess.run(cmd, capture_output=True, text=True, timeout=1.5)
-        utils: List[float] = []
-        for line in out.stdout.strip().splitlines():
-            try:
-                utils.append(float(line.strip()))
-            except Exception:
-                utils.append(0.0)
-        return utils
+    def _query_nvidia_smi_all(self) -> Tuple[List[float], List[Tuple[float, float]], List[float]]:
+        """Query utilization, VRAM and clock for every GPU in one nvidia-smi call.
 
-    def _query_nvidia_smi_vram(self) -> List[Tuple[float, float]]:
-        """Query VRAM usage (used, total) in MB via nvidia-smi."""
-        cmd = [
-            "nvidia-smi",
-            "--query-gpu=memory.used,memory.total",
-            "--format=csv,noheader,nounits",
-        ]
-        out = subprocess.run(cmd, capture_output=True, text=True, timeout=1.5)
-        vram: List[Tuple[float, float]] = []
-        for line in out.stdout.strip().splitlines():
-            try:
-                parts = line.strip().split(",")
-                used = float(parts[0].strip())
-                total = float(parts[1].strip())
-                vram.append((used, total))
-            except Exception:
-                vram.append((0.0, 0.0))
-        return vram
+        Spawning nvidia-smi dominates the cost, so the three fields share a
+        single process and the parsed lists are cached in ``_last_smi_*``.
 
-    def _query_nvidia_smi_freq(self) -> List[float]:
-        """Query GPU clock frequency in MHz via nvidia-smi."""
+        Returns:
+            (utils, vram, freqs): utilization %, (used_mb, total_mb) and MHz per GPU
+        """
         cmd = [
             "nvidia-smi",
-            "--query-gpu=clocks.current.graphics",
+            "--query-gpu=utilization.gpu,memory.used,memory.total,clocks.current.graphics",
             "--format=csv,noheader,nounits",
         ]
         out = subprocess.run(cmd, capture_output=True, text=True, timeout=1.5)
+        utils: List[float] = []
+        vram: List[Tuple[float, float]] = []
         freqs: List[float] = []
         for line in out.stdout.strip().splitlines():
-            try:
-                freqs.append(float(line.strip()))
-            except Exception:
-                freqs.append(0.0)
-        return freqs
+            vals = []
+            for p in line.split(",")[:4]:
+                try:
+                    vals.append(float(p.strip()))
+                except ValueError:
+                    vals.append(0.0)  # "[N/A]" / "[Not Supported]"
+            vals += [0.0] * (4 - len(vals))
+            utils.append(vals[0])
+            vram.append((vals[1], vals[2]))
+            freqs.append(vals[3])
+        if utils:
+            self._last_smi_utils = utils
+            self._last_smi_vram = vram
+            self._last_smi_freq = freqs
+        return utils, vram, freqs
 
-    def gpu_names(self) -> List[str]:
-        return list(self._gpu_names)
+    def gpu_names(self) -> Tuple[str, ...]:
+        # Filled in once by the detection thread (method is set first) and
+        # never mutated after that; a tuple, so no defensive copy
+        return self._gpu_names
 
     def gpu_utils(self) -> List[float]:
         if self.method == "nvml" and self._nvml is not None:
@@ -176,19 +327,132 @@ class GPUProvider:
         else:
             return []
 
+    def sample_all(self, fields: int = F_ALL) -> GpuSnapshot:
+        """Sample utilization, clock, VRAM and temperature for every GPU.
+        
+        With NVML the handles are walked once and the queries for a device
+        are issued back to back, skipping fields the device does not support.
+        A failure leaves the remaining fields of that device at zero instead of
+        retrying each one separately.
+        
+        Args:
+            fields: Bitmask of F_UTIL/F_FREQ/F_VRAM/F_TEMP; unset fields are
+                not queried and are reported as zeros
+        """
+        if self.method == "nvml" and self._nvml is not None:
+            if self._nvml_direct is not None:
+                return self._nvml_direct.sample_all(self._nvml_handles, self._nvml_fields, fields)
+            nvml = self._nvml
+            n = len(self._nvml_handles)
+            utils = [0.0] * n
+            freqs = [0.0] * n
+            vram = [(0.0, 0.0)] * n
+            temps = [0.0] * n
+            supported = self._nvml_fields
+            for i, h in enumerate(self._nvml_handles):
+                want = fields & supported[i] if i < len(supported) else fields
+                try:
+                    if want & F_UTIL:
+                        utils[i] = float(nvml.nvmlDeviceGetUtilizationRates(h).gpu)
+                    if want & F_FREQ:
+                        freqs[i] = float(nvml.nvmlDeviceGetClockInfo(h, nvml.NVML_CLOCK_GRAPHICS))
+                    if want & F_VRAM:
+                        mem_info = nvml.nvmlDeviceGetMemoryInfo(h)
+                        vram[i] = (mem_info.used / (1024 * 1024), mem_info.total / (1024 * 1024))
+                    if want & F_TEMP:
+                        temps[i] = float(nvml.nvmlDeviceGetTemperature(h, nvml.NVML_TEMPERATURE_GPU))
+                except Exception:
+                    pass
+            return GpuSnapshot(fields=fields, utils=utils, freqs=freqs, vram=vram, temps=temps)
+
+        utils = self.gpu_utils()
+        if not utils:
+            return GpuSnapshot(fields=fields)
+        n = len(utils)
+        temps = [0.0] * n
+        if fields & F_TEMP:
+            if self._smi_proc is not None:
+                temps = list(self._last_smi_temp)
+            else:
+                # Polling fallback: temperatures cost a subprocess; only query when shown
+                try:
+                    temps = get_gpu_temperatures(self)
+                except Exception:
+                    temps = []
+        return GpuSnapshot(
+            fields=fields,
+            utils=utils,
+            freqs=self.gpu_frequencies() if fields & F_FREQ else [0.0] * n,
+            vram=self.gpu_vram_info() if fields & F_VRAM else [(0.0, 0.0)] * n,
+            temps=temps,
+        )
+
+    def _smi_stream_loop(self) -> None:
+        """Read samples from a single nvidia-smi running in loop mode.
+        
+        One long-lived process replaces spawning nvidia-smi for every field
+        on every poll. Falls back to _smi_poll_loop if it cannot be started
+        or exits unexpectedly.
+        """
+        cmd = [
+            "nvidia-smi",
+            "--query-gpu=index,utilization.gpu,memory.used,memory.total,"
+            "clocks.current.graphics,temperature.gpu",
+            "--format=csv,noheader,nounits",
+            f"--loop-ms={int(self._smi_min_interval * 1000)}",
+        ]
+        try:
+            self._smi_proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1
+            )
+            for line in self._smi_proc.stdout:
+                if self._smi_stop:
+                    break
+                self._parse_smi_line(line)
+        except Exception:
+            pass
+        self._smi_proc = None
+        if not self._smi_stop:
+            self._smi_poll_loop()
+
+    def _parse_smi_line(self, line: str) -> None:
+        """Store one 'index, util, used, total, clock, temp' line from nvidia-smi."""
+        parts = [p.strip() for p in line.split(",")]
+        if len(parts) < 6:
+            return
+        try:
+            idx = int(parts[0])
+        except ValueError:
+            return
+        if not 0 <= idx < len(self._last_smi_utils):
+            return
+        vals = []
+        for p in parts[1:6]:
+            try:
+                vals.append(float(p))
+            except ValueError:
+                vals.append(0.0)  # "[N/A]" / "[Not Supported]"
+        self._last_smi_utils[idx] = vals[0]
+        self._last_smi_vram[idx] = (vals[1], vals[2])
+        self._last_smi_freq[idx] = vals[3]
+        self._last_smi_temp[idx] = vals[4]
+
+    def shutdown(self) -> None:
+        """Stop nvidia-smi background polling and terminate its process."""
+        self._smi_stop = True
+        proc = self._smi_proc
+        if proc is not None:
+            try:
+                proc.terminate()
+            except Exception:
+                pass
+
     def _smi_poll_loop(self) -> None:
         # Background polling loop for nvidia-smi to avoid blocking the UI thread
-        while True:
+        while not self._smi_stop:
             try:
-                utils = self._query_nvidia_smi_utils()
-                if utils:
-                    self._last_smi_utils = utils
-                vram = self._query_nvidia_smi_vram()
-                if vram:
-                    self._last_smi_vram = vram
-                freq = self._query_nvidia_smi_freq()
-                if freq:
-                    self._last_smi_freq = freq
+                # One nvidia-smi process refreshes utils, VRAM and clocks together
+                self._query_nvidia_smi_all()
             except Exception:
                 # swallow exceptions; next iteration will retry
                 pass
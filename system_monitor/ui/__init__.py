@@ -10,6 +10,7 @@ from .gpu_tab_builder import GPUTabBuilder
 from .process_tab_builder import ProcessTabBuilder
 from .chart_factory import ChartFactory
 from .event_handlers import EventHandlers
+from .tab_index import TabIndex
 
 __all__ = [
     "ToolbarBuilder",
@@ -20,4 +21,5 @@ __all__ = [
     "ProcessTabBuilder",
     "ChartFactory",
     "EventHandlers",
+    "TabIndex",
 ]
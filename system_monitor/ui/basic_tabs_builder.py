@@ -24,9 +24,8 @@ class BasicTabsBuilder:
         
         mem_freq = get_memory_frequency()
         if mem_freq > 0:
-            small_style = "QLabel { color: #b0b0b0; font-size: 9pt; }"
             monitor.lbl_mem_freq = QLabel(f"RAM Frequency: {mem_freq:.0f} MHz")
-            monitor.lbl_mem_freq.setStyleSheet(small_style)
+            monitor.lbl_mem_freq.setObjectName("Info")
             mem_l.addWidget(monitor.lbl_mem_freq)
         else:
             monitor.lbl_mem_freq = None
@@ -47,7 +46,7 @@ class BasicTabsBuilder:
         unit_row.addWidget(monitor.unit_combo_net)
         
         monitor.net_formula_lbl = QLabel("1 MiB/s ≈ 1.048576 MB/s | 1 MB/s ≈ 0.9537 MiB/s")
-        monitor.net_formula_lbl.setStyleSheet("QLabel { color: #b0b0b0; font-size: 9pt; }")
+        monitor.net_formula_lbl.setObjectName("Info")
         unit_row.addWidget(monitor.net_formula_lbl)
         
         net_l.addLayout(unit_row)
@@ -69,7 +68,7 @@ class BasicTabsBuilder:
         unit_row.addWidget(monitor.unit_combo_disk)
         
         monitor.disk_formula_lbl = QLabel("1 MiB/s ≈ 1.048576 MB/s | 1 MB/s ≈ 0.9537 MiB/s")
-        monitor.disk_formula_lbl.setStyleSheet("QLabel { color: #b0b0b0; font-size: 9pt; }")
+        monitor.disk_formula_lbl.setObjectName("Info")
         unit_row.addWidget(monitor.disk_formula_lbl)
         
         disk_l.addLayout(unit_row)
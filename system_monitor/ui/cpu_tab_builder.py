@@ -2,8 +2,7 @@
 
 #      Copyright (c) 2025 predator. All rights reserved.
 
-import math
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Tuple
 
 try:
     import psutil
@@ -18,6 +17,7 @@ from PySide6.QtWidgets import (
 )
 
 from system_monitor.widgets import TimeSeriesChart
+from system_monitor.utils import get_per_core_frequencies
 
 if TYPE_CHECKING:
     from system_monitor.app import SystemMonitor
@@ -26,11 +26,11 @@ if TYPE_CHECKING:
 class CPUTabBuilder:
     """Builds the CPU tab with per-core charts and summary labels."""
 
-    CORE_COLORS = [
+    CORE_COLORS = (
         QColor("#e53935"), QColor("#8e24aa"), QColor("#3949ab"), QColor("#1e88e5"),
         QColor("#00897b"), QColor("#43a047"), QColor("#fdd835"), QColor("#fb8c00"),
         QColor("#6d4c41"), QColor("#546e7a"), QColor("#d81b60"), QColor("#00acc1"),
-    ]
+    )
 
     @staticmethod
     def build_cpu_tab(monitor: 'SystemMonitor') -> QWidget:
@@ -46,17 +46,45 @@ class CPUTabBuilder:
     
     @staticmethod
     def _build_per_core_charts(monitor: 'SystemMonitor', layout: QVBoxLayout) -> None:
-        """Build per-core CPU charts with frequency labels."""
+        """Reserve the scroll area for per-core charts.
+
+        The charts themselves are built by ensure_per_core_charts() the first
+        time the CPU tab is shown, so startup doesn't pay for one QChartView
+        per logical core while only the dashboard is visible.
+        """
+        # Frozen into tuples once built; the core count never changes
+        monitor.core_charts: Tuple[TimeSeriesChart, ...] = ()
+        monitor.core_freq_labels: Tuple[QLabel, ...] = ()
+        
+        monitor.cores_scroll = QScrollArea()
+        monitor.cores_scroll.setWidgetResizable(True)
+        monitor.cores_scroll.setFrameShape(QFrame.NoFrame)
+        layout.addWidget(monitor.cores_scroll)
+    
+    @staticmethod
+    def ensure_per_core_charts(monitor: 'SystemMonitor') -> bool:
+        """Build per-core CPU charts with frequency labels on first use.
+        
+        Returns:
+            True if the charts were built by this call
+        """
+        if monitor.core_charts:
+            return False
         n_cores = psutil.cpu_count(logical=True) or 1
-        monitor.core_charts: List[TimeSeriesChart] = []
-        monitor.core_freq_labels: List[QLabel] = []
+        # Seed the labels now; the metrics tick only re-reads clocks every second
+        try:
+            core_freqs = get_per_core_frequencies()
+        except Exception:
+            core_freqs = []
         
         cores_container = QWidget()
         cores_grid = QGridLayout(cores_container)
         cores_grid.setSpacing(8)
-        cols = min(4, max(1, int(math.sqrt(n_cores)) + 1))
-        
-        small_style = "QLabel { color: #b0b0b0; font-size: 8pt; }"
+        # Same layout as min(4, isqrt(n) + 1): 2 columns up to 3 cores, 3 up to 8, then 4
+        cols = 4 if n_cores >= 9 else (3 if n_cores >= 4 else 2)
+        colors = CPUTabBuilder.CORE_COLORS
+        charts: List[TimeSeriesChart] = []
+        labels: List[QLabel] = []
         
         for i in range(n_cores):
             core_container = QWidget()
@@ -64,40 +92,38 @@ class CPUTabBuilder:
             core_layout.setContentsMargins(0, 0, 0, 0)
             core_layout.setSpacing(2)
             
-            chart = TimeSeriesChart(f"CPU{i}", ["%"], max_points=200, y_range=(0, 100))
+            # Small per-core plots repaint every tick; skip antialiasing like sparklines
+            chart = TimeSeriesChart(f"CPU{i}", ["%"], max_points=200, y_range=(0, 100), antialias=False)
             if chart.series:
-                chart.series[0].setColor(CPUTabBuilder.CORE_COLORS[i % len(CPUTabBuilder.CORE_COLORS)])
+                chart.series[0].setColor(colors[i % len(colors)])
             chart.chart.legend().setVisible(False)
             chart.axis_x.setVisible(False)
             chart.axis_y.setVisible(False)
             chart.chart.setMargins(QMargins(4, 4, 4, 4))
-            monitor.core_charts.append(chart)
+            charts.append(chart)
             core_layout.addWidget(chart)
             
-            freq_label = QLabel("-- MHz")
-            freq_label.setStyleSheet(small_style)
+            freq_label = QLabel(f"{core_freqs[i]:.0f} MHz" if i < len(core_freqs) else "-- MHz")
+            freq_label.setObjectName("CoreFreq")
             freq_label.setAlignment(Qt.AlignCenter)
-            monitor.core_freq_labels.append(freq_label)
+            labels.append(freq_label)
             core_layout.addWidget(freq_label)
             
             r, c = divmod(i, cols)
             cores_grid.addWidget(core_container, r, c)
         
-        scroll = QScrollArea()
-        scroll.setWidget(cores_container)
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
-        layout.addWidget(scroll)
+        monitor.core_charts = tuple(charts)
+        monitor.core_freq_labels = tuple(labels)
+        monitor.cores_scroll.setWidget(cores_container)
+        return True
     
     @staticmethod
     def _build_summary_labels(monitor: 'SystemMonitor', layout: QVBoxLayout) -> None:
         """Build summary labels for processes/threads/asyncio."""
-        small_style = "QLabel { color: #b0b0b0; font-size: 9pt; }"
-        
         monitor.lbl_proc_summary = QLabel("")
         monitor.lbl_asyncio = QLabel("")
-        monitor.lbl_proc_summary.setStyleSheet(small_style)
-        monitor.lbl_asyncio.setStyleSheet(small_style)
+        monitor.lbl_proc_summary.setObjectName("Info")
+        monitor.lbl_asyncio.setObjectName("Info")
         
         summary_row = QHBoxLayout()
         summary_row.addWidget(monitor.lbl_proc_summary)
@@ -37,6 +37,13 @@ class DashboardBuilder:
         grid.addWidget(monitor.card_disk_write, 2, 1)
         grid.addWidget(monitor.card_gpu, 3, 0, 1, 2)
         
+        monitor.cards = [
+            monitor.card_cpu, monitor.card_mem,
+            monitor.card_net_up, monitor.card_net_down,
+            monitor.card_disk_read, monitor.card_disk_write,
+            monitor.card_gpu,
+        ]
+        
         return dashboard
     
     @staticmethod
@@ -73,9 +80,19 @@ class DashboardBuilder:
     def _create_gpu_card(monitor: 'SystemMonitor') -> None:
         """Create GPU metric card."""
         monitor.card_gpu = MetricCard("GPU", unit="%", is_percent=True, color="#7c4dff")
+        DashboardBuilder.update_gpu_card(monitor)
+    
+    @staticmethod
+    def update_gpu_card(monitor: 'SystemMonitor') -> None:
+        """Show the detected GPU model on the GPU card (or why there is none)."""
+        if not monitor.gpu_provider.ready.is_set():
+            monitor.card_gpu.set_unavailable("…")
+            monitor.card_gpu.set_tooltip("Detecting GPUs…")
+            return
         gpu_names = monitor.gpu_provider.gpu_names()
         if not gpu_names:
             monitor.card_gpu.set_unavailable("N/A")
             monitor.card_gpu.set_tooltip("No NVIDIA GPU detected")
         else:
             monitor.card_gpu.set_model(gpu_names[0])
+            monitor.card_gpu.set_tooltip("")
@@ -4,9 +4,12 @@
 
 from typing import TYPE_CHECKING
 
+from PySide6.QtCore import QSignalBlocker
 from PySide6.QtWidgets import QTreeWidgetItem
 
 from system_monitor.core.process_manager import ProcessManager
+from system_monitor.ui.cpu_tab_builder import CPUTabBuilder
+from system_monitor.ui.tab_index import TabIndex
 
 if TYPE_CHECKING:
     from system_monitor.app import SystemMonitor
@@ -24,14 +27,13 @@ class EventHandlers:
         monitor.unit_mode = mode
         monitor._bytes_per_unit = mapping[mode]
         
+        # QSignalBlocker unblocks even if setCurrentText raises
         if hasattr(monitor, "unit_combo_net") and monitor.unit_combo_net.currentText() != mode:
-            monitor.unit_combo_net.blockSignals(True)
-            monitor.unit_combo_net.setCurrentText(mode)
-            monitor.unit_combo_net.blockSignals(False)
+            with QSignalBlocker(monitor.unit_combo_net):
+                monitor.unit_combo_net.setCurrentText(mode)
         if hasattr(monitor, "unit_combo_disk") and monitor.unit_combo_disk.currentText() != mode:
-            monitor.unit_combo_disk.blockSignals(True)
-            monitor.unit_combo_disk.setCurrentText(mode)
-            monitor.unit_combo_disk.blockSignals(False)
+            with QSignalBlocker(monitor.unit_combo_disk):
+                monitor.unit_combo_disk.setCurrentText(mode)
         
         monitor.card_net_up.unit = mode
         monitor.card_net_down.unit = mode
@@ -44,6 +46,21 @@ class EventHandlers:
         monitor._disk_dyn_read = 1.0
         monitor._disk_dyn_write = 1.0
     
+    @staticmethod
+    def on_tab_changed(monitor: 'SystemMonitor', index: int) -> None:
+        """Suspend dashboard sparklines while another tab is shown; build lazy tabs."""
+        visible = index == TabIndex.DASHBOARD
+        for card in monitor.cards:
+            card.set_visible_updates(visible)
+        if index == TabIndex.CPU:
+            CPUTabBuilder.ensure_per_core_charts(monitor)
+        elif index == TabIndex.INFO and monitor._info_dirty:
+            monitor.refresh_info()
+        if index in (TabIndex.CPU, TabIndex.PROCESSES) and not monitor._procs_primed:
+            # Process scans were skipped while away; prime now rather than
+            # waiting a full process-timer interval
+            monitor.refresh_processes()
+    
     @staticmethod
     def on_interval_changed(monitor: 'SystemMonitor', val: int) -> None:
         """Handle update interval change."""
@@ -53,6 +70,16 @@ class EventHandlers:
             monitor.timer.setInterval(monitor.interval_ms)
             EventHandlers._update_window_title(monitor)
     
+    @staticmethod
+    def on_proc_refresh_changed(monitor: 'SystemMonitor', val: int) -> None:
+        """Handle process table refresh interval change."""
+        monitor.proc_timer.setInterval(max(1, int(val)))
+    
+    @staticmethod
+    def on_gpu_refresh_changed(monitor: 'SystemMonitor', val: int) -> None:
+        """Handle GPU refresh interval change."""
+        monitor.gpu_sampler.set_interval(max(1, int(val)) / 1000.0)
+    
     @staticmethod
     def toggle_pause(monitor: 'SystemMonitor') -> None:
         """Toggle pause/resume state."""
@@ -73,10 +100,11 @@ class EventHandlers:
     
     @staticmethod
     def on_proc_search_changed(monitor: 'SystemMonitor', text: str) -> None:
-        """Handle process search filter change."""
-        monitor._proc_filter = text.strip().lower()
-        if not monitor._paused:
-            ProcessManager.refresh_processes(monitor)
+        """Handle process search filter change (refresh is debounced)."""
+        # Kept as typed: a regex filter's escapes (\D vs \d) depend on case
+        monitor._proc_filter = text.strip()
+        # Restarting the single-shot timer coalesces a burst of keystrokes
+        monitor._search_debounce.start()
     
     @staticmethod
     def on_proc_item_expanded(monitor: 'SystemMonitor', item: QTreeWidgetItem) -> None:
@@ -4,10 +4,13 @@
 
 from typing import TYPE_CHECKING, Optional
 
+from PySide6.QtCore import QSignalBlocker
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
 
 from system_monitor.widgets import TimeSeriesChart
-from system_monitor.utils import get_gpu_temperatures
+from system_monitor.providers.gpu_provider import F_VRAM, F_TEMP
+from system_monitor.ui.chart_factory import ChartFactory
+from system_monitor.ui.tab_index import TabIndex
 
 if TYPE_CHECKING:
     from system_monitor.app import SystemMonitor
@@ -26,24 +29,49 @@ class GPUTabBuilder:
         gpu_l = QVBoxLayout(gpu_tab)
         gpu_l.addWidget(monitor.chart_gpu)
         
-        GPUTabBuilder._add_vram_chart(monitor, gpu_l, gpu_names)
-        GPUTabBuilder._add_temperature_chart(monitor, gpu_l, gpu_names)
+        # One pass over the GPUs for both VRAM totals and temperature support
+        snap = monitor.gpu_provider.sample_all(F_VRAM | F_TEMP)
+        GPUTabBuilder._add_vram_chart(monitor, gpu_l, gpu_names, snap.vram)
+        GPUTabBuilder._add_temperature_chart(monitor, gpu_l, gpu_names, snap.temps)
         GPUTabBuilder._add_info_label(monitor, gpu_l)
         
         return gpu_tab
     
     @staticmethod
-    def _build_no_gpu_tab() -> QWidget:
-        """Create placeholder tab when no GPU is available."""
+    def _build_no_gpu_tab(
+        message: str = "No NVIDIA GPU metrics available (pynvml/nvidia-smi not found).",
+    ) -> QWidget:
+        """Create placeholder tab when no GPU is available (or not yet detected)."""
         gpu_tab = QWidget()
         gpu_l = QVBoxLayout(gpu_tab)
-        gpu_l.addWidget(QLabel("No NVIDIA GPU metrics available (pynvml/nvidia-smi not found)."))
+        gpu_l.addWidget(QLabel(message))
         return gpu_tab
     
     @staticmethod
-    def _add_vram_chart(monitor: 'SystemMonitor', layout: QVBoxLayout, gpu_names: list) -> None:
+    def rebuild_gpu_tab(monitor: 'SystemMonitor') -> None:
+        """Replace the GPU tab once deferred GPU detection has finished."""
+        gpu_names = monitor.gpu_provider.gpu_names()
+        monitor.chart_gpu = ChartFactory.create_gpu_chart(gpu_names)
+        if monitor.chart_gpu:
+            gpu_tab = GPUTabBuilder.build_gpu_tab(monitor, gpu_names)
+        else:
+            gpu_tab = GPUTabBuilder._build_no_gpu_tab()
+            GPUTabBuilder.setup_no_gpu_fallback(monitor)
+        
+        # Keep the user's tab selection while the GPU page is swapped out
+        current = monitor.tabs.currentIndex()
+        with QSignalBlocker(monitor.tabs):
+            old = monitor.tabs.widget(TabIndex.GPU)
+            monitor.tabs.removeTab(TabIndex.GPU)
+            monitor.tabs.insertTab(TabIndex.GPU, gpu_tab, "GPU")
+            monitor.tabs.setCurrentIndex(current)
+        if old is not None:
+            old.deleteLater()
+    
+    @staticmethod
+    def _add_vram_chart(monitor: 'SystemMonitor', layout: QVBoxLayout, gpu_names: list,
+                        vram_info: list) -> None:
         """Add GPU VRAM usage chart with fixed y-axis."""
-        vram_info = monitor.gpu_provider.gpu_vram_info()
         max_vram = 1000.0
         if vram_info:
             max_vram = max((total_mb for _, total_mb in vram_info if total_mb > 0), default=1000.0)
@@ -58,9 +86,9 @@ class GPUTabBuilder:
         layout.addWidget(monitor.chart_gpu_vram)
     
     @staticmethod
-    def _add_temperature_chart(monitor: 'SystemMonitor', layout: QVBoxLayout, gpu_names: list) -> None:
+    def _add_temperature_chart(monitor: 'SystemMonitor', layout: QVBoxLayout, gpu_names: list,
+                               gpu_temps: list) -> None:
         """Add GPU temperature chart if temperatures are available."""
-        gpu_temps = get_gpu_temperatures(monitor.gpu_provider)
         if gpu_temps and any(t > 0 for t in gpu_temps):
             monitor.chart_gpu_temp = TimeSeriesChart(
                 "GPU Temperature (°C)",
@@ -77,7 +105,7 @@ class GPUTabBuilder:
     def _add_info_label(monitor: 'SystemMonitor', layout: QVBoxLayout) -> None:
         """Add GPU info label for additional metrics."""
         monitor.lbl_gpu_info = QLabel("")
-        monitor.lbl_gpu_info.setStyleSheet("QLabel { color: #b0b0b0; font-size: 9pt; padding: 8px; }")
+        monitor.lbl_gpu_info.setObjectName("GpuInfo")
         layout.addWidget(monitor.lbl_gpu_info)
     
     @staticmethod
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QLineEdit, QTreeWidget, QHeaderView, QTextEdit
+    QLineEdit, QTreeWidget, QHeaderView, QTextEdit, QPushButton
 )
 
 if TYPE_CHECKING:
@@ -62,18 +62,30 @@ class ProcessTabBuilder:
     def _init_process_state(monitor: 'SystemMonitor') -> None:
         """Initialize process filtering and refresh state."""
         monitor._proc_filter = ""
-        monitor._proc_refresh_accum = 0.0
         monitor._procs_primed = False
-        monitor._expanded_items = {}
+        monitor._coro_count = None
     
     @staticmethod
     def build_info_tab(monitor: 'SystemMonitor') -> QWidget:
-        """Create System Info tab."""
+        """Create System Info tab.
+        
+        The text is filled in the first time the tab is shown (see
+        EventHandlers.on_tab_changed) and on demand via the Refresh button.
+        """
         monitor.info_edit = QTextEdit()
         monitor.info_edit.setReadOnly(True)
+        monitor._info_dirty = True
+        
+        btn_row = QHBoxLayout()
+        btn_row.addStretch(1)
+        monitor.btn_info_refresh = QPushButton("Refresh")
+        monitor.btn_info_refresh.setToolTip("Re-read system information")
+        monitor.btn_info_refresh.clicked.connect(monitor.refresh_info)
+        btn_row.addWidget(monitor.btn_info_refresh)
         
         info_tab = QWidget()
         info_l = QVBoxLayout(info_tab)
+        info_l.addLayout(btn_row)
         info_l.addWidget(monitor.info_edit)
         
         return info_tab
@@ -0,0 +1,16 @@
+"""Tab indices for the SystemMonitor main tab widget."""
+
+#      Copyright (c) 2025 predator. All rights reserved.
+
+
+class TabIndex:
+    """Position of each tab in SystemMonitor.tabs (must match addTab order)."""
+
+    DASHBOARD = 0
+    CPU = 1
+    MEMORY = 2
+    NETWORK = 3
+    DISK = 4
+    GPU = 5
+    PROCESSES = 6
+    INFO = 7
@@ -35,7 +35,6 @@ class ToolbarBuilder:
     def _add_interval_controls(monitor: 'SystemMonitor', toolbar: QToolBar) -> None:
         """Add global update interval controls."""
         lbl = QLabel("Update interval (ms):")
-        lbl.setStyleSheet("QLabel { color: #b0b0b0; }")
         
         monitor.spin_interval = QSpinBox()
         monitor.spin_interval.setRange(1, 5000)
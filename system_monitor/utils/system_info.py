@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import platform
+import re
 import subprocess
 from typing import List, Tuple
 
@@ -16,6 +17,9 @@ except Exception as e:
 
 from .cache import cached_static_property
 
+# One "cpu MHz" line per logical core in /proc/cpuinfo (x86 Linux)
+_CPUINFO_MHZ_RE = re.compile(rb"^cpu MHz\s*:\s*([\d.]+)", re.MULTILINE)
+
 
 @cached_static_property('cpu_model_name')
 def get_cpu_model_name() -> str:
@@ -79,6 +83,18 @@ def get_cpu_model_name() -> str:
 def get_per_core_frequencies() -> List[float]:
     """Get per-core CPU frequencies in MHz. Returns empty list if not available."""
     try:
+        # Linux: a single /proc/cpuinfo read covers every core, instead of one
+        # scaling_cur_freq open+read per core
+        if platform.system() == "Linux":
+            try:
+                with open("/proc/cpuinfo", "rb") as f:
+                    data = f.read()
+                mhz = _CPUINFO_MHZ_RE.findall(data)
+                if mhz:
+                    return [float(m) for m in mhz]
+            except Exception:
+                pass
+        
         # Try psutil per-core frequencies (supported on some systems)
         if hasattr(psutil, 'cpu_freq') and callable(psutil.cpu_freq):
             freq = psutil.cpu_freq(percpu=True)
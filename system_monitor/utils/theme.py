@@ -53,6 +53,13 @@ def apply_dark_theme(app: QApplication) -> None:
             color: #ffffff;
             letter-spacing: 0.3px;
         }
+        QLabel#CardFrequency { color: #909090; font-size: 9pt; }
+        QLabel#CardModel { color: #808080; font-size: 8pt; font-style: italic; }
+        
+        /* Secondary info labels in tabs */
+        QLabel#Info { color: #b0b0b0; font-size: 9pt; }
+        QLabel#CoreFreq { color: #b0b0b0; font-size: 8pt; }
+        QLabel#GpuInfo { color: #b0b0b0; font-size: 9pt; padding: 8px; }
         
         /* Enhanced progress bars */
         QProgressBar { 
@@ -34,6 +34,12 @@ class MetricCard(QWidget):
         self.unit = unit
         self.color = color
         self._dyn_max: float = 10.0 if not is_percent else 100.0
+        # Bar color the chunk style sheet currently holds (re-parsing QSS is costly)
+        self._bar_color: str = color
+        self._update_spark = True
+        # Last value text / bar position pushed to Qt; unchanged ticks skip them
+        self._last_text: str = ""
+        self._last_pct: int = -1
 
         outer = QVBoxLayout(self)
         outer.setContentsMargins(0, 0, 0, 0)
@@ -53,14 +59,12 @@ class MetricCard(QWidget):
         v.addWidget(self.lbl_value)
 
         self.lbl_frequency = QLabel("")
-        self.lbl_frequency.setStyleSheet("QLabel { color: #909090; font-size: 9pt; }")
+        self.lbl_frequency.setObjectName("CardFrequency")
         self.lbl_frequency.setVisible(False)
         v.addWidget(self.lbl_frequency)
 
         self.lbl_model = QLabel("")
-        self.lbl_model.setStyleSheet(
-            "QLabel { color: #808080; font-size: 8pt; font-style: italic; }"
-        )
+        self.lbl_model.setObjectName("CardModel")
         self.lbl_model.setWordWrap(True)
         self.lbl_model.setVisible(False)
         v.addWidget(self.lbl_model)
@@ -82,6 +86,8 @@ class MetricCard(QWidget):
                 max_points=max_points,
                 y_range=(0, 100 if is_percent else 1),
                 auto_scale=(not is_percent),
+                # A few-pixel-high line gains nothing from antialiasing
+                antialias=False,
             )
             self.sparkline.chart.legend().setVisible(False)
             self.sparkline.chart.setTitle("")
@@ -93,6 +99,12 @@ class MetricCard(QWidget):
         sp = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
         self.setSizePolicy(sp)
 
+    def set_visible_updates(self, enabled: bool) -> None:
+        """Enable or suspend sparkline updates (e.g. while the dashboard is hidden)."""
+        self._update_spark = enabled
+        if self.sparkline is not None:
+            self.sparkline.setUpdatesEnabled(enabled)
+
     def set_tooltip(self, text: str) -> None:
         self.setToolTip(text)
         self.frame.setToolTip(text)
@@ -100,8 +112,16 @@ class MetricCard(QWidget):
         self.lbl_title.setToolTip(text)
 
     def set_unavailable(self, message: str = "N/A") -> None:
-        self.lbl_value.setText(message)
-        self.bar.setValue(0)
+        self._set_display(message, 0)
+
+    def _set_display(self, text: str, pct: int) -> None:
+        """Push value text and bar position to Qt only when they changed."""
+        if text != self._last_text:
+            self._last_text = text
+            self.lbl_value.setText(text)
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self.bar.setValue(pct)
 
     def set_frequency(self, freq_mhz: float) -> None:
         """Set frequency display in MHz."""
@@ -125,23 +145,21 @@ class MetricCard(QWidget):
             pct_f = max(0.0, min(100.0, float(pct)))
         except Exception:
             pct_f = 0.0
-        self.lbl_value.setText(f"{pct_f:.1f} %")
-        self.bar.setValue(int(round(pct_f)))
+        self._set_display(f"{pct_f:.1f} %", int(round(pct_f)))
 
         if pct_f >= 90.0:
-            self.bar.setStyleSheet(
-                "QProgressBar::chunk{background-color:#f44336; border-radius:6px;}"
-            )
+            bar_color = "#f44336"
         elif pct_f >= 80.0:
-            self.bar.setStyleSheet(
-                "QProgressBar::chunk{background-color:#ff9800; border-radius:6px;}"
-            )
+            bar_color = "#ff9800"
         else:
+            bar_color = self.color
+        if bar_color != self._bar_color:
+            self._bar_color = bar_color
             self.bar.setStyleSheet(
-                f"QProgressBar::chunk{{background-color:{self.color}; border-radius:6px;}}"
+                f"QProgressBar::chunk{{background-color:{bar_color}; border-radius:6px;}}"
             )
 
-        if self.sparkline is not None:
+        if self.sparkline is not None and self._update_spark:
             self.sparkline.append([pct_f])
 
     def update_value(self, value: float, ref_max: Optional[float] = None) -> None:
@@ -149,7 +167,6 @@ class MetricCard(QWidget):
             v = float(value)
         except Exception:
             v = 0.0
-        self.lbl_value.setText(f"{v:.2f} {self.unit}".strip())
         if self.is_percent:
             m = 100.0
         else:
@@ -161,6 +178,6 @@ class MetricCard(QWidget):
         pct = (
             int(round(max(0.0, min(100.0, (v / m) * 100.0)))) if m > 0 else 0
         )
-        self.bar.setValue(pct)
-        if self.sparkline is not None:
+        self._set_display(f"{v:.2f} {self.unit}".strip(), pct)
+        if self.sparkline is not None and self._update_spark:
             self.sparkline.append([v])
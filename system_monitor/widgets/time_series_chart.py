@@ -4,15 +4,37 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Tuple
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 
-from PySide6.QtCore import Qt, QPointF, QMargins
+from PySide6.QtCore import Qt, QMargins
 from PySide6.QtGui import QPainter
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
 from PySide6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis
 
 
 class TimeSeriesChart(QWidget):
+    """Rolling line chart with one QLineSeries per metric.
+
+    Each series keeps at most ``max_points`` samples (a few hundred at most),
+    which is already within what QtCharts can draw per frame, so no
+    decimation is applied before handing points to Qt. New samples are pushed
+    one point at a time with append(x, y) (no QPointF is built in Python) and
+    the oldest dropped with removePoints(), so only a single point crosses
+    into Qt per tick instead of the whole window. (Rewriting the window with
+    replace() and a preallocated QPolygonF would copy all ``max_points``
+    points every tick, so it only pays off for bulk loads, which never happen
+    here.)
+
+    Once the window is full the x axis advances in steps of ``AXIS_X_STEP``
+    samples (with that much slack on the right) rather than on every tick, so
+    the axis is only re-laid out when its range actually changes. Auto-scaled
+    y axes likewise ignore window-maximum moves within ``Y_RESCALE_TOLERANCE``.
+    """
+
+    AXIS_X_STEP = 16
+    Y_RESCALE_TOLERANCE = 0.1
+
     def __init__(
         self,
         title: str,
@@ -20,6 +42,7 @@ class TimeSeriesChart(QWidget):
         max_points: int = 400,
         y_range: Optional[Tuple[float, float]] = (0.0, 100.0),
         auto_scale: bool = False,
+        antialias: bool = True,
     ) -> None:
         super().__init__()
         self.max_points = max_points
@@ -46,6 +69,7 @@ class TimeSeriesChart(QWidget):
         self.axis_x = QValueAxis()
         self.axis_x.setTitleText("Samples")
         self.axis_x.setRange(0, max_points)
+        self._axis_x_range: Tuple[int, int] = (0, max_points)
         self.axis_x.setTickCount(6)
         self.chart.addAxis(self.axis_x, Qt.AlignBottom)
         for s in self.series:
@@ -63,12 +87,17 @@ class TimeSeriesChart(QWidget):
             s.attachAxis(self.axis_y)
 
         self.view = QChartView(self.chart)
-        self.view.setRenderHint(QPainter.Antialiasing, True)
+        self.view.setRenderHint(QPainter.Antialiasing, antialias)
         self.view.setRubberBand(QChartView.RectangleRubberBand)
         self.view.setStyleSheet("background-color: transparent;")
         layout.addWidget(self.view)
 
-        self._buffers: List[List[QPointF]] = [[] for _ in self.series]
+        # Monotonic (x, y) deques per series: the front is the window maximum,
+        # so auto-scaling never rescans the whole window
+        self._max_q: List[Deque[Tuple[int, float]]] = [deque() for _ in self.series]
+        self._y_max: Optional[float] = None
+        # Points held by each series, tracked here to avoid a count() call per tick
+        self._counts: List[int] = [0] * len(self.series)
 
         sp = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.setSizePolicy(sp)
@@ -76,21 +105,39 @@ class TimeSeriesChart(QWidget):
     def append(self, values: List[float]) -> None:
         n = min(len(values), len(self.series))
         self._x += 1
-        x0 = max(0, self._x - self.max_points)
+        x = float(self._x)
         for i in range(n):
-            buf = self._buffers[i]
-            buf.append(QPointF(float(self._x), float(values[i])))
-            if len(buf) > self.max_points:
-                del buf[: len(buf) - self.max_points]
-            self.series[i].replace(buf)
-
-        self.axis_x.setRange(x0, x0 + self.max_points)
+            y = float(values[i])
+            if self.auto_scale:
+                q = self._max_q[i]
+                while q and q[-1][1] <= y:
+                    q.pop()
+                q.append((self._x, y))
+                if q[0][0] <= self._x - self.max_points:
+                    q.popleft()
+            s = self.series[i]
+            s.append(x, y)
+            if self._counts[i] < self.max_points:
+                self._counts[i] += 1
+            else:
+                s.removePoints(0, 1)
+
+        x0 = self._x - self.max_points
+        if x0 > 0:
+            start = (x0 // self.AXIS_X_STEP) * self.AXIS_X_STEP
+            x_range = (start, start + self.max_points + self.AXIS_X_STEP)
+            if x_range != self._axis_x_range:
+                self._axis_x_range = x_range
+                self.axis_x.setRange(*x_range)
 
         if self.auto_scale:
             current_max = 1.0
-            for buf in self._buffers:
-                if buf:
-                    m = max(p.y() for p in buf)
-                    if m > current_max:
-                        current_max = m
-            self.axis_y.setRange(0, current_max * 1.2)
+            for q in self._max_q:
+                if q and q[0][1] > current_max:
+                    current_max = q[0][1]
+            # Rescale only on a >10% move; the 20% headroom still fits values
+            # up to 10% above the last scaled max
+            last = self._y_max
+            if last is None or abs(current_max - last) > last * self.Y_RESCALE_TOLERANCE:
+                self._y_max = current_max
+                self.axis_y.setRange(0, current_max * 1.2)
@@ -0,0 +1,92 @@
+"""Tests for GpuSampler class."""
+
+#      Copyright (c) 2025 predator. All rights reserved.
+
+import time
+from unittest.mock import MagicMock
+
+
+def _provider():
+    from system_monitor.providers.gpu_provider import GpuSnapshot
+
+    provider = MagicMock()
+    provider.sample_all.return_value = GpuSnapshot(
+        utils=[50.0], freqs=[1500.0], vram=[(2000.0, 4000.0)], temps=[65.0]
+    )
+    return provider
+
+
+class TestGpuSampler:
+    """Test GpuSampler class."""
+
+    def test_sample_delegates_to_provider(self):
+        """Test sample takes one batched snapshot from the provider."""
+        from system_monitor.core.gpu_sampler import GpuSampler
+        from system_monitor.providers.gpu_provider import F_ALL
+
+        provider = _provider()
+        snap = GpuSampler(provider).sample()
+
+        provider.sample_all.assert_called_once_with(F_ALL)
+        assert snap.utils == [50.0]
+        assert snap.temps == [65.0]
+
+    def test_latest_none_before_start(self):
+        """Test latest returns None before the first sample."""
+        from system_monitor.core.gpu_sampler import GpuSampler
+
+        assert GpuSampler(_provider()).latest() is None
+
+    def test_start_publishes_snapshot_and_shutdown(self):
+        """Test the worker thread publishes snapshots and stops on shutdown."""
+        from system_monitor.core.gpu_sampler import GpuSampler
+
+        sampler = GpuSampler(_provider(), interval_s=0.01)
+        sampler.start()
+        try:
+            deadline = time.monotonic() + 2.0
+            while sampler.latest() is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert sampler.latest() is not None
+            assert sampler.latest().utils == [50.0]
+        finally:
+            sampler.shutdown()
+
+        assert sampler._thread is None
+
+    def test_set_interval_clamps(self):
+        """Test set_interval stores seconds with a lower bound."""
+        from system_monitor.core.gpu_sampler import GpuSampler
+
+        sampler = GpuSampler(_provider())
+        sampler.set_interval(0.5)
+        assert sampler._interval == 0.5
+        sampler.set_interval(0)
+        assert sampler._interval == 0.01
+
+    def test_set_fields_used_by_next_sample(self):
+        """Test set_fields narrows the fields passed to the provider."""
+        from system_monitor.core.gpu_sampler import GpuSampler
+        from system_monitor.providers.gpu_provider import F_UTIL
+
+        provider = _provider()
+        sampler = GpuSampler(provider)
+        sampler.set_fields(F_UTIL)
+        sampler.sample()
+
+        provider.sample_all.assert_called_once_with(F_UTIL)
+
+    def test_no_fields_pauses_sampling(self):
+        """Test the worker does not query the provider while no fields are selected."""
+        from system_monitor.core.gpu_sampler import GpuSampler
+
+        provider = _provider()
+        sampler = GpuSampler(provider, interval_s=0.01)
+        sampler.set_fields(0)
+        sampler.start()
+        try:
+            time.sleep(0.05)
+            provider.sample_all.assert_not_called()
+            assert sampler.latest() is None
+        finally:
+            sampler.shutdown()
@@ -264,17 +264,28 @@ class TestMetricsCollector:
         assert collector._executor._shutdown
 
     @patch('system_monitor.core.metrics_collector.psutil')
-    def test_del(self, mock_psutil):
-        """Test __del__ method."""
+    def test_finalizer_shuts_down_executor(self, mock_psutil):
+        """Test an unreleased collector's executor is shut down by its finalizer."""
         from system_monitor.core.metrics_collector import MetricsCollector
         
         collector = MetricsCollector()
-        # Call __del__ explicitly
-        collector.__del__()
+        assert collector._finalizer.alive
         
-        # Should not raise exception
+        collector._finalizer()
+        
+        assert not collector._finalizer.alive
         assert collector._executor._shutdown
 
+    @patch('system_monitor.core.metrics_collector.psutil')
+    def test_shutdown_detaches_finalizer(self, mock_psutil):
+        """Test an explicit shutdown leaves nothing for the finalizer to do."""
+        from system_monitor.core.metrics_collector import MetricsCollector
+        
+        collector = MetricsCollector()
+        collector.shutdown()
+        
+        assert not collector._finalizer.alive
+
     @patch('system_monitor.core.metrics_collector.psutil')
     def test_collect_all_with_errors(self, mock_psutil):
         """Test collect_all handles partial failures."""
@@ -298,3 +309,43 @@ class TestMetricsCollector:
         assert 'disk' in results
         
         collector.shutdown()
+
+    @patch('system_monitor.core.metrics_collector.psutil')
+    def test_collect_all_runs_inline(self, mock_psutil):
+        """Test collect_all reads on the calling thread without the executor."""
+        from system_monitor.core.metrics_collector import MetricsCollector
+        
+        collector = MetricsCollector()
+        with patch.object(collector._executor, 'submit') as mock_submit:
+            results = collector.collect_all()
+        
+        mock_submit.assert_not_called()
+        assert len(results) == 6
+        assert results['memory'] is mock_psutil.virtual_memory.return_value
+        
+        collector.shutdown()
+
+    @patch('system_monitor.core.metrics_collector.psutil')
+    def test_collect_cpu_single_percpu_read(self, mock_psutil):
+        """Test the overall CPU figure is the per-core mean from one read."""
+        from system_monitor.core.metrics_collector import MetricsCollector
+        
+        mock_psutil.cpu_percent.return_value = [25.0, 75.0]
+        collector = MetricsCollector()
+        
+        assert collector._collect_cpu() == (50.0, [25.0, 75.0])
+        mock_psutil.cpu_percent.assert_called_once_with(interval=None, percpu=True)
+        
+        collector.shutdown()
+
+    @patch('system_monitor.core.metrics_collector.psutil')
+    def test_collect_cpu_falls_back_to_total(self, mock_psutil):
+        """Test the overall read is used when per-core data is unavailable."""
+        from system_monitor.core.metrics_collector import MetricsCollector
+        
+        mock_psutil.cpu_percent.side_effect = [Exception("percpu"), 40.0]
+        collector = MetricsCollector()
+        
+        assert collector._collect_cpu() == (40.0, [])
+        
+        collector.shutdown()
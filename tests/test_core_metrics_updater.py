@@ -3,7 +3,7 @@
 #      Copyright (c) 2025 predator. All rights reserved.
 
 import pytest
-from unittest.mock import MagicMock, patch, Mock
+from unittest.mock import MagicMock, patch
 import math
 
 
@@ -12,6 +12,8 @@ class TestMetricsUpdater:
 
     def setup_method(self):
         """Setup mock monitor for each test."""
+        from system_monitor.core.metrics_updater import MetricsUpdater
+        MetricsUpdater._failed_streams.clear()
         self.monitor = MagicMock()
         self.monitor.tabs = MagicMock()
         self.monitor.card_cpu = MagicMock()
@@ -31,55 +33,109 @@ class TestMetricsUpdater:
         self.monitor._net_dyn_down = 1.0
         self.monitor._disk_dyn_read = 1.0
         self.monitor._disk_dyn_write = 1.0
-        self.monitor._gpu_refresh_accum = 0.0
-        self.monitor._proc_refresh_accum = 0.0
+        self.monitor._freq_accum_ms = 1000.0
+        self.monitor.sensor_collector = MagicMock()
+        self.monitor.sensor_collector.get_result.return_value = None
+        self.monitor._gpu_snapshot = None
+        self.monitor.gpu_sampler = MagicMock()
         self.monitor.gpu_provider = MagicMock()
         self.monitor.spin_gpu_refresh = MagicMock()
         self.monitor.spin_proc_refresh = MagicMock()
         self.monitor.lbl_gpu_info = MagicMock()
 
-    @patch('system_monitor.core.metrics_updater.MetricsUpdater._update_processes')
     @patch('system_monitor.core.metrics_updater.MetricsUpdater._update_gpu')
     @patch('system_monitor.core.metrics_updater.MetricsUpdater._update_disk')
     @patch('system_monitor.core.metrics_updater.MetricsUpdater._update_network')
     @patch('system_monitor.core.metrics_updater.MetricsUpdater._update_memory')
     @patch('system_monitor.core.metrics_updater.MetricsUpdater._update_cpu')
     def test_update_all_metrics_calls_all_methods(self, mock_cpu, mock_mem, mock_net, 
-                                                   mock_disk, mock_gpu, mock_proc):
+                                                   mock_disk, mock_gpu):
         """Test update_all_metrics calls all update methods."""
         from system_monitor.core.metrics_updater import MetricsUpdater
         
         dt = 0.1
+        self.monitor.tabs.currentIndex.return_value = 0
         MetricsUpdater.update_all_metrics(self.monitor, dt)
         
-        mock_cpu.assert_called_once_with(self.monitor, dt)
-        mock_mem.assert_called_once_with(self.monitor)
-        mock_net.assert_called_once_with(self.monitor, dt)
-        mock_disk.assert_called_once_with(self.monitor, dt)
-        mock_gpu.assert_called_once_with(self.monitor, dt)
-        mock_proc.assert_called_once_with(self.monitor, dt)
+        self.monitor.tabs.currentIndex.assert_called_once()
+        mock_cpu.assert_called_once_with(self.monitor, dt, 0)
+        mock_mem.assert_called_once_with(self.monitor, 0)
+        # Network and disk share one decay factor computed per tick
+        alpha = math.exp(-dt / MetricsUpdater.DYN_MAX_TAU_S)
+        scale = 1.0 / (dt * self.monitor._bytes_per_unit)
+        mock_net.assert_called_once_with(self.monitor, dt, 0, alpha, scale)
+        mock_disk.assert_called_once_with(self.monitor, dt, 0, alpha, scale)
+        mock_gpu.assert_called_once_with(self.monitor, dt, 0)
+
+    @patch('system_monitor.core.metrics_updater.MetricsUpdater._update_gpu')
+    @patch('system_monitor.core.metrics_updater.MetricsUpdater._update_memory')
+    @patch('system_monitor.core.metrics_updater.MetricsUpdater._update_cpu')
+    def test_update_all_metrics_isolates_failures(self, mock_cpu, mock_mem, mock_gpu):
+        """Test one failing metric source does not stop the remaining updates."""
+        from system_monitor.core.metrics_updater import MetricsUpdater
+        
+        mock_cpu.side_effect = RuntimeError("psutil failure")
+        self.monitor.tabs.currentIndex.return_value = 2
+        
+        MetricsUpdater.update_all_metrics(self.monitor, 0.1)
+        
+        mock_mem.assert_called_once_with(self.monitor, 2)
+        mock_gpu.assert_called_once_with(self.monitor, 0.1, 2)
+
+    @patch('system_monitor.core.metrics_updater.MetricsUpdater._update_gpu')
+    @patch('system_monitor.core.metrics_updater.MetricsUpdater._update_memory')
+    @patch('system_monitor.core.metrics_updater.MetricsUpdater._update_cpu')
+    def test_update_all_metrics_logs_first_failure_per_stream(self, mock_cpu, mock_mem, mock_gpu, caplog):
+        """Test a failing stream is logged once, not on every tick."""
+        from system_monitor.core.metrics_updater import MetricsUpdater
+        
+        mock_cpu.side_effect = AttributeError("typo")
+        self.monitor.tabs.currentIndex.return_value = 2
+        
+        with caplog.at_level('ERROR', logger='system_monitor.core.metrics_updater'):
+            MetricsUpdater.update_all_metrics(self.monitor, 0.1)
+            MetricsUpdater.update_all_metrics(self.monitor, 0.1)
+        
+        assert len(caplog.records) == 1
+        assert 'cpu' in caplog.records[0].getMessage()
+        assert caplog.records[0].exc_info[0] is AttributeError
 
     @patch('system_monitor.core.metrics_updater.psutil')
     def test_update_cpu_basic(self, mock_psutil):
         """Test basic CPU update."""
         from system_monitor.core.metrics_updater import MetricsUpdater
+        from system_monitor.core.sensor_collector import SensorReadings
         
         mock_psutil.cpu_percent.return_value = 45.5
-        mock_psutil.cpu_freq.return_value = MagicMock(current=2400.0)
+        self.monitor.sensor_collector.get_result.return_value = SensorReadings(cpu_freq=2400.0)
         self.monitor.tabs.currentIndex.return_value = 0  # Not on CPU tab
         
         MetricsUpdater._update_cpu(self.monitor, 0.1)
         
         self.monitor.card_cpu.update_percent.assert_called_once_with(45.5)
         self.monitor.card_cpu.set_frequency.assert_called_once_with(2400.0)
+        mock_psutil.cpu_freq.assert_not_called()
+
+    @patch('system_monitor.core.metrics_updater.psutil')
+    def test_update_cpu_dashboard_uses_percpu_mean(self, mock_psutil):
+        """Test the dashboard card shows the mean of a single per-core read."""
+        from system_monitor.core.metrics_updater import MetricsUpdater
+        
+        mock_psutil.cpu_percent.return_value = [10.0, 30.0]
+        
+        MetricsUpdater._update_cpu(self.monitor, 0.1, 0)
+        
+        mock_psutil.cpu_percent.assert_called_once_with(interval=None, percpu=True)
+        self.monitor.card_cpu.update_percent.assert_called_once_with(20.0)
 
     @patch('system_monitor.core.metrics_updater.psutil')
     def test_update_cpu_no_frequency(self, mock_psutil):
         """Test CPU update when frequency is not available."""
         from system_monitor.core.metrics_updater import MetricsUpdater
+        from system_monitor.core.sensor_collector import SensorReadings
         
         mock_psutil.cpu_percent.return_value = 50.0
-        mock_psutil.cpu_freq.return_value = None
+        self.monitor.sensor_collector.get_result.return_value = SensorReadings()
         self.monitor.tabs.currentIndex.return_value = 0
         
         MetricsUpdater._update_cpu(self.monitor, 0.1)
@@ -88,46 +144,53 @@ class TestMetricsUpdater:
         self.monitor.card_cpu.set_frequency.assert_not_called()
 
     @patch('system_monitor.core.metrics_updater.psutil')
-    def test_update_cpu_frequency_exception(self, mock_psutil):
-        """Test CPU update handles frequency exception."""
+    def test_update_cpu_no_pending_reading(self, mock_psutil):
+        """Test CPU update leaves the clock alone until a sensor read completes."""
         from system_monitor.core.metrics_updater import MetricsUpdater
         
         mock_psutil.cpu_percent.return_value = 50.0
-        mock_psutil.cpu_freq.side_effect = Exception("Freq error")
         self.monitor.tabs.currentIndex.return_value = 0
         
         MetricsUpdater._update_cpu(self.monitor, 0.1)
         
         self.monitor.card_cpu.update_percent.assert_called_once_with(50.0)
+        self.monitor.card_cpu.set_frequency.assert_not_called()
+        self.monitor.sensor_collector.collect_async.assert_called_once_with(per_core=False)
 
-    @patch('system_monitor.core.metrics_updater.get_per_core_frequencies')
     @patch('system_monitor.core.metrics_updater.psutil')
-    def test_update_cpu_on_cpu_tab(self, mock_psutil, mock_get_freqs):
+    def test_update_cpu_on_cpu_tab(self, mock_psutil):
         """Test CPU update when on CPU tab with per-core data."""
         from system_monitor.core.metrics_updater import MetricsUpdater
+        from system_monitor.core.sensor_collector import SensorReadings
         
-        mock_psutil.cpu_percent.side_effect = [45.5, [10.0, 20.0, 30.0, 40.0]]
+        mock_psutil.cpu_percent.return_value = [10.0, 20.0, 30.0, 40.0]
         self.monitor.tabs.currentIndex.return_value = 1  # CPU tab
         self.monitor.core_charts = [MagicMock(), MagicMock(), MagicMock()]
         self.monitor.core_freq_labels = [MagicMock(), MagicMock(), MagicMock()]
-        mock_get_freqs.return_value = [2400.0, 2500.0, 2600.0]
+        self.monitor.sensor_collector.get_result.return_value = SensorReadings(
+            core_freqs=[2400.0, 2500.0, 2600.0]
+        )
         
         MetricsUpdater._update_cpu(self.monitor, 0.1)
         
-        self.monitor.chart_cpu.append.assert_called_once_with([45.5])
+        # Total is derived from the single per-core read
+        mock_psutil.cpu_percent.assert_called_once_with(interval=None, percpu=True)
+        self.monitor.chart_cpu.append.assert_called_once_with([25.0])
+        self.monitor.card_cpu.update_percent.assert_not_called()
         self.monitor.core_charts[0].append.assert_called_once_with([10.0])
         self.monitor.core_charts[1].append.assert_called_once_with([20.0])
         self.monitor.core_charts[2].append.assert_called_once_with([30.0])
         self.monitor.core_freq_labels[0].setText.assert_called_once_with("2400 MHz")
         self.monitor.core_freq_labels[1].setText.assert_called_once_with("2500 MHz")
         self.monitor.core_freq_labels[2].setText.assert_called_once_with("2600 MHz")
+        self.monitor.sensor_collector.collect_async.assert_called_once_with(per_core=True)
 
     @patch('system_monitor.core.metrics_updater.psutil')
     def test_update_cpu_on_cpu_tab_no_cores(self, mock_psutil):
         """Test CPU update on CPU tab when per-core data is not available."""
         from system_monitor.core.metrics_updater import MetricsUpdater
         
-        mock_psutil.cpu_percent.side_effect = [45.5, []]
+        mock_psutil.cpu_percent.side_effect = [[], 45.5]
         self.monitor.tabs.currentIndex.return_value = 1
         
         MetricsUpdater._update_cpu(self.monitor, 0.1)
@@ -139,28 +202,61 @@ class TestMetricsUpdater:
         """Test CPU update handles per-core exception."""
         from system_monitor.core.metrics_updater import MetricsUpdater
         
-        mock_psutil.cpu_percent.side_effect = [45.5, Exception("Core error")]
+        mock_psutil.cpu_percent.side_effect = [Exception("Core error"), 45.5]
         self.monitor.tabs.currentIndex.return_value = 1
         
         MetricsUpdater._update_cpu(self.monitor, 0.1)
         
         self.monitor.chart_cpu.append.assert_called_once_with([45.5])
 
-    @patch('system_monitor.core.metrics_updater.get_per_core_frequencies')
     @patch('system_monitor.core.metrics_updater.psutil')
-    def test_update_cpu_freq_labels_exception(self, mock_psutil, mock_get_freqs):
-        """Test CPU update handles frequency label exception."""
+    def test_update_cpu_reading_without_core_freqs(self, mock_psutil):
+        """Test a reading taken for the dashboard leaves per-core labels untouched."""
         from system_monitor.core.metrics_updater import MetricsUpdater
+        from system_monitor.core.sensor_collector import SensorReadings
         
-        mock_psutil.cpu_percent.side_effect = [45.5, [10.0, 20.0]]
+        mock_psutil.cpu_percent.return_value = [10.0, 20.0]
         self.monitor.tabs.currentIndex.return_value = 1
         self.monitor.core_charts = [MagicMock(), MagicMock()]
         self.monitor.core_freq_labels = [MagicMock(), MagicMock()]
-        mock_get_freqs.side_effect = Exception("Freq error")
+        self.monitor.sensor_collector.get_result.return_value = SensorReadings(cpu_freq=2400.0)
         
         MetricsUpdater._update_cpu(self.monitor, 0.1)
         
         self.monitor.chart_cpu.append.assert_called_once()
+        self.monitor.core_freq_labels[0].setText.assert_not_called()
+
+    @patch('system_monitor.core.metrics_updater.psutil')
+    def test_update_cpu_frequency_throttled(self, mock_psutil):
+        """Test clock reads are queued only once FREQ_REFRESH_MS has elapsed."""
+        from system_monitor.core.metrics_updater import MetricsUpdater
+        
+        mock_psutil.cpu_percent.return_value = 10.0
+        collect = self.monitor.sensor_collector.collect_async
+        
+        MetricsUpdater._update_cpu(self.monitor, 0.1, 0)
+        MetricsUpdater._update_cpu(self.monitor, 0.1, 0)
+        assert collect.call_count == 1
+        
+        MetricsUpdater._update_cpu(self.monitor, 0.9, 0)
+        assert collect.call_count == 2
+        
+        # The CPU tab shares the same accumulator for per-core clocks
+        mock_psutil.cpu_percent.return_value = [10.0]
+        MetricsUpdater._update_cpu(self.monitor, 0.1, 1)
+        assert collect.call_count == 2
+        mock_psutil.cpu_freq.assert_not_called()
+
+    @patch('system_monitor.core.metrics_updater.psutil')
+    def test_update_cpu_other_tab_skips_read(self, mock_psutil):
+        """Test CPU usage is not sampled when neither CPU view is visible."""
+        from system_monitor.core.metrics_updater import MetricsUpdater
+        
+        self.monitor.tabs.currentIndex.return_value = 2
+        
+        MetricsUpdater._update_cpu(self.monitor, 0.1)
+        
+        mock_psutil.cpu_percent.assert_not_called()
 
     @patch('system_monitor.core.metrics_updater.psutil')
     def test_update_memory_basic(self, mock_psutil):
@@ -187,9 +283,50 @@ class TestMetricsUpdater:
         
         MetricsUpdater._update_memory(self.monitor)
         
-        self.monitor.card_mem.update_percent.assert_called_once_with(70.0)
+        # Dashboard card is hidden while on the memory tab
+        self.monitor.card_mem.update_percent.assert_not_called()
         self.monitor.chart_mem.append.assert_called_once_with([70.0])
 
+    @patch('system_monitor.core.metrics_updater.psutil')
+    def test_update_memory_other_tab_skips_read(self, mock_psutil):
+        """Test memory is not sampled when neither memory view is visible."""
+        from system_monitor.core.metrics_updater import MetricsUpdater
+        
+        MetricsUpdater._update_memory(self.monitor, 6)  # Processes tab
+        
+        mock_psutil.virtual_memory.assert_not_called()
+        self.monitor.card_mem.update_percent.assert_not_called()
+        self.monitor.chart_mem.append.assert_not_called()
+
+    @patch('system_monitor.core.metrics_updater.psutil')
+    def test_update_network_cards_skipped_off_dashboard(self, mock_psutil):
+        """Test network counters are not read when no network view is shown."""
+        from system_monitor.core.metrics_updater import MetricsUpdater
+        
+        self.monitor._last_net = MagicMock(bytes_sent=1000, bytes_recv=2000)
+        
+        MetricsUpdater._update_network(self.monitor, 1.0, 2)
+        
+        mock_psutil.net_io_counters.assert_not_called()
+        self.monitor.card_net_up.update_value.assert_not_called()
+        self.monitor.chart_net.append.assert_not_called()
+        # Baseline dropped so the next visible tick re-primes
+        assert self.monitor._last_net is None
+
+    @patch('system_monitor.core.metrics_updater.psutil')
+    def test_update_network_reprimes_after_hidden(self, mock_psutil):
+        """Test the first network tick after being hidden only stores the baseline."""
+        from system_monitor.core.metrics_updater import MetricsUpdater
+        
+        self.monitor._last_net = None
+        current_net = MagicMock(bytes_sent=2000, bytes_recv=4000)
+        mock_psutil.net_io_counters.return_value = current_net
+        
+        MetricsUpdater._update_network(self.monitor, 1.0, 0)
+        
+        assert self.monitor._last_net == current_net
+        self.monitor.card_net_up.update_value.assert_not_called()
+
     @patch('system_monitor.core.metrics_updater.psutil')
     def test_update_network_basic(self, mock_psutil):
         """Test basic network update."""
@@ -211,6 +348,18 @@ class TestMetricsUpdater:
         self.monitor.card_net_up.update_value.assert_called_once()
         self.monitor.card_net_down.update_value.assert_called_once()
         assert self.monitor._last_net == current_net
+        # Counter wraps are clamped by _byte_rates, not psutil's nowrap cache
+        mock_psutil.net_io_counters.assert_called_once_with(nowrap=False)
+
+    def test_byte_rates_scales_and_clamps(self):
+        """Test _byte_rates converts deltas to units/s and clamps counter resets."""
+        from system_monitor.core.metrics_updater import MetricsUpdater
+        
+        scale = MetricsUpdater._rate_scale(0.5, 1024 ** 2)
+        up, down = MetricsUpdater._byte_rates(3 * 1024 ** 2, 1024 ** 2, 0, 5000, scale)
+        
+        assert up == pytest.approx(4.0)
+        assert down == 0.0
 
     @patch('system_monitor.core.metrics_updater.psutil')
     def test_update_network_dynamic_scaling(self, mock_psutil):
@@ -266,7 +415,7 @@ class TestMetricsUpdater:
 
     @patch('system_monitor.core.metrics_updater.psutil')
     def test_update_disk_no_last_disk(self, mock_psutil):
-        """Test disk update when _last_disk is None."""
+        """Test disk update when _last_disk is None only primes the baseline."""
         from system_monitor.core.metrics_updater import MetricsUpdater
         
         current_disk = MagicMock(read_bytes=2000, write_bytes=4000)
@@ -276,11 +425,20 @@ class TestMetricsUpdater:
         
         MetricsUpdater._update_disk(self.monitor, 1.0)
         
-        # Should set to 0.0 when no last_disk
-        call_args_read = self.monitor.card_disk_read.update_value.call_args
-        call_args_write = self.monitor.card_disk_write.update_value.call_args
-        assert call_args_read[0][0] == 0.0
-        assert call_args_write[0][0] == 0.0
+        assert self.monitor._last_disk == current_disk
+        self.monitor.card_disk_read.update_value.assert_not_called()
+
+    @patch('system_monitor.core.metrics_updater.psutil')
+    def test_update_disk_skipped_when_hidden(self, mock_psutil):
+        """Test disk counters are not read when no disk view is shown."""
+        from system_monitor.core.metrics_updater import MetricsUpdater
+        
+        self.monitor._last_disk = MagicMock(read_bytes=1000, write_bytes=2000)
+        
+        MetricsUpdater._update_disk(self.monitor, 1.0, 3)
+        
+        mock_psutil.disk_io_counters.assert_not_called()
+        assert self.monitor._last_disk is None
 
     @patch('system_monitor.core.metrics_updater.psutil')
     def test_update_disk_exception(self, mock_psutil):
@@ -311,34 +469,66 @@ class TestMetricsUpdater:
         
         self.monitor.chart_disk.append.assert_called_once()
 
-    def test_update_gpu_no_refresh_yet(self):
-        """Test GPU update when refresh interval not reached."""
+    def test_update_gpu_no_snapshot_yet(self):
+        """Test GPU update before the sampler has published anything."""
         from system_monitor.core.metrics_updater import MetricsUpdater
         
-        self.monitor._gpu_refresh_accum = 0.0
-        self.monitor.spin_gpu_refresh.value.return_value = 1000  # 1 second
+        self.monitor.gpu_sampler.latest.return_value = None
         
         MetricsUpdater._update_gpu(self.monitor, 0.1)
         
-        # Should accumulate but not refresh
-        assert self.monitor._gpu_refresh_accum == 0.1
-        self.monitor.gpu_provider.gpu_utils.assert_not_called()
+        self.monitor.card_gpu.update_percent.assert_not_called()
+        self.monitor.card_gpu.set_unavailable.assert_not_called()
 
-    def test_update_gpu_refresh_with_data(self):
-        """Test GPU update when refresh interval reached with data."""
+    def test_update_gpu_fields_follow_tab(self):
+        """Test the sampler only queries fields the visible tab needs."""
+        from system_monitor.core.metrics_updater import MetricsUpdater
+        from system_monitor.providers.gpu_provider import F_UTIL, F_FREQ, F_ALL
+        
+        self.monitor.gpu_sampler.latest.return_value = None
+        
+        MetricsUpdater._update_gpu(self.monitor, 0.1, 0)
+        self.monitor.gpu_sampler.set_fields.assert_called_with(F_UTIL | F_FREQ)
+        MetricsUpdater._update_gpu(self.monitor, 0.1, 5)
+        self.monitor.gpu_sampler.set_fields.assert_called_with(F_ALL)
+        
+        # Tabs without GPU widgets pause sampling and never read a snapshot
+        self.monitor.gpu_sampler.latest.reset_mock()
+        MetricsUpdater._update_gpu(self.monitor, 0.1, 2)
+        self.monitor.gpu_sampler.set_fields.assert_called_with(0)
+        self.monitor.gpu_sampler.latest.assert_not_called()
+
+    def test_update_gpu_same_snapshot_skipped(self):
+        """Test GPU widgets are not redrawn for an already-consumed snapshot."""
         from system_monitor.core.metrics_updater import MetricsUpdater
+        from system_monitor.core.gpu_sampler import GpuSnapshot
+        
+        snap = GpuSnapshot(utils=[50.0], freqs=[1500.0], vram=[(2000, 4000)])
+        self.monitor.gpu_sampler.latest.return_value = snap
+        self.monitor._gpu_snapshot = snap
+        self.monitor.tabs.currentIndex.return_value = 0
         
-        self.monitor._gpu_refresh_accum = 1.0
-        self.monitor.spin_gpu_refresh.value.return_value = 1000  # 1 second
-        self.monitor.gpu_provider.gpu_utils.return_value = [50.0, 60.0]
-        self.monitor.gpu_provider.gpu_frequencies.return_value = [1500.0, 1600.0]
-        self.monitor.gpu_provider.gpu_vram_info.return_value = [(2000, 4000), (3000, 6000)]
+        MetricsUpdater._update_gpu(self.monitor, 0.1)
+        
+        self.monitor.card_gpu.update_percent.assert_not_called()
+
+    def test_update_gpu_refresh_with_data(self):
+        """Test GPU update with a new snapshot containing data."""
+        from system_monitor.core.metrics_updater import MetricsUpdater
+        from system_monitor.core.gpu_sampler import GpuSnapshot
+        
+        snap = GpuSnapshot(
+            utils=[50.0, 60.0],
+            freqs=[1500.0, 1600.0],
+            vram=[(2000, 4000), (3000, 6000)],
+        )
+        self.monitor.gpu_sampler.latest.return_value = snap
         self.monitor.tabs.currentIndex.return_value = 0  # Not on GPU tab
         
         MetricsUpdater._update_gpu(self.monitor, 0.1)
         
-        # Should reset accumulator
-        assert self.monitor._gpu_refresh_accum == 0.0
+        # Should remember the consumed snapshot
+        assert self.monitor._gpu_snapshot is snap
         # Should update card with average
         self.monitor.card_gpu.update_percent.assert_called_once_with(55.0)
         self.monitor.card_gpu.set_frequency.assert_called_once_with(1500.0)
@@ -346,30 +536,30 @@ class TestMetricsUpdater:
     def test_update_gpu_no_data(self):
         """Test GPU update when no GPU data available."""
         from system_monitor.core.metrics_updater import MetricsUpdater
+        from system_monitor.core.gpu_sampler import GpuSnapshot
         
-        self.monitor._gpu_refresh_accum = 1.0
-        self.monitor.spin_gpu_refresh.value.return_value = 1000
-        self.monitor.gpu_provider.gpu_utils.return_value = []
+        self.monitor.gpu_sampler.latest.return_value = GpuSnapshot()
+        self.monitor.tabs.currentIndex.return_value = 0
         
         MetricsUpdater._update_gpu(self.monitor, 0.1)
         
         self.monitor.card_gpu.set_unavailable.assert_called_once_with("N/A")
         self.monitor.lbl_gpu_info.setText.assert_called_once_with("No GPU data available")
 
-    @patch('system_monitor.core.metrics_updater.get_gpu_temperatures')
-    def test_update_gpu_on_gpu_tab(self, mock_get_temps):
+    def test_update_gpu_on_gpu_tab(self):
         """Test GPU update when on GPU tab with charts."""
         from system_monitor.core.metrics_updater import MetricsUpdater
-        
-        self.monitor._gpu_refresh_accum = 1.0
-        self.monitor.spin_gpu_refresh.value.return_value = 1000
-        self.monitor.gpu_provider.gpu_utils.return_value = [50.0, 60.0]
-        self.monitor.gpu_provider.gpu_frequencies.return_value = [1500.0, 1600.0]
-        self.monitor.gpu_provider.gpu_vram_info.return_value = [(2000, 4000), (3000, 6000)]
+        from system_monitor.core.gpu_sampler import GpuSnapshot
+        
+        self.monitor.gpu_sampler.latest.return_value = GpuSnapshot(
+            utils=[50.0, 60.0],
+            freqs=[1500.0, 1600.0],
+            vram=[(2000, 4000), (3000, 6000)],
+            temps=[65.0, 70.0],
+        )
         self.monitor.tabs.currentIndex.return_value = 5  # GPU tab
         self.monitor.chart_gpu_vram = MagicMock()
         self.monitor.chart_gpu_temp = MagicMock()
-        mock_get_temps.return_value = [65.0, 70.0]
         
         MetricsUpdater._update_gpu(self.monitor, 0.1)
         
@@ -380,12 +570,11 @@ class TestMetricsUpdater:
     def test_update_gpu_on_gpu_tab_no_vram_chart(self):
         """Test GPU update on GPU tab without VRAM chart."""
         from system_monitor.core.metrics_updater import MetricsUpdater
+        from system_monitor.core.gpu_sampler import GpuSnapshot
         
-        self.monitor._gpu_refresh_accum = 1.0
-        self.monitor.spin_gpu_refresh.value.return_value = 1000
-        self.monitor.gpu_provider.gpu_utils.return_value = [50.0]
-        self.monitor.gpu_provider.gpu_frequencies.return_value = [1500.0]
-        self.monitor.gpu_provider.gpu_vram_info.return_value = [(2000, 4000)]
+        self.monitor.gpu_sampler.latest.return_value = GpuSnapshot(
+            utils=[50.0], freqs=[1500.0], vram=[(2000, 4000)]
+        )
         self.monitor.tabs.currentIndex.return_value = 5
         # No chart_gpu_vram attribute
         
@@ -394,52 +583,33 @@ class TestMetricsUpdater:
         self.monitor.chart_gpu.append.assert_called_once_with([50.0])
 
     @patch('system_monitor.core.metrics_updater.MetricsUpdater._update_gpu_tooltips')
-    @patch('system_monitor.core.metrics_updater.get_gpu_temperatures')
-    def test_update_gpu_temp_exception(self, mock_get_temps, mock_tooltips):
-        """Test GPU update handles temperature exception."""
+    def test_update_gpu_no_temps(self, mock_tooltips):
+        """Test GPU update skips the temperature chart without readings."""
         from system_monitor.core.metrics_updater import MetricsUpdater
+        from system_monitor.core.gpu_sampler import GpuSnapshot
         
-        self.monitor._gpu_refresh_accum = 1.0
-        self.monitor.spin_gpu_refresh.value.return_value = 1000
-        self.monitor.gpu_provider.gpu_utils.return_value = [50.0]
-        self.monitor.gpu_provider.gpu_frequencies.return_value = [1500.0]
-        self.monitor.gpu_provider.gpu_vram_info.return_value = [(2000, 4000)]
+        self.monitor.gpu_sampler.latest.return_value = GpuSnapshot(
+            utils=[50.0], freqs=[1500.0], vram=[(2000, 4000)], temps=[]
+        )
         self.monitor.tabs.currentIndex.return_value = 5
         self.monitor.chart_gpu_temp = MagicMock()
-        mock_get_temps.side_effect = Exception("Temp error")
         
         MetricsUpdater._update_gpu(self.monitor, 0.1)
         
-        # Should continue without crashing
         self.monitor.chart_gpu.append.assert_called_once()
-        # Temperature chart should not be updated due to exception
         self.monitor.chart_gpu_temp.append.assert_not_called()
 
-    def test_update_gpu_accum_exception(self):
-        """Test GPU update handles accumulator exception."""
-        from system_monitor.core.metrics_updater import MetricsUpdater
-        
-        # No _gpu_refresh_accum attribute
-        delattr(self.monitor, '_gpu_refresh_accum')
-        self.monitor.spin_gpu_refresh.value.return_value = 1000
-        
-        MetricsUpdater._update_gpu(self.monitor, 0.1)
-        
-        # Should initialize to 0.0
-        assert self.monitor._gpu_refresh_accum == 0.0
-
-    @patch('system_monitor.core.metrics_updater.get_gpu_temperatures')
-    def test_update_gpu_tooltips_complete(self, mock_get_temps):
+    def test_update_gpu_tooltips_complete(self):
         """Test GPU tooltips with complete information."""
         from system_monitor.core.metrics_updater import MetricsUpdater
         
         self.monitor.gpu_provider.gpu_names.return_value = ["GPU 0 Name", "GPU 1 Name"]
-        mock_get_temps.return_value = [65.0, 70.0]
         utils = [50.0, 60.0]
         vram_info = [(2000, 4000), (3000, 6000)]
         freqs = [1500.0, 1600.0]
+        temps = [65.0, 70.0]
         
-        MetricsUpdater._update_gpu_tooltips(self.monitor, utils, vram_info, freqs)
+        MetricsUpdater._update_gpu_tooltips(self.monitor, utils, vram_info, freqs, temps)
         
         self.monitor.card_gpu.set_tooltip.assert_called_once()
         self.monitor.lbl_gpu_info.setText.assert_called_once()
@@ -452,78 +622,62 @@ class TestMetricsUpdater:
         assert "1500" in tooltip
         assert "65°C" in tooltip
 
-    @patch('system_monitor.core.metrics_updater.get_gpu_temperatures')
-    def test_update_gpu_tooltips_minimal(self, mock_get_temps):
+    def test_update_gpu_tooltips_skips_unchanged(self):
+        """Test GPU tooltip and info label are only set when the text changes."""
+        from system_monitor.core.metrics_updater import MetricsUpdater
+        
+        self.monitor.gpu_provider.gpu_names.return_value = ("GPU 0",)
+        self.monitor._gpu_tip = None
+        
+        MetricsUpdater._update_gpu_tooltips(self.monitor, [50.0], [(2000, 4000)], [1500.0], [65.0])
+        MetricsUpdater._update_gpu_tooltips(self.monitor, [50.0], [(2000, 4000)], [1500.0], [65.0])
+        
+        self.monitor.card_gpu.set_tooltip.assert_called_once_with(
+            "GPU 0: 50% | VRAM: 2000/4000 MB (50.0%) | 1500 MHz | 65°C"
+        )
+        self.monitor.lbl_gpu_info.setText.assert_called_once_with(
+            "GPU 0 (GPU 0): Utilization 50%, VRAM: 2000/4000 MB (50.0%), Clock: 1500 MHz, Temp: 65°C"
+        )
+        
+        MetricsUpdater._update_gpu_tooltips(self.monitor, [51.0], [(2000, 4000)], [1500.0], [65.0])
+        assert self.monitor.card_gpu.set_tooltip.call_count == 2
+
+    def test_update_gpu_tooltips_minimal(self):
         """Test GPU tooltips with minimal information."""
         from system_monitor.core.metrics_updater import MetricsUpdater
         
         self.monitor.gpu_provider.gpu_names.return_value = []
-        mock_get_temps.return_value = []
         utils = [50.0]
         vram_info = []
         freqs = []
         
-        MetricsUpdater._update_gpu_tooltips(self.monitor, utils, vram_info, freqs)
+        MetricsUpdater._update_gpu_tooltips(self.monitor, utils, vram_info, freqs, [])
         
         # Should still set tooltip with basic info
         tooltip = self.monitor.card_gpu.set_tooltip.call_args[0][0]
         assert "GPU 0" in tooltip
         assert "50%" in tooltip
 
-    @patch('system_monitor.core.metrics_updater.get_gpu_temperatures')
-    def test_update_gpu_tooltips_zero_vram(self, mock_get_temps):
+    def test_update_gpu_tooltips_zero_vram(self):
         """Test GPU tooltips with zero total VRAM."""
         from system_monitor.core.metrics_updater import MetricsUpdater
         
         self.monitor.gpu_provider.gpu_names.return_value = ["GPU 0"]
-        mock_get_temps.return_value = [65.0]
         utils = [50.0]
         vram_info = [(0, 0)]  # Zero total VRAM
         freqs = [1500.0]
         
-        MetricsUpdater._update_gpu_tooltips(self.monitor, utils, vram_info, freqs)
+        MetricsUpdater._update_gpu_tooltips(self.monitor, utils, vram_info, freqs, [65.0])
         
         tooltip = self.monitor.card_gpu.set_tooltip.call_args[0][0]
         # Should not include VRAM info when total is 0
         assert "VRAM" not in tooltip
 
-    def test_update_processes_no_refresh_yet(self):
-        """Test process update when refresh interval not reached."""
-        from system_monitor.core.metrics_updater import MetricsUpdater
-        
-        self.monitor._proc_refresh_accum = 0.0
-        self.monitor.spin_proc_refresh.value.return_value = 1000
-        self.monitor.refresh_processes = MagicMock()
-        
-        MetricsUpdater._update_processes(self.monitor, 0.1)
-        
-        # Should accumulate but not refresh
-        assert self.monitor._proc_refresh_accum == 0.1
-        self.monitor.refresh_processes.assert_not_called()
-
-    def test_update_processes_refresh(self):
-        """Test process update when refresh interval reached."""
-        from system_monitor.core.metrics_updater import MetricsUpdater
-        
-        self.monitor._proc_refresh_accum = 1.0
-        self.monitor.spin_proc_refresh.value.return_value = 1000
-        self.monitor.refresh_processes = MagicMock()
-        
-        MetricsUpdater._update_processes(self.monitor, 0.1)
-        
-        # Should reset and refresh
-        assert self.monitor._proc_refresh_accum == 0.0
-        self.monitor.refresh_processes.assert_called_once()
-
-    def test_update_processes_accum_exception(self):
-        """Test process update handles accumulator exception."""
-        from system_monitor.core.metrics_updater import MetricsUpdater
-        
-        delattr(self.monitor, '_proc_refresh_accum')
-        self.monitor.spin_proc_refresh.value.return_value = 1000
-        self.monitor.refresh_processes = MagicMock()
-        
-        MetricsUpdater._update_processes(self.monitor, 0.1)
+    def test_fmt_mhz_caches_text(self):
+        """Test clock labels are formatted once per whole-MHz value."""
+        from system_monitor.core.metrics_updater import _fmt_mhz
         
-        # Should initialize to 0.0
-        assert self.monitor._proc_refresh_accum == 0.0
+        text = _fmt_mhz(3199.6)
+        assert text == "3200 MHz"
+        assert _fmt_mhz(3200.2) is text
+        assert _fmt_mhz(800.0) == "800 MHz"
@@ -0,0 +1,501 @@
+"""Tests for ProcessCollector class."""
+
+#      Copyright (c) 2025 predator. All rights reserved.
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, mock_open, patch
+import pytest
+
+
+def _stat_line(pid, comm, ticks, threads=1, rss=0, cpu=0, start=0):
+    # Fields 3..39 (state through processor); utime/stime, num_threads,
+    # starttime, rss and processor are filled in, the rest are zero
+    rest = ["S"] + ["0"] * 36
+    rest[11] = str(ticks)  # utime
+    rest[12] = "0"  # stime
+    rest[17] = str(threads)
+    rest[19] = str(start)
+    rest[21] = str(rss)
+    rest[36] = str(cpu)
+    return f"{pid} ({comm}) {' '.join(rest)}".encode()
+
+
+def _raise(exc):
+    def fn(*args):
+        raise exc
+    return fn
+
+
+def _make_proc(pid, name, cpu=0.0, mem=0.0, threads=1, core=0, started=1.0):
+    # Stand-in for a Process from process_iter(attrs): only info, create_time()
+    # and name() are provided, so any other per-process call fails the scan
+    return SimpleNamespace(
+        info={'pid': pid, 'memory_percent': mem, 'num_threads': threads,
+              'cpu_percent': cpu, 'cpu_num': core},
+        create_time=lambda: started,
+        name=lambda: name,
+    )
+
+
+class TestProcessCollectorInit:
+    """Test ProcessCollector executor setup."""
+
+    def test_init_single_worker(self):
+        """Test the collector runs collections on one worker thread by default."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        collector = ProcessCollector()
+        try:
+            assert collector._executor._max_workers == 1
+        finally:
+            collector.shutdown()
+
+    def test_init_rejects_extra_submissions(self):
+        """Test a second collect_async while one is in flight submits nothing."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        collector = ProcessCollector()
+        executor = collector._executor
+        collector._executor = MagicMock()
+        try:
+            collector.collect_async(4)
+            collector.collect_async(4)
+        finally:
+            executor.shutdown()
+
+        collector._executor.submit.assert_called_once()
+        assert collector.is_collecting()
+
+    def test_is_collecting_thread_safe(self):
+        """Test many threads can poll is_collecting concurrently without a lock."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        collector = ProcessCollector()
+        seen = []
+        errors = []
+
+        def poll():
+            try:
+                for _ in range(100):
+                    seen.append(collector.is_collecting())
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=poll) for _ in range(100)]
+        try:
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            collector.shutdown()
+
+        assert not errors
+        assert len(seen) == 100 * 100
+        assert not any(seen)
+
+    def test_queue_depth_zero_initially(self):
+        """Test a fresh collector has nothing queued."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        collector = ProcessCollector()
+        try:
+            assert collector.queue_depth() == 0
+            assert collector.is_healthy()
+        finally:
+            collector.shutdown()
+
+    def test_queue_depth_counts_coalesced_requests(self):
+        """Test collect_async() calls made during a slow scan are counted, then reset."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        collector = ProcessCollector()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow(n_cores, proc_filter):
+            started.set()
+            release.wait(2.0)
+            return {}
+
+        try:
+            with patch.object(collector, '_collect_processes', side_effect=slow):
+                collector.collect_async(1)
+                started.wait(2.0)
+                collector.collect_async(1)
+                collector.collect_async(1)
+                assert collector.queue_depth() == 2
+                assert not collector.is_healthy()
+                release.set()
+                for _ in range(200):
+                    if not collector.is_collecting():
+                        break
+                    time.sleep(0.01)
+            assert collector.queue_depth() == 0
+            assert collector.is_healthy()
+        finally:
+            release.set()
+            collector.shutdown()
+
+
+class TestParseProcStat:
+    """Test the /proc/<pid>/stat parser."""
+
+    def test_parses_fields(self):
+        """Test comm, ticks, threads, rss, last CPU and start time are extracted."""
+        from system_monitor.core.process_collector import _parse_proc_stat
+
+        data = _stat_line(42, "python", 150, threads=3, rss=1000, cpu=2, start=777)
+
+        assert _parse_proc_stat(data) == ("python", 150, 3, 1000, 2, 777)
+
+    def test_comm_with_spaces_and_parens(self):
+        """Test a comm containing spaces and ')' is split at the last paren."""
+        from system_monitor.core.process_collector import _parse_proc_stat
+
+        data = _stat_line(7, "a) b (c", 10)
+
+        assert _parse_proc_stat(data)[0] == "a) b (c"
+
+    def test_full_name_from_cmdline(self):
+        """Test a 15-character comm is completed from argv[0] when it extends it."""
+        from system_monitor.core.process_collector import _full_name
+
+        with patch('builtins.open', mock_open(read_data=b"/usr/bin/gnome-shell-calendar-server\0--x\0")):
+            assert _full_name("9", "gnome-shell-cal") == "gnome-shell-calendar-server"
+        with patch('builtins.open', mock_open(read_data=b"/bin/other\0")):
+            assert _full_name("9", "gnome-shell-cal") == "gnome-shell-cal"
+        with patch('builtins.open', side_effect=AssertionError("short comm needs no read")):
+            assert _full_name("9", "bash") == "bash"
+
+
+class TestProcessCollectorProcStat:
+    """Test the /proc fast path of ProcessCollector."""
+
+    def _collect(self, collector, files, n_cores=2, proc_filter=""):
+        def fake_open(path, mode="r"):
+            pid = path.split("/")[2]
+            if pid not in files:
+                raise FileNotFoundError(path)
+            return mock_open(read_data=files[pid])()
+
+        with patch('system_monitor.core.process_collector.os.listdir',
+                   return_value=list(files) + ["self", "meminfo", "999"]), \
+                patch('builtins.open', side_effect=fake_open), \
+                patch('system_monitor.core.process_collector.psutil') as mock_psutil:
+            mock_psutil.virtual_memory.return_value = MagicMock(total=4096 * 1000)
+            return collector._collect_proc_stat(n_cores, proc_filter)
+
+    @patch('system_monitor.core.process_collector._PAGE_SIZE', 4096)
+    @patch('system_monitor.core.process_collector._CLK_TCK', 100)
+    @patch('system_monitor.core.process_collector.time')
+    def test_first_scan_primes_then_reports_rates(self, mock_time):
+        """Test the first scan returns None and the second reports tick deltas."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        collector = ProcessCollector()
+        try:
+            mock_time.monotonic_ns.return_value = 0
+            assert self._collect(collector, {"1": _stat_line(1, "init", 100)}) is None
+
+            # One second later: 50 ticks at 100 Hz = 50% of one core
+            mock_time.monotonic_ns.return_value = 1_000_000_000
+            result = self._collect(collector, {
+                "1": _stat_line(1, "init", 150, threads=2, rss=10, cpu=1),
+                "2": _stat_line(2, "new", 500, threads=3, cpu=5),
+            })
+        finally:
+            collector.shutdown()
+
+        assert result['proc_count'] == 2
+        assert result['total_threads'] == 5
+        cpu, pid, name, mem, threads = result['core_processes'][1][0]
+        assert (pid, name, threads) == (1, "init", 2)
+        assert abs(cpu - 50.0) < 1e-9
+        assert abs(mem - 1.0) < 1e-9
+        # New PID has no baseline; CPU 5 is outside 2 cores
+        assert result['all_cores_processes'][0][:3] == (0.0, 2, "new")
+
+    @patch('system_monitor.core.process_collector._CLK_TCK', 100)
+    @patch('system_monitor.core.process_collector.time')
+    def test_filter_keeps_counts(self, mock_time):
+        """Test the filter hides rows but totals still count every process."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        files = {"1": _stat_line(1, "init", 0, threads=1), "2": _stat_line(2, "bash", 0, threads=4)}
+        collector = ProcessCollector()
+        try:
+            mock_time.monotonic_ns.return_value = 0
+            self._collect(collector, files)
+            mock_time.monotonic_ns.return_value = 1_000_000_000
+            result = self._collect(collector, files, proc_filter="bash")
+        finally:
+            collector.shutdown()
+
+        assert result['proc_count'] == 2
+        assert result['total_threads'] == 5
+        rows = result['core_processes'][0]
+        assert [r[2] for r in rows] == ["bash"]
+
+    @patch('system_monitor.core.process_collector._full_name')
+    def test_name_cached_until_pid_reused(self, mock_full_name):
+        """Test names are resolved once per process and PID reuse refreshes them."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        mock_full_name.side_effect = lambda pid, comm: comm
+        collector = ProcessCollector()
+        try:
+            self._collect(collector, {"5": _stat_line(5, "first", 0, start=100)})
+            self._collect(collector, {"5": _stat_line(5, "first", 0, start=100)})
+            assert mock_full_name.call_count == 1
+            result = self._collect(collector, {"5": _stat_line(5, "second", 0, start=200)})
+        finally:
+            collector.shutdown()
+
+        assert mock_full_name.call_count == 2
+        assert result['core_processes'][0][0][2] == "second"
+        assert collector._names == {5: (200, "second", "second")}
+
+    def test_priming_result_not_published(self):
+        """Test a None (priming) result is not queued."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        collector = ProcessCollector()
+        try:
+            future = MagicMock()
+            future.result.return_value = None
+            collector._on_collection_complete(future)
+        finally:
+            collector.shutdown()
+
+        assert collector.get_result() is None
+
+    @patch('system_monitor.core.process_collector._USE_PROC_STAT', True)
+    def test_prime_resets_baseline(self):
+        """Test prime drops a stale result and runs a baseline scan off-thread."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        collector = ProcessCollector()
+        try:
+            collector._prev_scan_ns = 123
+            collector._latest_result = {'proc_count': 1}
+            with patch.object(collector, '_collect_proc_stat', return_value=None) as mock_scan:
+                assert collector.prime() is True
+                collector._executor.submit(lambda: None).result()  # wait for the worker
+        finally:
+            collector.shutdown()
+
+        assert collector._prev_scan_ns is None
+        assert collector.get_result() is None
+        assert not collector.is_collecting()
+        mock_scan.assert_called_once_with(0, "")
+
+    def test_prime_skipped_while_collecting(self):
+        """Test prime reports False and submits nothing while a scan is running."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        collector = ProcessCollector()
+        try:
+            collector._collecting = True
+            collector._prev_scan_ns = 123
+            with patch.object(collector._executor, 'submit') as mock_submit:
+                assert collector.prime() is False
+            mock_submit.assert_not_called()
+            assert collector._prev_scan_ns == 123
+        finally:
+            collector._collecting = False
+            collector.shutdown()
+
+
+class TestProcessCollectorPsutil:
+    """Test the psutil path of ProcessCollector."""
+
+    @patch('system_monitor.core.process_collector._USE_PROC_STAT', False)
+    @patch('system_monitor.core.process_collector.psutil')
+    def test_prime_swallows_errors(self, mock_psutil):
+        """Test prime calls cpu_percent on every process off-thread and ignores failures."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        primed = []
+        bad = SimpleNamespace(cpu_percent=_raise(Exception("gone")))
+        good = SimpleNamespace(cpu_percent=primed.append)
+        mock_psutil.process_iter.return_value = [bad, good]
+        collector = ProcessCollector()
+        try:
+            collector.prime()
+            collector._executor.submit(lambda: None).result()  # wait for the worker
+        finally:
+            collector.shutdown()
+
+        assert primed == [None]
+        assert collector.get_result() is None
+
+    @patch('system_monitor.core.process_collector._USE_PROC_STAT', False)
+    @patch('system_monitor.core.process_collector.psutil')
+    def test_collect_processes_uses_process_iter(self, mock_psutil):
+        """Test the psutil path groups processes by cpu_num."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        calls = []
+        proc = _make_proc(5, 'sh', cpu=3.0, mem=1.5, threads=2)
+        proc.name = lambda: calls.append(1) or 'sh'
+        mock_psutil.process_iter.return_value = [proc]
+        collector = ProcessCollector()
+        try:
+            result = collector._collect_processes(1, "")
+            collector._collect_processes(1, "")
+        finally:
+            collector.shutdown()
+
+        assert result['proc_count'] == 1
+        assert result['core_processes'][0][0] == (3.0, 5, 'sh', 1.5, 2)
+        # Second scan reuses the cached name
+        assert len(calls) == 1
+
+    @patch('system_monitor.core.process_collector._USE_PROC_STAT', False)
+    @patch('system_monitor.core.process_collector.psutil')
+    def test_core_processes_is_list_per_core(self, mock_psutil):
+        """Test core_processes is a list with one row list per core."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        mock_psutil.process_iter.return_value = []
+        collector = ProcessCollector()
+        try:
+            result = collector._collect_processes(4, "")
+        finally:
+            collector.shutdown()
+
+        assert type(result['core_processes']) is list
+        assert result['core_processes'] == [[], [], [], []]
+
+    @patch('system_monitor.core.process_collector._USE_PROC_STAT', False)
+    @patch('system_monitor.core.process_collector.psutil')
+    def test_filter_matches_cached_lowercase_name_or_pid(self, mock_psutil):
+        """Test the filter matches names case-insensitively and digits against PIDs."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        mock_psutil.process_iter.return_value = [_make_proc(12, 'Firefox'), _make_proc(345, 'bash')]
+        collector = ProcessCollector()
+        try:
+            by_name = collector._collect_processes(1, "fire")
+            by_pid = collector._collect_processes(1, "34")
+        finally:
+            collector.shutdown()
+
+        assert [r[2] for r in by_name['core_processes'][0]] == ['Firefox']
+        assert [r[2] for r in by_pid['core_processes'][0]] == ['bash']
+
+    @patch('system_monitor.core.process_collector._USE_PROC_STAT', False)
+    @patch('system_monitor.core.process_collector.psutil')
+    def test_filter_regex_pattern(self, mock_psutil):
+        """Test a filter with metacharacters is a regex, and a bad one a substring."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        mock_psutil.process_iter.return_value = [
+            _make_proc(1, 'python3'), _make_proc(2, 'pypy'), _make_proc(3, 'c++'),
+        ]
+        collector = ProcessCollector()
+        try:
+            regex = collector._collect_processes(1, "py.*n")
+            literal = collector._collect_processes(1, "c++")
+        finally:
+            collector.shutdown()
+
+        assert [r[2] for r in regex['core_processes'][0]] == ['python3']
+        assert [r[2] for r in literal['core_processes'][0]] == ['c++']
+
+    def test_name_matcher_keeps_case_of_regex_escapes(self):
+        """Test uppercase escapes keep their meaning and matching ignores case."""
+        from system_monitor.core.process_collector import _name_matcher
+
+        non_digits = _name_matcher("^\\D+$")
+        assert non_digits("python")
+        assert not non_digits("123")
+        assert _name_matcher("^PY.*N$")("python")
+        # No metacharacters (a dot alone is not one): case-insensitive substring
+        assert _name_matcher("Python3.11")("python3.11")
+        assert not _name_matcher("python3.11")("python3x11")
+
+    @patch('system_monitor.core.process_collector._USE_PROC_STAT', False)
+    @patch('system_monitor.core.process_collector.psutil')
+    def test_collect_processes_fetches_attrs_in_one_pass(self, mock_psutil):
+        """Test one process_iter(attrs) call supplies every per-process field."""
+        from system_monitor.core.process_collector import ProcessCollector, _PROC_ATTRS
+
+        mock_psutil.process_iter.return_value = [_make_proc(5, 'sh', cpu=3.0, mem=1.5, threads=2)]
+        collector = ProcessCollector()
+        try:
+            result = collector._collect_processes(1, "")
+        finally:
+            collector.shutdown()
+
+        mock_psutil.process_iter.assert_called_once_with(_PROC_ATTRS)
+        assert {'pid', 'memory_percent', 'num_threads', 'cpu_percent'} <= set(_PROC_ATTRS)
+        # Values come from p.info: the stand-in has no per-field methods to call
+        assert 'error' not in result
+        assert result['core_processes'][0][0] == (3.0, 5, 'sh', 1.5, 2)
+        mock_psutil.Process.assert_not_called()
+
+    @patch('system_monitor.core.process_collector._USE_PROC_STAT', False)
+    @patch('system_monitor.core.process_collector.psutil')
+    def test_collect_processes_survives_create_time_failure(self, mock_psutil):
+        """Test the scan uses yielded Process objects as-is, even without a create time."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        proc = _make_proc(5, 'sh', cpu=3.0, mem=1.5, threads=2)
+        proc.create_time = _raise(Exception("no create time"))
+        mock_psutil.process_iter.return_value = [proc]
+        collector = ProcessCollector()
+        try:
+            result = collector._collect_processes(1, "")
+        finally:
+            collector.shutdown()
+
+        assert 'error' not in result
+        assert result['core_processes'][0][0] == (3.0, 5, 'sh', 1.5, 2)
+        mock_psutil.Process.assert_not_called()
+
+
+class TestProcessCollectorCancel:
+    """Test a shutdown during a scan on both collection paths."""
+
+    @pytest.mark.parametrize('use_proc_stat', [True, False])
+    def test_collect_processes_cancels_midway(self, use_proc_stat):
+        """Test a shutdown mid-scan returns no rows and keeps the previous state."""
+        from system_monitor.core.process_collector import ProcessCollector
+
+        collector = ProcessCollector()
+        old_names = {999: (1.0, 'old', 'old')}
+        collector._names = dict(old_names)
+        collector._prev_ticks = {999: 50}
+        collector._prev_scan_ns = 123
+
+        def procs():
+            for pid in range(200):
+                yield _make_proc(pid, 'p')
+                collector._shutdown = True
+
+        def fake_open(path, mode="r"):
+            collector._shutdown = True
+            return mock_open(read_data=_stat_line(int(path.split("/")[2]), "p", 10))()
+
+        try:
+            with patch('system_monitor.core.process_collector._USE_PROC_STAT', use_proc_stat), \
+                    patch('system_monitor.core.process_collector.psutil') as mock_psutil, \
+                    patch('system_monitor.core.process_collector.os.listdir',
+                          return_value=[str(pid) for pid in range(200)]), \
+                    patch('builtins.open', side_effect=fake_open):
+                mock_psutil.process_iter.return_value = procs()
+                mock_psutil.virtual_memory.return_value = MagicMock(total=4096 * 1000)
+                result = collector._collect_processes(1, "")
+        finally:
+            collector.shutdown()
+
+        assert 'error' not in result
+        assert result['proc_count'] == 0
+        assert result['core_processes'] == [[]]
+        assert collector._names == old_names
+        assert collector._prev_ticks == {999: 50}
+        assert collector._prev_scan_ns == 123
@@ -2,8 +2,7 @@
 
 #      Copyright (c) 2025 predator. All rights reserved.
 
-import pytest
-from unittest.mock import MagicMock, patch, Mock
+from unittest.mock import MagicMock, patch
 from PySide6.QtWidgets import QTreeWidgetItem
 
 
@@ -12,9 +11,13 @@ class TestProcessManager:
 
     def setup_method(self):
         """Setup mock monitor for each test."""
-        # Reset class-level collector before each test
+        # Reset class-level collector and item pools before each test
         from system_monitor.core.process_manager import ProcessManager
         ProcessManager._collector = None
+        ProcessManager._n_cores = None
+        ProcessManager._core_item_pool = []
+        ProcessManager._proc_item_pool = []
+        ProcessManager._thread_cache = {}
         
         self.monitor = MagicMock()
         self.monitor.proc_tree = MagicMock()
@@ -92,6 +95,31 @@ class TestProcessManager:
         mock_psutil.Process.assert_called_once_with(1234)
         mock_proc.threads.assert_called_once()
 
+    @patch('system_monitor.core.process_manager.time')
+    @patch('system_monitor.core.process_manager.psutil')
+    def test_on_proc_item_expanded_reuses_recent_threads(self, mock_psutil, mock_time, qapp):
+        """Test a re-expand within the TTL reuses cached thread ids."""
+        from PySide6.QtWidgets import QTreeWidget
+        from system_monitor.core.process_manager import ProcessManager
+        
+        mock_psutil.Process.return_value.threads.return_value = [MagicMock(id=11), MagicMock(id=12)]
+        tree = QTreeWidget()
+        first = QTreeWidgetItem(tree, ["proc", "1234"])
+        second = QTreeWidgetItem(tree, ["proc", "1234"])
+        
+        mock_time.monotonic.return_value = 100.0
+        ProcessManager.on_proc_item_expanded(self.monitor, first)
+        mock_time.monotonic.return_value = 101.0
+        ProcessManager.on_proc_item_expanded(self.monitor, second)
+        
+        mock_psutil.Process.assert_called_once_with(1234)
+        assert [second.child(j).text(1) for j in range(second.childCount())] == ["11", "12"]
+        
+        # Expired: threads are read again
+        mock_time.monotonic.return_value = 103.0
+        ProcessManager.on_proc_item_expanded(self.monitor, QTreeWidgetItem(tree, ["proc", "1234"]))
+        assert mock_psutil.Process.call_count == 2
+
     def test_on_proc_item_expanded_already_has_children(self):
         """Test on_proc_item_expanded skips if already has children."""
         from system_monitor.core.process_manager import ProcessManager
@@ -139,33 +167,35 @@ class TestProcessManager:
         # Should not raise exception
         ProcessManager.on_proc_item_expanded(self.monitor, item)
 
-    @patch('system_monitor.core.process_manager.psutil')
-    def test_refresh_processes_priming_pass(self, mock_psutil):
-        """Test refresh_processes first pass primes CPU percentages."""
+    def test_refresh_processes_priming_pass(self):
+        """Test refresh_processes first pass primes CPU percentages via the collector."""
         from system_monitor.core.process_manager import ProcessManager
         
         self.monitor._procs_primed = False
-        mock_proc = MagicMock()
-        mock_psutil.process_iter.return_value = [mock_proc]
+        mock_collector = MagicMock()
+        ProcessManager._collector = mock_collector
         
         ProcessManager.refresh_processes(self.monitor)
         
-        mock_proc.cpu_percent.assert_called_once_with(None)
+        mock_collector.prime.assert_called_once_with()
+        mock_collector.get_result.assert_not_called()
+        mock_collector.collect_async.assert_not_called()
         assert self.monitor._procs_primed is True
 
-    @patch('system_monitor.core.process_manager.psutil')
-    def test_refresh_processes_priming_exception(self, mock_psutil):
-        """Test refresh_processes handles exceptions during priming."""
+    def test_refresh_processes_priming_retried_while_busy(self):
+        """Test the priming pass is retried when prime() could not submit a scan."""
         from system_monitor.core.process_manager import ProcessManager
         
         self.monitor._procs_primed = False
-        mock_proc = MagicMock()
-        mock_proc.cpu_percent.side_effect = Exception("CPU error")
-        mock_psutil.process_iter.return_value = [mock_proc]
+        mock_collector = MagicMock()
+        mock_collector.prime.return_value = False
+        ProcessManager._collector = mock_collector
         
         ProcessManager.refresh_processes(self.monitor)
         
-        assert self.monitor._procs_primed is True
+        mock_collector.prime.assert_called_once_with()
+        mock_collector.get_result.assert_not_called()
+        assert self.monitor._procs_primed is False
 
     @patch('system_monitor.core.process_manager.ProcessManager._update_ui_with_result')
     @patch('system_monitor.core.process_manager.psutil')
@@ -226,209 +256,138 @@ class TestProcessManager:
             ProcessManager.refresh_processes(self.monitor)
 
     @patch('system_monitor.core.process_manager.ProcessManager._update_summary_labels')
-    @patch('system_monitor.core.process_manager.ProcessManager._build_process_tree')
-    @patch('system_monitor.core.process_manager.ProcessManager._save_expansion_state')
-    def test_update_ui_with_result_success(self, mock_save_state, mock_build_tree, mock_update_labels):
-        """Test _update_ui_with_result successfully updates UI."""
+    @patch('system_monitor.core.process_manager.ProcessManager._sync_process_tree')
+    def test_update_ui_with_result_success(self, mock_sync_tree, mock_update_labels):
+        """Test _update_ui_with_result syncs the tree with repaints and signals suspended."""
         from system_monitor.core.process_manager import ProcessManager
         
+        core_processes = {0: [], 1: []}
         result = {
-            'core_processes': {0: [], 1: []},
+            'core_processes': core_processes,
             'proc_count': 10,
             'total_threads': 50
         }
-        mock_save_state.return_value = (set(), {})
+        self.monitor.proc_tree.blockSignals.return_value = False
         
         ProcessManager._update_ui_with_result(self.monitor, result)
         
-        self.monitor.proc_tree.clear.assert_called_once()
-        mock_save_state.assert_called_once_with(self.monitor, 2)
-        mock_build_tree.assert_called_once()
+        mock_sync_tree.assert_called_once_with(self.monitor, 2, core_processes)
+        assert self.monitor.proc_tree.blockSignals.call_args_list == [((True,),), ((False,),)]
         mock_update_labels.assert_called_once_with(self.monitor, 10, 50)
-
-    @patch('system_monitor.core.process_manager.ProcessManager._update_summary_labels')
-    @patch('system_monitor.core.process_manager.ProcessManager._build_process_tree')
-    @patch('system_monitor.core.process_manager.ProcessManager._save_expansion_state')
-    def test_update_ui_with_result_first_build(self, mock_save_state, mock_build_tree, mock_update_labels):
-        """Test _update_ui_with_result handles first build."""
-        from system_monitor.core.process_manager import ProcessManager
-        
-        result = {'core_processes': {0: []}, 'proc_count': 5, 'total_threads': 25}
-        mock_save_state.return_value = (set(), {})
-        
-        # First build - no _proc_tree_built attribute
-        if hasattr(self.monitor, '_proc_tree_built'):
-            delattr(self.monitor, '_proc_tree_built')
-        
-        ProcessManager._update_ui_with_result(self.monitor, result)
-        
-        assert self.monitor._proc_tree_built is True
-        # Verify first_build=True is passed
-        call_args = mock_build_tree.call_args[0]
-        assert call_args[3] is True  # first_build parameter
+        self.monitor.proc_tree.setUpdatesEnabled.assert_any_call(False)
+        self.monitor.proc_tree.setUpdatesEnabled.assert_called_with(True)
 
     def test_update_ui_with_result_exception_handling(self):
         """Test _update_ui_with_result handles exceptions."""
         from system_monitor.core.process_manager import ProcessManager
         
         result = {'core_processes': {}}
-        self.monitor.proc_tree.clear.side_effect = Exception("Clear error")
+        self.monitor.proc_tree.invisibleRootItem.side_effect = Exception("Tree error")
         
         # Should not raise
         ProcessManager._update_ui_with_result(self.monitor, result)
 
-    def test_save_expansion_state_no_items(self):
-        """Test _save_expansion_state with no items."""
-        from system_monitor.core.process_manager import ProcessManager
-        
-        self.monitor.proc_tree.topLevelItemCount.return_value = 0
-        
-        expanded_cores, expanded_processes = ProcessManager._save_expansion_state(self.monitor, 4)
-        
-        assert expanded_cores == set()
-        assert expanded_processes == {}
-
-    def test_save_expansion_state_with_expanded_cores(self):
-        """Test _save_expansion_state with expanded core items."""
-        from system_monitor.core.process_manager import ProcessManager
-        
-        # Create mock core item
-        core_item = MagicMock(spec=QTreeWidgetItem)
-        core_item.isExpanded.return_value = True
-        core_item.text.return_value = "CPU Core 0"
-        core_item.childCount.return_value = 0
-        
-        self.monitor.proc_tree.topLevelItemCount.return_value = 1
-        self.monitor.proc_tree.topLevelItem.return_value = core_item
-        
-        expanded_cores, expanded_processes = ProcessManager._save_expansion_state(self.monitor, 4)
-        
-        assert 0 in expanded_cores
-
-    def test_save_expansion_state_with_expanded_processes(self):
-        """Test _save_expansion_state with expanded process items."""
+    def _sync(self, core_processes):
         from system_monitor.core.process_manager import ProcessManager
-        
-        # Create mock process item
-        proc_item = MagicMock(spec=QTreeWidgetItem)
-        proc_item.isExpanded.return_value = True
-        proc_item.text.return_value = "1234"
-        
-        # Create mock core item
-        core_item = MagicMock(spec=QTreeWidgetItem)
-        core_item.isExpanded.return_value = True
-        core_item.text.return_value = "CPU Core 0"
-        core_item.childCount.return_value = 1
-        core_item.child.return_value = proc_item
-        
-        self.monitor.proc_tree.topLevelItemCount.return_value = 1
-        self.monitor.proc_tree.topLevelItem.return_value = core_item
-        
-        expanded_cores, expanded_processes = ProcessManager._save_expansion_state(self.monitor, 4)
-        
-        assert 0 in expanded_cores
-        assert 0 in expanded_processes
-        assert 1234 in expanded_processes[0]
-
-    def test_save_expansion_state_exception_handling(self):
-        """Test _save_expansion_state handles exceptions."""
+        ProcessManager._sync_process_tree(self.monitor, len(core_processes), core_processes)
+
+    def test_sync_process_tree_first_build(self, qapp):
+        """Test the first sync creates expanded core rows with sorted process rows."""
+        from PySide6.QtWidgets import QTreeWidget
+        
+        self.monitor.proc_tree = QTreeWidget()
+        self._sync({
+            0: [(5.0, 1, "a", 1.0, 1), (25.5, 2, "b", 2.0, 4)],
+            1: [],
+        })
+        
+        tree = self.monitor.proc_tree
+        assert tree.topLevelItemCount() == 2
+        core_item = tree.topLevelItem(0)
+        assert core_item.text(0) == "CPU Core 0"
+        assert core_item.text(2) == "30.5"
+        assert core_item.isExpanded()
+        assert [core_item.child(j).text(1) for j in range(2)] == ["2", "1"]
+        assert core_item.child(0).childIndicatorPolicy() == QTreeWidgetItem.ShowIndicator
+        assert core_item.child(1).childIndicatorPolicy() == QTreeWidgetItem.DontShowIndicatorWhenChildless
+
+    def test_sync_process_tree_updates_rows_in_place(self, qapp):
+        """Test an unchanged PID order only rewrites cells of the existing rows."""
+        from PySide6.QtWidgets import QTreeWidget
+        
+        self.monitor.proc_tree = QTreeWidget()
+        self._sync({0: [(25.5, 1234, "proc", 1.0, 1)]})
+        core_item = self.monitor.proc_tree.topLevelItem(0)
+        proc_item = core_item.child(0)
+        
+        self._sync({0: [(12.0, 1234, "proc", 3.0, 1)]})
+        
+        assert self.monitor.proc_tree.topLevelItem(0) is core_item
+        assert core_item.child(0) is proc_item
+        assert proc_item.text(2) == "12.0"
+        assert proc_item.text(3) == "3.0"
+
+    def test_sync_process_tree_reorders_and_keeps_expansion(self, qapp):
+        """Test reordered PIDs keep their rows, expansion and loaded thread rows."""
+        from PySide6.QtWidgets import QTreeWidget
+        
+        self.monitor.proc_tree = QTreeWidget()
+        self._sync({0: [(20.0, 1, "a", 1.0, 2), (10.0, 2, "b", 1.0, 1)]})
+        core_item = self.monitor.proc_tree.topLevelItem(0)
+        item_a = core_item.child(0)
+        QTreeWidgetItem(item_a, ["Thread 11"])
+        item_a.setExpanded(True)
+        
+        self._sync({0: [(5.0, 1, "a", 1.0, 2), (30.0, 2, "b", 1.0, 1)]})
+        
+        assert core_item.child(1) is item_a
+        assert item_a.isExpanded()
+        assert item_a.childCount() == 1
+
+    def test_sync_process_tree_recycles_vanished_rows(self, qapp):
+        """Test rows for PIDs that disappeared are pooled and reused for new PIDs."""
+        from PySide6.QtWidgets import QTreeWidget
         from system_monitor.core.process_manager import ProcessManager
         
-        core_item = MagicMock(spec=QTreeWidgetItem)
-        core_item.isExpanded.return_value = True
-        core_item.text.side_effect = Exception("Text error")
-        
-        self.monitor.proc_tree.topLevelItemCount.return_value = 1
-        self.monitor.proc_tree.topLevelItem.return_value = core_item
+        self.monitor.proc_tree = QTreeWidget()
+        self._sync({0: [(25.5, 1, "old", 1.0, 1)]})
+        core_item = self.monitor.proc_tree.topLevelItem(0)
+        old_item = core_item.child(0)
         
-        # Should not raise
-        expanded_cores, expanded_processes = ProcessManager._save_expansion_state(self.monitor, 4)
+        self._sync({0: []})
+        assert core_item.childCount() == 0
+        assert ProcessManager._proc_item_pool == [old_item]
         
-        assert isinstance(expanded_cores, set)
-        assert isinstance(expanded_processes, dict)
+        self._sync({0: [(3.0, 2, "new", 1.0, 1)]})
+        assert core_item.child(0) is old_item
+        assert old_item.text(0) == "new"
+        assert old_item.text(1) == "2"
+        assert ProcessManager._proc_item_pool == []
 
-    @patch('system_monitor.core.process_manager.QTreeWidgetItem')
-    def test_build_process_tree_basic(self, mock_tree_item_cls):
-        """Test _build_process_tree builds tree structure."""
-        from system_monitor.core.process_manager import ProcessManager
+    def test_sync_process_tree_keeps_top_ten(self, qapp):
+        """Test only the ten busiest processes per core get rows, busiest first."""
+        from PySide6.QtWidgets import QTreeWidget
         
-        mock_proc_obj = MagicMock()
-        core_processes = {
-            0: [(25.5, 1234, "process1", 100.0, 5, mock_proc_obj)]
-        }
+        self.monitor.proc_tree = QTreeWidget()
+        self._sync({0: [(float(i), i, "p%d" % i, 1.0, 1) for i in range(15)]})
         
-        ProcessManager._build_process_tree(
-            self.monitor, 1, core_processes, False, set(), {}
-        )
-        
-        # Should create core item and process item
-        assert mock_tree_item_cls.call_count >= 2
-
-    @patch('system_monitor.core.process_manager.QTreeWidgetItem')
-    def test_build_process_tree_first_build_expands(self, mock_tree_item_cls):
-        """Test _build_process_tree expands on first build."""
-        from system_monitor.core.process_manager import ProcessManager
-        
-        mock_core_item = MagicMock()
-        mock_tree_item_cls.return_value = mock_core_item
-        core_processes = {0: []}
-        
-        ProcessManager._build_process_tree(
-            self.monitor, 1, core_processes, True, set(), {}
-        )
-        
-        mock_core_item.setExpanded.assert_called_with(True)
-
-    @patch('system_monitor.core.process_manager.QTreeWidgetItem')
-    def test_build_process_tree_restores_expansion(self, mock_tree_item_cls):
-        """Test _build_process_tree restores expansion state."""
-        from system_monitor.core.process_manager import ProcessManager
-        
-        mock_items = [MagicMock(), MagicMock()]
-        mock_tree_item_cls.side_effect = mock_items
-        
-        mock_proc_obj = MagicMock()
-        core_processes = {0: [(25.5, 1234, "proc", 100.0, 5, mock_proc_obj)]}
-        expanded_cores = {0}
-        expanded_processes = {0: {1234}}
-        
-        ProcessManager._build_process_tree(
-            self.monitor, 1, core_processes, False, expanded_cores, expanded_processes
-        )
-        
-        # Core should be expanded
-        mock_items[0].setExpanded.assert_called_with(True)
-
-    @patch('system_monitor.core.process_manager.QTreeWidgetItem')
-    def test_build_process_tree_lazy_load_threads(self, mock_tree_item_cls):
-        """Test _build_process_tree sets lazy load indicator for threads."""
-        from system_monitor.core.process_manager import ProcessManager
-        
-        mock_core_item = MagicMock()
-        mock_proc_item = MagicMock()
-        mock_tree_item_cls.side_effect = [mock_core_item, mock_proc_item]
-        
-        mock_proc_obj = MagicMock()
-        core_processes = {0: [(25.5, 1234, "proc", 100.0, 5, mock_proc_obj)]}
-        
-        ProcessManager._build_process_tree(
-            self.monitor, 1, core_processes, False, set(), {}
-        )
-        
-        # Should set child indicator for multi-threaded process
-        mock_proc_item.setChildIndicatorPolicy.assert_called()
+        core_item = self.monitor.proc_tree.topLevelItem(0)
+        assert core_item.childCount() == 10
+        assert [core_item.child(j).text(1) for j in range(10)] == [str(i) for i in range(14, 4, -1)]
+        assert core_item.text(2) == "95.0"
 
     @patch('system_monitor.core.process_manager.asyncio')
     def test_update_summary_labels_basic(self, mock_asyncio):
         """Test _update_summary_labels updates labels."""
         from system_monitor.core.process_manager import ProcessManager
         
-        mock_asyncio.get_running_loop.side_effect = Exception("No loop")
+        mock_asyncio._get_running_loop.return_value = None
         
         ProcessManager._update_summary_labels(self.monitor, 100, 500)
         
         self.monitor.lbl_proc_summary.setText.assert_called_once_with("Processes: 100   Threads: 500")
         self.monitor.lbl_asyncio.setText.assert_called_once_with("Python coroutines (asyncio tasks): 0")
+        mock_asyncio.all_tasks.assert_not_called()
 
     @patch('system_monitor.core.process_manager.asyncio')
     def test_update_summary_labels_with_asyncio(self, mock_asyncio):
@@ -436,9 +395,31 @@ class TestProcessManager:
         from system_monitor.core.process_manager import ProcessManager
         
         mock_loop = MagicMock()
-        mock_asyncio.get_running_loop.return_value = mock_loop
+        mock_asyncio._get_running_loop.return_value = mock_loop
         mock_asyncio.all_tasks.return_value = [1, 2, 3]  # 3 tasks
         
         ProcessManager._update_summary_labels(self.monitor, 100, 500)
         
         self.monitor.lbl_asyncio.setText.assert_called_once_with("Python coroutines (asyncio tasks): 3")
+
+    @patch('system_monitor.core.process_manager.asyncio')
+    def test_update_summary_labels_skips_unchanged_asyncio(self, mock_asyncio):
+        """Test asyncio label is only rewritten when the task count changes."""
+        from system_monitor.core.process_manager import ProcessManager
+        
+        mock_asyncio._get_running_loop.return_value = None
+        self.monitor._coro_count = 0
+        
+        ProcessManager._update_summary_labels(self.monitor, 100, 500)
+        
+        self.monitor.lbl_asyncio.setText.assert_not_called()
+
+    def test_fmt_tenths_matches_fstring(self):
+        """Test cached tenths formatting matches f-string output."""
+        from system_monitor.core.process_manager import _fmt_tenths
+        
+        assert _fmt_tenths(0.0) == "0.0"
+        assert _fmt_tenths(12.34) == "12.3"
+        assert _fmt_tenths(99.96) == "100.0"
+        # Values beyond the cache fall back to regular formatting
+        assert _fmt_tenths(2500.5) == "2500.5"
@@ -0,0 +1,64 @@
+"""Tests for SensorCollector class."""
+
+#      Copyright (c) 2025 predator. All rights reserved.
+
+import time
+from unittest.mock import MagicMock, patch
+
+
+def _wait_result(collector, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = collector.get_result()
+        if result is not None:
+            return result
+        time.sleep(0.01)
+    return None
+
+
+class TestSensorCollector:
+    """Test SensorCollector class."""
+
+    @patch('system_monitor.core.sensor_collector.get_per_core_frequencies')
+    @patch('system_monitor.core.sensor_collector.psutil')
+    def test_collect_async_publishes_reading(self, mock_psutil, mock_get_freqs):
+        """Test a queued read is published once and then consumed."""
+        from system_monitor.core.sensor_collector import SensorCollector
+
+        mock_psutil.cpu_freq.return_value = MagicMock(current=2400.0)
+        mock_get_freqs.return_value = [2300.0, 2500.0]
+        collector = SensorCollector()
+        try:
+            collector.collect_async(per_core=True)
+            result = _wait_result(collector)
+        finally:
+            collector.shutdown()
+
+        assert result is not None
+        assert result.cpu_freq == 2400.0
+        assert result.core_freqs == [2300.0, 2500.0]
+        assert collector.get_result() is None
+
+    @patch('system_monitor.core.sensor_collector.get_per_core_frequencies')
+    @patch('system_monitor.core.sensor_collector.psutil')
+    def test_collect_skips_per_core_when_not_requested(self, mock_psutil, mock_get_freqs):
+        """Test the dashboard read does not touch per-core clocks."""
+        from system_monitor.core.sensor_collector import SensorCollector
+
+        mock_psutil.cpu_freq.side_effect = Exception("Freq error")
+        readings = SensorCollector._collect(False)
+
+        mock_get_freqs.assert_not_called()
+        assert readings.cpu_freq == 0.0
+        assert readings.core_freqs == []
+
+    def test_collect_async_after_shutdown_is_noop(self):
+        """Test no read is queued once the collector is shut down."""
+        from system_monitor.core.sensor_collector import SensorCollector
+
+        collector = SensorCollector()
+        collector.shutdown()
+        collector.collect_async()
+
+        assert not collector.is_collecting()
+        assert collector.get_result() is None
@@ -2,26 +2,14 @@
 
 #      Copyright (c) 2025 predator. All rights reserved.
 
-import unittest
 from unittest.mock import MagicMock, patch
+import pytest
 
 
-class TestSystemMonitorIntegration(unittest.TestCase):
+@pytest.mark.usefixtures('qapp')
+class TestSystemMonitorIntegration:
     """Integration tests for SystemMonitor application."""
 
-    @classmethod
-    def setUpClass(cls):
-        """Set up QApplication for all tests in this class."""
-        from PySide6.QtWidgets import QApplication
-        import sys
-        cls.qapp = QApplication.instance() or QApplication(sys.argv)
-
-    @classmethod
-    def tearDownClass(cls):
-        """Clean up QApplication after all tests."""
-        # Don't quit the app as it might be needed by other tests
-        pass
-
     def _setup_mocks(self, mock_psutil, mock_gpu):
         """Setup common mocks for SystemMonitor tests."""
         # Mock psutil methods
@@ -53,9 +41,9 @@ class TestSystemMonitorIntegration(unittest.TestCase):
         
         monitor = SystemMonitor(interval_ms=100)
         
-        self.assertEqual(monitor.interval_ms, 100)
-        self.assertIsNotNone(monitor.gpu_provider)
-        self.assertFalse(monitor._paused)
+        assert monitor.interval_ms == 100
+        assert monitor.gpu_provider is not None
+        assert not monitor._paused
 
     @patch('system_monitor.app.apply_dark_theme')
     @patch('system_monitor.app.GPUProvider')
@@ -68,9 +56,9 @@ class TestSystemMonitorIntegration(unittest.TestCase):
         
         monitor = SystemMonitor(interval_ms=200)
         
-        self.assertIsNotNone(monitor.timer)
+        assert monitor.timer is not None
         # Timer should be started with correct interval
-        self.assertTrue(hasattr(monitor, 'timer'))
+        assert hasattr(monitor, 'timer')
 
     @patch('system_monitor.app.apply_dark_theme')
     @patch('system_monitor.app.GPUProvider')
@@ -85,10 +73,102 @@ class TestSystemMonitorIntegration(unittest.TestCase):
         monitor = SystemMonitor(interval_ms=100)
         monitor._paused = False
         
-        monitor.on_timer()
+        with patch.object(monitor, 'isVisible', return_value=True):
+            monitor.on_timer()
         
         mock_update.assert_called_once()
 
+    @patch('system_monitor.app.apply_dark_theme')
+    @patch('system_monitor.app.GPUProvider')
+    @patch('system_monitor.app.psutil')
+    @patch('system_monitor.app.MetricsUpdater.update_all_metrics')
+    def test_system_monitor_on_timer_dt_from_monotonic_ns(self, mock_update, mock_psutil, mock_gpu, mock_theme):
+        """Test on_timer passes a sub-millisecond-accurate dt and skips paused time."""
+        from system_monitor.app import SystemMonitor
+        
+        self._setup_mocks(mock_psutil, mock_gpu)
+        
+        monitor = SystemMonitor(interval_ms=100)
+        monitor._t_prev_ns = 1_000_000_000
+        with patch('system_monitor.app.time.monotonic_ns', side_effect=[1_012_500_000, 5_000_000_000, 5_010_000_000]), \
+                patch.object(monitor, 'isVisible', return_value=True):
+            monitor.on_timer()
+            monitor._paused = True
+            monitor.on_timer()
+            monitor._paused = False
+            monitor.on_timer()
+        
+        dts = [c.args[1] for c in mock_update.call_args_list]
+        assert len(dts) == 2
+        assert dts[0] == pytest.approx(0.0125)
+        assert dts[1] == pytest.approx(0.010)
+
+    @patch('system_monitor.app.apply_dark_theme')
+    @patch('system_monitor.app.GPUProvider')
+    @patch('system_monitor.app.psutil')
+    @patch('system_monitor.app.MetricsUpdater.update_all_metrics')
+    def test_system_monitor_on_timer_hidden(self, mock_update, mock_psutil, mock_gpu, mock_theme):
+        """Test on_timer skips updates when the window is not visible."""
+        from system_monitor.app import SystemMonitor
+        
+        self._setup_mocks(mock_psutil, mock_gpu)
+        
+        monitor = SystemMonitor(interval_ms=100)
+        
+        monitor.on_timer()
+        
+        mock_update.assert_not_called()
+
+    @patch('system_monitor.app.apply_dark_theme')
+    @patch('system_monitor.app.GPUProvider')
+    @patch('system_monitor.app.psutil')
+    def test_system_monitor_timer_stops_when_minimized(self, mock_psutil, mock_gpu, mock_theme):
+        """Test changeEvent stops the timer on minimize and restarts it on restore."""
+        from system_monitor.app import SystemMonitor
+        from PySide6.QtCore import QEvent, Qt
+        from PySide6.QtGui import QWindowStateChangeEvent
+        
+        self._setup_mocks(mock_psutil, mock_gpu)
+        
+        monitor = SystemMonitor(interval_ms=100)
+        event = QWindowStateChangeEvent(Qt.WindowNoState)
+        
+        with patch.object(monitor, 'isMinimized', return_value=True):
+            monitor.changeEvent(event)
+        assert not monitor.timer.isActive()
+        assert monitor.gpu_sampler._fields == 0
+        
+        with patch.object(monitor, 'isMinimized', return_value=False):
+            monitor.changeEvent(event)
+        assert monitor.timer.isActive()
+        assert monitor.timer.interval() == 100
+
+    @patch('system_monitor.app.apply_dark_theme')
+    @patch('system_monitor.app.GPUProvider')
+    @patch('system_monitor.app.psutil')
+    def test_proc_search_is_debounced(self, mock_psutil, mock_gpu, mock_theme):
+        """Test typing in the process filter refreshes once, after the debounce."""
+        from system_monitor.app import SystemMonitor
+        from system_monitor.ui import TabIndex
+        
+        self._setup_mocks(mock_psutil, mock_gpu)
+        
+        monitor = SystemMonitor(interval_ms=100)
+        with patch.object(monitor, 'refresh_processes') as mock_refresh, \
+                patch.object(monitor, 'isVisible', return_value=True):
+            # The filter box lives on the Processes tab
+            monitor.tabs.setCurrentIndex(TabIndex.PROCESSES)
+            mock_refresh.reset_mock()
+            monitor.proc_search.setText("py")
+            monitor.proc_search.setText("pyt")
+            
+            mock_refresh.assert_not_called()
+            assert monitor._proc_filter == "pyt"
+            assert monitor._search_debounce.isActive()
+            
+            monitor._search_debounce.timeout.emit()
+            mock_refresh.assert_called_once()
+
     @patch('system_monitor.app.apply_dark_theme')
     @patch('system_monitor.app.GPUProvider')
     @patch('system_monitor.app.psutil')
@@ -106,6 +186,156 @@ class TestSystemMonitorIntegration(unittest.TestCase):
         
         mock_update.assert_not_called()
 
+    @patch('system_monitor.app.apply_dark_theme')
+    @patch('system_monitor.app.GPUProvider')
+    @patch('system_monitor.app.psutil')
+    @patch('system_monitor.app.ProcessManager.refresh_processes')
+    def test_system_monitor_proc_timer(self, mock_refresh, mock_psutil, mock_gpu, mock_theme):
+        """Test the process timer refreshes processes on its own interval."""
+        from system_monitor.app import SystemMonitor
+        from system_monitor.ui import TabIndex
+        
+        self._setup_mocks(mock_psutil, mock_gpu)
+        
+        monitor = SystemMonitor(interval_ms=100)
+        assert monitor.proc_timer.interval() == monitor.spin_proc_refresh.value()
+        
+        monitor.spin_proc_refresh.setValue(750)
+        assert monitor.proc_timer.interval() == 750
+        
+        monitor.tabs.setCurrentIndex(TabIndex.PROCESSES)
+        mock_refresh.reset_mock()
+        with patch.object(monitor, 'isVisible', return_value=True):
+            monitor.on_proc_timer()
+        mock_refresh.assert_called_once_with(monitor)
+        
+        monitor._paused = True
+        with patch.object(monitor, 'isVisible', return_value=True):
+            monitor.on_proc_timer()
+        mock_refresh.assert_called_once()
+
+    @patch('system_monitor.app.apply_dark_theme')
+    @patch('system_monitor.app.GPUProvider')
+    @patch('system_monitor.app.psutil')
+    @patch('system_monitor.app.ProcessManager.refresh_processes')
+    def test_system_monitor_proc_timer_follows_tab(self, mock_refresh, mock_psutil, mock_gpu, mock_theme):
+        """Test process scans only run for the CPU/Processes tabs and re-prime on return."""
+        from system_monitor.app import SystemMonitor
+        from system_monitor.ui import TabIndex
+        
+        self._setup_mocks(mock_psutil, mock_gpu)
+        
+        monitor = SystemMonitor(interval_ms=100)
+        monitor._procs_primed = True
+        
+        monitor.tabs.setCurrentIndex(TabIndex.MEMORY)
+        with patch.object(monitor, 'isVisible', return_value=True):
+            monitor.on_proc_timer()
+        mock_refresh.assert_not_called()
+        assert not monitor._procs_primed
+        
+        # Returning primes immediately instead of waiting for the timer
+        monitor.tabs.setCurrentIndex(TabIndex.PROCESSES)
+        mock_refresh.assert_called_once_with(monitor)
+
+    @patch('system_monitor.app.apply_dark_theme')
+    @patch('system_monitor.app.GPUProvider')
+    @patch('system_monitor.app.psutil')
+    def test_system_monitor_sparklines_follow_tab(self, mock_psutil, mock_gpu, mock_theme):
+        """Test dashboard sparklines are suspended while another tab is current."""
+        from system_monitor.app import SystemMonitor
+        
+        self._setup_mocks(mock_psutil, mock_gpu)
+        
+        monitor = SystemMonitor(interval_ms=100)
+        
+        monitor.tabs.setCurrentIndex(1)
+        assert all(not card._update_spark for card in monitor.cards)
+        
+        monitor.tabs.setCurrentIndex(0)
+        assert all(card._update_spark for card in monitor.cards)
+
+    @patch('system_monitor.app.apply_dark_theme')
+    @patch('system_monitor.app.GPUProvider')
+    @patch('system_monitor.app.psutil')
+    @patch('system_monitor.ui.cpu_tab_builder.psutil')
+    def test_system_monitor_per_core_charts_built_lazily(self, mock_cpu_psutil, mock_psutil, mock_gpu, mock_theme):
+        """Test per-core charts are only built when the CPU tab is first shown."""
+        from system_monitor.app import SystemMonitor
+        from system_monitor.ui import TabIndex
+        
+        self._setup_mocks(mock_psutil, mock_gpu)
+        mock_cpu_psutil.cpu_count.return_value = 4
+        
+        monitor = SystemMonitor(interval_ms=100)
+        assert monitor.core_charts == ()
+        
+        monitor.tabs.setCurrentIndex(TabIndex.CPU)
+        assert len(monitor.core_charts) == 4
+        assert len(monitor.core_freq_labels) == 4
+        
+        charts = monitor.core_charts
+        assert isinstance(charts, tuple)
+        monitor.tabs.setCurrentIndex(TabIndex.DASHBOARD)
+        monitor.tabs.setCurrentIndex(TabIndex.CPU)
+        assert monitor.core_charts is charts
+
+    @patch('system_monitor.app.apply_dark_theme')
+    @patch('system_monitor.app.GPUProvider')
+    @patch('system_monitor.app.psutil')
+    @patch('system_monitor.app.InfoManager.refresh_info')
+    def test_system_info_built_on_first_view(self, mock_refresh_info, mock_psutil, mock_gpu, mock_theme):
+        """Test system info is gathered when its tab is first shown, not at startup."""
+        from system_monitor.app import SystemMonitor
+        from system_monitor.ui import TabIndex
+        
+        self._setup_mocks(mock_psutil, mock_gpu)
+        mock_refresh_info.side_effect = lambda m: setattr(m, '_info_dirty', False)
+        
+        monitor = SystemMonitor(interval_ms=100)
+        mock_refresh_info.assert_not_called()
+        
+        monitor.tabs.setCurrentIndex(TabIndex.INFO)
+        mock_refresh_info.assert_called_once_with(monitor)
+        
+        monitor.tabs.setCurrentIndex(TabIndex.DASHBOARD)
+        monitor.tabs.setCurrentIndex(TabIndex.INFO)
+        mock_refresh_info.assert_called_once()
+        
+        monitor.btn_info_refresh.click()
+        assert mock_refresh_info.call_count == 2
+
+    @patch('system_monitor.app.apply_dark_theme')
+    @patch('system_monitor.app.GpuSampler')
+    @patch('system_monitor.app.GPUProvider')
+    @patch('system_monitor.app.psutil')
+    def test_system_monitor_deferred_gpu_detection(self, mock_psutil, mock_gpu, mock_sampler, mock_theme):
+        """Test the GPU tab is built once background detection finishes."""
+        from system_monitor.app import SystemMonitor
+        from system_monitor.providers.gpu_provider import GpuSnapshot
+        from system_monitor.ui import TabIndex
+        
+        gpu = self._setup_mocks(mock_psutil, mock_gpu)
+        gpu.ready.is_set.return_value = False
+        
+        monitor = SystemMonitor(interval_ms=100)
+        
+        assert monitor.chart_gpu is None
+        assert monitor._gpu_pending
+        mock_sampler.return_value.start.assert_not_called()
+        
+        gpu.ready.is_set.return_value = True
+        gpu.gpu_names.return_value = ("GPU 0",)
+        gpu.sample_all.return_value = GpuSnapshot(vram=[(0.0, 8000.0)], temps=[0.0])
+        monitor.tabs.setCurrentIndex(TabIndex.MEMORY)
+        monitor._check_gpu_ready()
+        
+        assert not monitor._gpu_pending
+        assert monitor.chart_gpu is not None
+        assert monitor.tabs.tabText(TabIndex.GPU) == "GPU"
+        assert monitor.tabs.currentIndex() == TabIndex.MEMORY
+        mock_sampler.return_value.start.assert_called_once()
+
     @patch('system_monitor.app.apply_dark_theme')
     @patch('system_monitor.app.GPUProvider')
     @patch('system_monitor.app.psutil')
@@ -127,7 +357,7 @@ class TestSystemMonitorIntegration(unittest.TestCase):
         mock_shutdown.assert_called_once()
 
 
-class TestMainFunction(unittest.TestCase):
+class TestMainFunction:
     """Test main application entry point."""
 
     @patch('system_monitor.app.sys.exit')
@@ -153,4 +383,4 @@ class TestMainFunction(unittest.TestCase):
 
 
 if __name__ == '__main__':
-    unittest.main()
+    pytest.main([__file__])
@@ -3,8 +3,7 @@
 #      Copyright (c) 2025 predator. All rights reserved.
 
 import pytest
-from unittest.mock import MagicMock, patch, Mock
-import time
+from unittest.mock import MagicMock, patch
 
 
 class TestGPUProvider:
@@ -22,7 +21,24 @@ class TestGPUProvider:
             provider = GPUProvider()
         
         assert provider.method == "none"
-        assert provider.gpu_names() == []
+        assert provider.gpu_names() == ()
+
+    @patch('system_monitor.providers.gpu_provider.shutil.which')
+    def test_init_deferred_detection(self, mock_which):
+        """Test defer=True skips probing until detect() runs and sets ready."""
+        from system_monitor.providers.gpu_provider import GPUProvider
+        
+        mock_which.return_value = None
+        
+        with patch.dict('sys.modules', {'pynvml': None}):
+            provider = GPUProvider(defer=True)
+            assert not provider.ready.is_set()
+            mock_which.assert_not_called()
+            
+            provider.detect()
+        
+        assert provider.ready.is_set()
+        assert provider.method == "none"
 
     @patch('system_monitor.providers.gpu_provider.shutil.which')
     def test_init_nvml_success(self, mock_which):
@@ -46,6 +62,51 @@ class TestGPUProvider:
         assert "GPU 0" in provider.gpu_names()
         assert "GPU 1" in provider.gpu_names()
 
+    @patch('system_monitor.providers.gpu_provider.shutil.which')
+    def test_nvml_handles_enumerated_once(self, mock_which):
+        """Test NVML handles are looked up at detection and reused by every sample."""
+        from system_monitor.providers.gpu_provider import GPUProvider
+        
+        mock_nvml = MagicMock()
+        mock_nvml.nvmlDeviceGetCount.return_value = 2
+        mock_nvml.nvmlDeviceGetHandleByIndex.side_effect = ["handle0", "handle1"]
+        mock_nvml.nvmlDeviceGetName.side_effect = ["GPU 0", "GPU 1"]
+        mock_nvml.nvmlDeviceGetUtilizationRates.return_value = MagicMock(gpu=40)
+        
+        with patch.dict('sys.modules', {'pynvml': mock_nvml}):
+            with patch('builtins.__import__', return_value=mock_nvml):
+                provider = GPUProvider()
+        
+        provider.gpu_utils()
+        provider.gpu_vram_info()
+        provider.gpu_frequencies()
+        
+        assert mock_nvml.nvmlDeviceGetHandleByIndex.call_count == 2
+        mock_nvml.nvmlDeviceGetCount.assert_called_once()
+        assert provider._nvml_handles == ["handle0", "handle1"]
+        assert provider.gpu_utils() == [40.0, 40.0]
+
+    @patch('system_monitor.providers.gpu_provider.shutil.which')
+    def test_nvml_direct_falls_back_without_function_pointer(self, mock_which):
+        """Test the pynvml wrappers are used when _nvmlGetFunctionPointer is missing."""
+        from system_monitor.providers.gpu_provider import GPUProvider
+        
+        mock_nvml = MagicMock()
+        del mock_nvml._nvmlGetFunctionPointer
+        mock_nvml.nvmlDeviceGetCount.return_value = 1
+        mock_nvml.nvmlDeviceGetHandleByIndex.return_value = "handle0"
+        mock_nvml.nvmlDeviceGetName.return_value = "GPU 0"
+        mock_nvml.nvmlDeviceGetUtilizationRates.return_value = MagicMock(gpu=55)
+        
+        with patch.dict('sys.modules', {'pynvml': mock_nvml}):
+            with patch('builtins.__import__', return_value=mock_nvml):
+                provider = GPUProvider()
+        
+        assert provider.method == "nvml"
+        assert provider._nvml_direct is None
+        assert provider.gpu_utils() == [55.0]
+        mock_nvml.nvmlDeviceGetUtilizationRates.assert_called_with("handle0")
+
     @patch('system_monitor.providers.gpu_provider.subprocess.run')
     @patch('system_monitor.providers.gpu_provider.shutil.which')
     def test_init_nvidia_smi_fallback(self, mock_which, mock_subprocess):
@@ -101,103 +162,68 @@ class TestGPUProvider:
         assert "NVIDIA GeForce RTX 3090" in provider.gpu_names()
 
     @patch('system_monitor.providers.gpu_provider.subprocess.run')
-    def test_query_nvidia_smi_utils(self, mock_subprocess):
-        """Test _query_nvidia_smi_utils."""
+    def test_query_nvidia_smi_all(self, mock_subprocess):
+        """Test _query_nvidia_smi_all parses utils, VRAM and clocks from one call."""
         from system_monitor.providers.gpu_provider import GPUProvider
         
         provider = GPUProvider()
-        provider.method = "nvidia-smi"
-        
         mock_result = MagicMock()
-        mock_result.stdout = "45\n67\n"
+        mock_result.stdout = "45, 1024, 8192, 1500\n67, 2048, 10240, 1600\n"
         mock_subprocess.return_value = mock_result
         
-        utils = provider._query_nvidia_smi_utils()
+        utils, vram, freqs = provider._query_nvidia_smi_all()
         
         assert utils == [45.0, 67.0]
-
-    @patch('system_monitor.providers.gpu_provider.subprocess.run')
-    def test_query_nvidia_smi_utils_invalid(self, mock_subprocess):
-        """Test _query_nvidia_smi_utils handles invalid data."""
-        from system_monitor.providers.gpu_provider import GPUProvider
-        
-        provider = GPUProvider()
-        mock_result = MagicMock()
-        mock_result.stdout = "45\ninvalid\n"
-        mock_subprocess.return_value = mock_result
-        
-        utils = provider._query_nvidia_smi_utils()
-        
-        assert utils == [45.0, 0.0]
-
-    @patch('system_monitor.providers.gpu_provider.subprocess.run')
-    def test_query_nvidia_smi_vram(self, mock_subprocess):
-        """Test _query_nvidia_smi_vram."""
-        from system_monitor.providers.gpu_provider import GPUProvider
-        
-        provider = GPUProvider()
-        mock_result = MagicMock()
-        mock_result.stdout = "1024, 8192\n2048, 10240\n"
-        mock_subprocess.return_value = mock_result
-        
-        vram = provider._query_nvidia_smi_vram()
-        
         assert vram == [(1024.0, 8192.0), (2048.0, 10240.0)]
+        assert freqs == [1500.0, 1600.0]
+        mock_subprocess.assert_called_once()
+        assert "--query-gpu=utilization.gpu,memory.used,memory.total,clocks.current.graphics" in mock_subprocess.call_args[0][0]
 
     @patch('system_monitor.providers.gpu_provider.subprocess.run')
-    def test_query_nvidia_smi_vram_invalid(self, mock_subprocess):
-        """Test _query_nvidia_smi_vram handles invalid data."""
-        from system_monitor.providers.gpu_provider import GPUProvider
-        
-        provider = GPUProvider()
-        mock_result = MagicMock()
-        mock_result.stdout = "1024, 8192\ninvalid\n"
-        mock_subprocess.return_value = mock_result
-        
-        vram = provider._query_nvidia_smi_vram()
-        
-        assert vram == [(1024.0, 8192.0), (0.0, 0.0)]
-
-    @patch('system_monitor.providers.gpu_provider.subprocess.run')
-    def test_query_nvidia_smi_freq(self, mock_subprocess):
-        """Test _query_nvidia_smi_freq."""
+    def test_query_nvidia_smi_all_invalid(self, mock_subprocess):
+        """Test _query_nvidia_smi_all maps unparsable fields and short rows to 0."""
         from system_monitor.providers.gpu_provider import GPUProvider
         
         provider = GPUProvider()
         mock_result = MagicMock()
-        mock_result.stdout = "1500\n1600\n"
+        mock_result.stdout = "45, [N/A], 8192, 1500\ninvalid\n"
         mock_subprocess.return_value = mock_result
         
-        freqs = provider._query_nvidia_smi_freq()
+        utils, vram, freqs = provider._query_nvidia_smi_all()
         
-        assert freqs == [1500.0, 1600.0]
+        assert utils == [45.0, 0.0]
+        assert vram == [(0.0, 8192.0), (0.0, 0.0)]
+        assert freqs == [1500.0, 0.0]
 
     @patch('system_monitor.providers.gpu_provider.subprocess.run')
-    def test_query_nvidia_smi_freq_invalid(self, mock_subprocess):
-        """Test _query_nvidia_smi_freq handles invalid data."""
+    def test_query_nvidia_smi_all_updates_cache(self, mock_subprocess):
+        """Test _query_nvidia_smi_all refreshes the values the public getters return."""
         from system_monitor.providers.gpu_provider import GPUProvider
         
         provider = GPUProvider()
+        provider.method = "nvidia-smi"
         mock_result = MagicMock()
-        mock_result.stdout = "1500\ninvalid\n"
+        mock_result.stdout = "45, 1024, 8192, 1500\n"
         mock_subprocess.return_value = mock_result
         
-        freqs = provider._query_nvidia_smi_freq()
+        provider._query_nvidia_smi_all()
         
-        assert freqs == [1500.0, 0.0]
+        assert provider.gpu_utils() == [45.0]
+        assert provider.gpu_vram_info() == [(1024.0, 8192.0)]
+        assert provider.gpu_frequencies() == [1500.0]
 
-    def test_gpu_names_returns_copy(self):
-        """Test gpu_names returns a copy of the list."""
+    def test_gpu_names_returns_cached_tuple(self):
+        """Test gpu_names returns the same immutable tuple without copying."""
         from system_monitor.providers.gpu_provider import GPUProvider
         
         provider = GPUProvider()
-        provider._gpu_names = ["GPU 0", "GPU 1"]
+        provider._gpu_names = ("GPU 0", "GPU 1")
         
         names1 = provider.gpu_names()
         names2 = provider.gpu_names()
         
-        assert names1 == names2
-        assert names1 is not names2  # Different objects
+        assert names1 == ("GPU 0", "GPU 1")
+        assert names1 is names2
 
     @patch('system_monitor.providers.gpu_provider.shutil.which')
     def test_gpu_utils_nvml(self, mock_which):
@@ -424,19 +450,13 @@ class TestGPUProvider:
         mock_result_init = MagicMock()
         mock_result_init.stdout = "GPU 0\n"
         
-        # Mock subsequent calls for polling
-        mock_result_utils = MagicMock()
-        mock_result_utils.stdout = "75\n"
-        mock_result_vram = MagicMock()
-        mock_result_vram.stdout = "2048, 8192\n"
-        mock_result_freq = MagicMock()
-        mock_result_freq.stdout = "1500\n"
+        # Mock the single fused query made per poll
+        mock_result_poll = MagicMock()
+        mock_result_poll.stdout = "75, 2048, 8192, 1500\n"
         
         mock_subprocess.side_effect = [
             mock_result_init,  # Initial names query
-            mock_result_utils,  # Poll: utils
-            mock_result_vram,   # Poll: vram
-            mock_result_freq,   # Poll: freq
+            mock_result_poll,  # Poll: utils, vram and freq together
         ]
         
         # Make sleep raise after first iteration to exit loop
@@ -494,3 +514,306 @@ class TestGPUProvider:
                 except Exception as e:
                     if str(e) != "Stop":
                         raise
+
+    def _smi_provider(self, n=1):
+        from system_monitor.providers.gpu_provider import GPUProvider
+        
+        provider = GPUProvider()
+        provider.method = "nvidia-smi"
+        provider._last_smi_utils = [0.0] * n
+        provider._last_smi_vram = [(0.0, 0.0)] * n
+        provider._last_smi_freq = [0.0] * n
+        provider._last_smi_temp = [0.0] * n
+        return provider
+
+    def test_parse_smi_line(self):
+        """Test one loop-mode nvidia-smi line updates that GPU's cached values."""
+        provider = self._smi_provider(n=2)
+        
+        provider._parse_smi_line("1, 75, 2048, 8192, 1500, [N/A]\n")
+        
+        assert provider._last_smi_utils == [0.0, 75.0]
+        assert provider._last_smi_vram == [(0.0, 0.0), (2048.0, 8192.0)]
+        assert provider._last_smi_freq == [0.0, 1500.0]
+        assert provider._last_smi_temp == [0.0, 0.0]
+
+    def test_parse_smi_line_ignores_bad_lines(self):
+        """Test malformed or out-of-range lines are ignored."""
+        provider = self._smi_provider()
+        
+        provider._parse_smi_line("garbage\n")
+        provider._parse_smi_line("x, 1, 2, 3, 4, 5\n")
+        provider._parse_smi_line("3, 1, 2, 3, 4, 5\n")
+        
+        assert provider._last_smi_utils == [0.0]
+
+    @patch('system_monitor.providers.gpu_provider.subprocess.Popen')
+    def test_smi_stream_loop(self, mock_popen):
+        """Test _smi_stream_loop reads samples from one long-running process."""
+        provider = self._smi_provider()
+        mock_popen.return_value.stdout = iter(["0, 40, 1024, 8192, 1200, 55\n"])
+        
+        with patch.object(provider, '_smi_poll_loop') as mock_poll:
+            provider._smi_stream_loop()
+        
+        assert mock_popen.call_count == 1
+        assert any(arg.startswith("--loop-ms=") for arg in mock_popen.call_args[0][0])
+        assert provider._last_smi_utils == [40.0]
+        assert provider._last_smi_temp == [55.0]
+        # Process ended on its own, so polling takes over
+        mock_poll.assert_called_once()
+
+    @patch('system_monitor.providers.gpu_provider.subprocess.Popen')
+    def test_smi_stream_loop_popen_failure(self, mock_popen):
+        """Test _smi_stream_loop falls back to polling when nvidia-smi can't start."""
+        provider = self._smi_provider()
+        mock_popen.side_effect = OSError("not found")
+        
+        with patch.object(provider, '_smi_poll_loop') as mock_poll:
+            provider._smi_stream_loop()
+        
+        mock_poll.assert_called_once()
+        assert provider._smi_proc is None
+
+    def test_shutdown_terminates_smi_process(self):
+        """Test shutdown stops polling and terminates the nvidia-smi process."""
+        provider = self._smi_provider()
+        proc = MagicMock()
+        provider._smi_proc = proc
+        
+        provider.shutdown()
+        
+        assert provider._smi_stop is True
+        proc.terminate.assert_called_once()
+
+    def test_sample_all_nvidia_smi_streamed_temps(self):
+        """Test sample_all uses streamed temperatures without spawning nvidia-smi."""
+        provider = self._smi_provider()
+        provider._smi_proc = MagicMock()
+        provider._last_smi_utils = [45.0]
+        provider._last_smi_temp = [61.0]
+        
+        with patch('system_monitor.providers.gpu_provider.get_gpu_temperatures') as mock_temps:
+            snap = provider.sample_all()
+        
+        assert snap.temps == [61.0]
+        mock_temps.assert_not_called()
+
+    def _nvml_provider(self, mock_nvml):
+        from system_monitor.providers.gpu_provider import GPUProvider
+        
+        mock_handle = MagicMock()
+        mock_nvml.nvmlDeviceGetCount.return_value = 1
+        mock_nvml.nvmlDeviceGetHandleByIndex.return_value = mock_handle
+        mock_nvml.nvmlDeviceGetName.return_value = "GPU 0"
+        with patch.dict('sys.modules', {'pynvml': mock_nvml}):
+            with patch('builtins.__import__', return_value=mock_nvml):
+                provider = GPUProvider()
+                provider._nvml = mock_nvml
+                provider._nvml_handles = [mock_handle]
+        # Forget the init-time support probe; tests assert on sampling calls
+        mock_nvml.reset_mock()
+        return provider
+
+    @patch('system_monitor.providers.gpu_provider.shutil.which')
+    def test_sample_all_nvml(self, mock_which):
+        """Test sample_all reads every field per NVML handle."""
+        mock_nvml = MagicMock()
+        mock_nvml.nvmlDeviceGetUtilizationRates.return_value = MagicMock(gpu=42)
+        mock_nvml.nvmlDeviceGetClockInfo.return_value = 1500
+        mock_nvml.nvmlDeviceGetMemoryInfo.return_value = MagicMock(
+            used=2048 * 1024 * 1024, total=8192 * 1024 * 1024
+        )
+        mock_nvml.nvmlDeviceGetTemperature.return_value = 65
+        provider = self._nvml_provider(mock_nvml)
+        
+        snap = provider.sample_all()
+        
+        assert snap.utils == [42.0]
+        assert snap.freqs == [1500.0]
+        assert snap.vram == [(2048.0, 8192.0)]
+        assert snap.temps == [65.0]
+
+    @patch('system_monitor.providers.gpu_provider.shutil.which')
+    def test_sample_all_nvml_exception(self, mock_which):
+        """Test sample_all zero-fills a device whose queries fail."""
+        mock_nvml = MagicMock()
+        mock_nvml.nvmlDeviceGetUtilizationRates.side_effect = Exception("NVML error")
+        provider = self._nvml_provider(mock_nvml)
+        
+        snap = provider.sample_all()
+        
+        assert snap.utils == [0.0]
+        assert snap.vram == [(0.0, 0.0)]
+        mock_nvml.nvmlDeviceGetMemoryInfo.assert_not_called()
+
+    def test_nvml_supported_fields_drops_not_supported(self):
+        """Test the init-time probe masks off queries NVML does not support."""
+        from system_monitor.providers.gpu_provider import GPUProvider, F_ALL, F_UTIL
+        
+        class NotSupported(Exception):
+            value = 3
+        
+        mock_nvml = MagicMock()
+        mock_nvml.NVML_ERROR_NOT_SUPPORTED = 3
+        mock_nvml.nvmlDeviceGetUtilizationRates.side_effect = NotSupported()
+        mock_nvml.nvmlDeviceGetTemperature.side_effect = Exception("transient")
+        
+        fields = GPUProvider._nvml_supported_fields(mock_nvml, MagicMock())
+        
+        # Only NOT_SUPPORTED removes a field; other errors are retried later
+        assert fields == F_ALL & ~F_UTIL
+
+    @patch('system_monitor.providers.gpu_provider.shutil.which')
+    def test_sample_all_nvml_skips_unsupported(self, mock_which):
+        """Test an unsupported utilization query no longer zeroes VRAM."""
+        from system_monitor.providers.gpu_provider import F_ALL, F_UTIL
+        
+        mock_nvml = MagicMock()
+        mock_nvml.nvmlDeviceGetUtilizationRates.side_effect = Exception("not supported")
+        mock_nvml.nvmlDeviceGetMemoryInfo.return_value = MagicMock(
+            used=1024 * 1024 * 1024, total=4096 * 1024 * 1024
+        )
+        provider = self._nvml_provider(mock_nvml)
+        provider._nvml_fields = [F_ALL & ~F_UTIL]
+        
+        snap = provider.sample_all()
+        
+        mock_nvml.nvmlDeviceGetUtilizationRates.assert_not_called()
+        assert snap.vram == [(1024.0, 4096.0)]
+
+    @patch('system_monitor.providers.gpu_provider.shutil.which')
+    def test_sample_all_nvml_field_mask(self, mock_which):
+        """Test sample_all skips NVML queries for unselected fields."""
+        from system_monitor.providers.gpu_provider import F_UTIL, F_FREQ
+        
+        mock_nvml = MagicMock()
+        mock_nvml.nvmlDeviceGetUtilizationRates.return_value = MagicMock(gpu=42)
+        mock_nvml.nvmlDeviceGetClockInfo.return_value = 1500
+        provider = self._nvml_provider(mock_nvml)
+        
+        snap = provider.sample_all(F_UTIL | F_FREQ)
+        
+        assert snap.fields == F_UTIL | F_FREQ
+        assert snap.utils == [42.0]
+        assert snap.freqs == [1500.0]
+        assert snap.vram == [(0.0, 0.0)]
+        assert snap.temps == [0.0]
+        mock_nvml.nvmlDeviceGetMemoryInfo.assert_not_called()
+        mock_nvml.nvmlDeviceGetTemperature.assert_not_called()
+
+    def _direct_nvml(self, util_ret=0):
+        """Fake pynvml exposing ctypes callbacks in place of libnvidia-ml."""
+        import ctypes
+        from system_monitor.providers.gpu_provider import _NvmlUtilization, _NvmlMemory
+        
+        def util(h, p):
+            p.contents.gpu = 42
+            return util_ret
+        
+        def clock(h, kind, p):
+            p.contents.value = 1500
+            return 0
+        
+        def mem(h, p):
+            p.contents.used = 2048 * 1024 * 1024
+            p.contents.total = 8192 * 1024 * 1024
+            return 0
+        
+        def temp(h, sensor, p):
+            p.contents.value = 65
+            return 0
+        
+        fns = {
+            "nvmlDeviceGetUtilizationRates": ctypes.CFUNCTYPE(
+                ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(_NvmlUtilization))(util),
+            "nvmlDeviceGetClockInfo": ctypes.CFUNCTYPE(
+                ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_uint))(clock),
+            "nvmlDeviceGetMemoryInfo": ctypes.CFUNCTYPE(
+                ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(_NvmlMemory))(mem),
+            "nvmlDeviceGetTemperature": ctypes.CFUNCTYPE(
+                ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_uint))(temp),
+        }
+        nvml = MagicMock()
+        nvml._nvmlGetFunctionPointer.side_effect = fns.__getitem__
+        nvml.NVML_CLOCK_GRAPHICS = 0
+        nvml.NVML_TEMPERATURE_GPU = 0
+        return nvml
+
+    def test_nvml_direct_sample_all(self):
+        """Test the ctypes fast path fills every field from one call per query."""
+        from system_monitor.providers.gpu_provider import _NvmlDirect, F_ALL
+        
+        direct = _NvmlDirect(self._direct_nvml())
+        snap = direct.sample_all([None, None], [F_ALL, F_ALL], F_ALL)
+        
+        assert snap.utils == [42.0, 42.0]
+        assert snap.freqs == [1500.0, 1500.0]
+        assert snap.vram == [(2048.0, 8192.0), (2048.0, 8192.0)]
+        assert snap.temps == [65.0, 65.0]
+
+    def test_nvml_direct_error_zeroes_rest_of_device(self):
+        """Test an NVML error code leaves the device's remaining fields at zero."""
+        from system_monitor.providers.gpu_provider import _NvmlDirect, F_ALL, F_UTIL
+        
+        direct = _NvmlDirect(self._direct_nvml(util_ret=3))
+        snap = direct.sample_all([None], [F_ALL], F_ALL)
+        assert snap.utils == [0.0]
+        assert snap.vram == [(0.0, 0.0)]
+        
+        # With utilization masked out as unsupported, the other fields are read
+        snap = direct.sample_all([None], [F_ALL & ~F_UTIL], F_ALL)
+        assert snap.vram == [(2048.0, 8192.0)]
+
+    def test_nvml_direct_rejects_non_ctypes_pointers(self):
+        """Test the fast path refuses wrappers it cannot call directly."""
+        from system_monitor.providers.gpu_provider import _NvmlDirect
+        
+        with pytest.raises(TypeError):
+            _NvmlDirect(MagicMock())
+
+    @patch('system_monitor.providers.gpu_provider.get_gpu_temperatures')
+    def test_sample_all_nvidia_smi_skips_temps(self, mock_temps):
+        """Test sample_all avoids the nvidia-smi temperature query when unselected."""
+        from system_monitor.providers.gpu_provider import GPUProvider, F_UTIL
+        
+        provider = GPUProvider()
+        provider.method = "nvidia-smi"
+        provider._last_smi_utils = [45.0]
+        
+        snap = provider.sample_all(F_UTIL)
+        
+        assert snap.utils == [45.0]
+        assert snap.temps == [0.0]
+        mock_temps.assert_not_called()
+
+    @patch('system_monitor.providers.gpu_provider.get_gpu_temperatures')
+    def test_sample_all_nvidia_smi(self, mock_temps):
+        """Test sample_all uses cached nvidia-smi values."""
+        from system_monitor.providers.gpu_provider import GPUProvider
+        
+        provider = GPUProvider()
+        provider.method = "nvidia-smi"
+        provider._last_smi_utils = [45.0]
+        provider._last_smi_freq = [1500.0]
+        provider._last_smi_vram = [(1024.0, 8192.0)]
+        mock_temps.return_value = [60.0]
+        
+        snap = provider.sample_all()
+        
+        assert snap.utils == [45.0]
+        assert snap.freqs == [1500.0]
+        assert snap.vram == [(1024.0, 8192.0)]
+        assert snap.temps == [60.0]
+
+    def test_sample_all_no_method(self):
+        """Test sample_all returns an empty snapshot without a GPU."""
+        from system_monitor.providers.gpu_provider import GPUProvider
+        
+        provider = GPUProvider()
+        provider.method = "none"
+        
+        snap = provider.sample_all()
+        
+        assert snap.utils == []
+        assert snap.temps == []
@@ -2,9 +2,6 @@
 
 #      Copyright (c) 2025 predator. All rights reserved.
 
-from unittest.mock import MagicMock, patch
-import pytest
-
 
 class TestTheme:
     """Test theme utility functions."""
@@ -94,6 +91,8 @@ class TestTheme:
         assert "QToolBar" in stylesheet
         assert "QTabWidget" in stylesheet
         assert "QTableWidget" in stylesheet
+        assert "QLabel#Info" in stylesheet
+        assert "QLabel#CardFrequency" in stylesheet
 
     def test_apply_dark_theme_called_multiple_times(self, qapp):
         """Test apply_dark_theme can be called multiple times without errors."""